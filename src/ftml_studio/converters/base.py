@@ -2,6 +2,19 @@
 from abc import ABC, abstractmethod
 
 
+class LogPreview:
+    """Shorten a value for a log message, calling str() only if the record is emitted"""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit=100):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        return str(self.value)[:self.limit]
+
+
 class BaseConverter(ABC):
     """Abstract base class for all format converters"""
 
@@ -2,7 +2,7 @@
 import json
 import logging
 import ftml
-from .base import BaseConverter
+from .base import BaseConverter, LogPreview
 
 # Configure logging
 logger = logging.getLogger("json_converter")
@@ -21,9 +21,9 @@ class JSONConverter(BaseConverter):
             logger.debug("Starting JSON to FTML conversion")
             try:
                 data = json.loads(content)
-                logger.debug(f"Parsed JSON data: {str(data)[:100]}...")
+                logger.debug("Parsed JSON data: %s...", LogPreview(data))
                 result = self._json_to_ftml(data)
-                logger.debug(f"Conversion result: {result[:100]}...")
+                logger.debug("Conversion result: %s...", LogPreview(result))
                 return result
             except json.JSONDecodeError as e:
                 line_no = e.lineno
@@ -41,11 +41,11 @@ class JSONConverter(BaseConverter):
             try:
                 # Use the official FTML parser to parse the content
                 data = ftml.load(content, preserve_comments=False)
-                logger.debug(f"Parsed FTML data: {str(data)[:100]}...")
+                logger.debug("Parsed FTML data: %s...", LogPreview(data))
 
                 # Convert to JSON (ignoring any special FTML properties like _ast_node)
                 result = json.dumps(data, indent=2, ensure_ascii=False)
-                logger.debug(f"Conversion result: {result[:100]}...")
+                logger.debug("Conversion result: %s...", LogPreview(result))
                 return result
             except ftml.FTMLParseError as e:
                 error_msg = f"FTML parsing error: {str(e)}"
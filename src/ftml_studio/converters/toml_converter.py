@@ -8,7 +8,7 @@ from .xml_converter import XMLConverter
 import ftml
 import yaml
 
-from .base import BaseConverter
+from .base import BaseConverter, LogPreview
 
 # Configure logging
 logger = logging.getLogger("toml_converter")
@@ -27,9 +27,9 @@ class TOMLConverter(BaseConverter):
             logger.debug("Starting TOML to FTML conversion")
             try:
                 data = toml.loads(content)
-                logger.debug(f"Parsed TOML data: {str(data)[:100]}...")
+                logger.debug("Parsed TOML data: %s...", LogPreview(data))
                 result = self._toml_to_ftml(data)
-                logger.debug(f"Conversion result: {result[:100]}...")
+                logger.debug("Conversion result: %s...", LogPreview(result))
                 return result
             except toml.TomlDecodeError as e:
                 error_msg = f"TOML parsing error: {str(e)}"
@@ -45,11 +45,11 @@ class TOMLConverter(BaseConverter):
             try:
                 # Use the official FTML parser to parse the content
                 data = ftml.load(content, preserve_comments=False)
-                logger.debug(f"Parsed FTML data: {str(data)[:100]}...")
+                logger.debug("Parsed FTML data: %s...", LogPreview(data))
 
                 # Convert to TOML
                 result = toml.dumps(data)
-                logger.debug(f"Conversion result: {result[:100]}...")
+                logger.debug("Conversion result: %s...", LogPreview(result))
                 return result
             except ftml.FTMLParseError as e:
                 error_msg = f"FTML parsing error: {str(e)}"
@@ -186,11 +186,11 @@ class JSONToTOMLConverter(BaseConverter):
         try:
             # Parse JSON
             data = json.loads(content)
-            logger.debug(f"Parsed JSON data: {str(data)[:100]}...")
+            logger.debug("Parsed JSON data: %s...", LogPreview(data))
 
             # Convert to TOML
             result = toml.dumps(data)
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except json.JSONDecodeError as e:
             error_msg = f"JSON parsing error: {str(e)}"
@@ -214,11 +214,11 @@ class TOMLToJSONConverter(BaseConverter):
         try:
             # Parse TOML
             data = toml.loads(content)
-            logger.debug(f"Parsed TOML data: {str(data)[:100]}...")
+            logger.debug("Parsed TOML data: %s...", LogPreview(data))
 
             # Convert to JSON
             result = json.dumps(data, indent=2, ensure_ascii=False)
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except toml.TomlDecodeError as e:
             error_msg = f"TOML parsing error: {str(e)}"
@@ -242,11 +242,11 @@ class TOMLToYAMLConverter(BaseConverter):
         try:
             # Parse TOML
             data = toml.loads(content)
-            logger.debug(f"Parsed TOML data: {str(data)[:100]}...")
+            logger.debug("Parsed TOML data: %s...", LogPreview(data))
 
             # Convert to YAML
             result = yaml.dump(data, default_flow_style=False, sort_keys=False)
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except toml.TomlDecodeError as e:
             error_msg = f"TOML parsing error: {str(e)}"
@@ -270,7 +270,7 @@ class TOMLToXMLConverter(BaseConverter):
         try:
             # Parse TOML
             data = toml.loads(content)
-            logger.debug(f"Parsed TOML data: {str(data)[:100]}...")
+            logger.debug("Parsed TOML data: %s...", LogPreview(data))
 
             # Convert to XML using XMLConverter's helper method
             xml_converter = XMLConverter()
@@ -284,7 +284,7 @@ class TOMLToXMLConverter(BaseConverter):
             if result.startswith('<?xml'):
                 result = result[result.find('?>') + 2:].lstrip()
 
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except toml.TomlDecodeError as e:
             error_msg = f"TOML parsing error: {str(e)}"
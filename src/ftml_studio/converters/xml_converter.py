@@ -8,7 +8,7 @@ import ftml
 import toml
 import yaml
 
-from .base import BaseConverter
+from .base import BaseConverter, LogPreview
 
 # Configure logging
 logger = logging.getLogger("xml_converter")
@@ -31,11 +31,11 @@ class XMLConverter(BaseConverter):
 
                 # Convert to Python dictionary
                 data = self._xml_to_dict(root)
-                logger.debug(f"Parsed XML data: {str(data)[:100]}...")
+                logger.debug("Parsed XML data: %s...", LogPreview(data))
 
                 # Convert dictionary to FTML
                 result = self._dict_to_ftml(data)
-                logger.debug(f"Conversion result: {result[:100]}...")
+                logger.debug("Conversion result: %s...", LogPreview(result))
                 return result
             except ET.ParseError as e:
                 error_msg = f"XML parsing error: {str(e)}"
@@ -51,7 +51,7 @@ class XMLConverter(BaseConverter):
             try:
                 # Use the official FTML parser to parse the content
                 data = ftml.load(content, preserve_comments=False)
-                logger.debug(f"Parsed FTML data: {str(dict(data))[:100]}...")
+                logger.debug("Parsed FTML data: %s...", LogPreview(dict(data)))
 
                 # Convert to XML
                 xml_str = self._dict_to_xml("root", data)
@@ -64,7 +64,7 @@ class XMLConverter(BaseConverter):
                 if result.startswith('<?xml'):
                     result = result[result.find('?>') + 2:].lstrip()
 
-                logger.debug(f"Conversion result: {result[:100]}...")
+                logger.debug("Conversion result: %s...", LogPreview(result))
                 return result
             except ftml.FTMLParseError as e:
                 error_msg = f"FTML parsing error: {str(e)}"
@@ -287,7 +287,7 @@ class JSONToXMLConverter(BaseConverter):
         try:
             # Parse JSON
             data = json.loads(content)
-            logger.debug(f"Parsed JSON data: {str(data)[:100]}...")
+            logger.debug("Parsed JSON data: %s...", LogPreview(data))
 
             # Convert to XML
             converter = XMLConverter()
@@ -301,7 +301,7 @@ class JSONToXMLConverter(BaseConverter):
             if result.startswith('<?xml'):
                 result = result[result.find('?>') + 2:].lstrip()
 
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except json.JSONDecodeError as e:
             error_msg = f"JSON parsing error: {str(e)}"
@@ -329,11 +329,11 @@ class XMLToJSONConverter(BaseConverter):
             # Convert to Python dictionary
             converter = XMLConverter()
             data = converter._xml_to_dict(root)
-            logger.debug(f"Parsed XML data: {str(data)[:100]}...")
+            logger.debug("Parsed XML data: %s...", LogPreview(data))
 
             # Convert to JSON
             result = json.dumps(data, indent=2, ensure_ascii=False)
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except ET.ParseError as e:
             error_msg = f"XML parsing error: {str(e)}"
@@ -363,11 +363,11 @@ class XMLToYAMLConverter(BaseConverter):
 
             # Convert to Python dictionary using the method from XMLConverter
             data = xml_converter._xml_to_dict(root)
-            logger.debug(f"Parsed XML data: {str(data)[:100]}...")
+            logger.debug("Parsed XML data: %s...", LogPreview(data))
 
             # Convert to YAML
             result = yaml.dump(data, default_flow_style=False, sort_keys=False)
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except ET.ParseError as e:
             error_msg = f"XML parsing error: {str(e)}"
@@ -397,11 +397,11 @@ class XMLToTOMLConverter(BaseConverter):
 
             # Convert to Python dictionary using the method from XMLConverter
             data = xml_converter._xml_to_dict(root)
-            logger.debug(f"Parsed XML data: {str(data)[:100]}...")
+            logger.debug("Parsed XML data: %s...", LogPreview(data))
 
             # Convert to TOML
             result = toml.dumps(data)
-            logger.debug(f"Conversion result: {result[:100]}...")
+            logger.debug("Conversion result: %s...", LogPreview(result))
             return result
         except ET.ParseError as e:
             error_msg = f"XML parsing error: {str(e)}"
@@ -3,10 +3,12 @@
 Logging configuration for FTML Studio
 """
 
+import atexit
 import os
+import queue
 import sys
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # Logging levels dictionary for easy reference
@@ -21,6 +23,42 @@ LOG_LEVELS = {
 # Default level
 DEFAULT_LEVEL = "INFO"
 
+# Records from every logger are queued here and written by one background thread,
+# so logging from the UI thread never waits on the disk or the console
+_log_queue = queue.SimpleQueue()
+_log_listener = None
+
+
+class _LoggerQueueHandler(QueueHandler):
+    """Queue handler that sends its records to the file and console handlers of one logger"""
+
+    def __init__(self, target_handlers):
+        super().__init__(_log_queue)
+        self.target_handlers = target_handlers
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.target_handlers = self.target_handlers
+        return record
+
+
+class _TargetDispatcher:
+    """Listener handler that passes each queued record on to the handlers it was meant for"""
+
+    def handle(self, record):
+        for handler in record.target_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _start_log_listener():
+    """Start the background thread that writes queued log records (once)"""
+    global _log_listener
+    if _log_listener is None:
+        _log_listener = QueueListener(_log_queue, _TargetDispatcher())
+        _log_listener.start()
+        atexit.register(_log_listener.stop)  # Writes out whatever is still queued
+
 
 def get_logs_dir():
     """
@@ -87,12 +125,14 @@ def setup_logger(name=None, level=None):
             backupCount=3
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
 
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+
+        # Both are written from the listener thread, the logger itself only queues records
+        _start_log_listener()
+        logger.addHandler(_LoggerQueueHandler([file_handler, console_handler]))
 
         # Prevent propagation to root logger to avoid duplicate logs
         logger.propagate = False
@@ -1,11 +1,17 @@
 # src/ftml_studio/syntax/__init__.py
-from .base_highlighter import BaseHighlighter
-from .json_highlighter import JSONHighlighter
-from .yaml_highlighter import YAMLHighlighter
-from .toml_highlighter import TOMLHighlighter
-from .xml_highlighter import XMLHighlighter
-from .ast_highlighter import FTMLASTHighlighter
-from .schema_highlighter import SchemaHighlighter
+import importlib
+
+# Highlighters are imported on first access, so importing one of them
+# does not load the others (or the FTML parser the AST highlighter needs)
+_HIGHLIGHTER_MODULES = {
+    'BaseHighlighter': '.base_highlighter',
+    'JSONHighlighter': '.json_highlighter',
+    'YAMLHighlighter': '.yaml_highlighter',
+    'TOMLHighlighter': '.toml_highlighter',
+    'XMLHighlighter': '.xml_highlighter',
+    'FTMLASTHighlighter': '.ast_highlighter',
+    'SchemaHighlighter': '.schema_highlighter',
+}
 
 __all__ = [
     'BaseHighlighter',
@@ -16,3 +22,17 @@ __all__ = [
     'FTMLASTHighlighter',
     'SchemaHighlighter',
 ]
+
+
+def __getattr__(name):
+    module_name = _HIGHLIGHTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
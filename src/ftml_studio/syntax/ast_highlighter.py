@@ -1,16 +1,17 @@
 # src/ftml_studio/syntax/ast_highlighter.py
+import hashlib
 import logging
 import re
 import time
 
-from PySide6.QtCore import QRegularExpression, QTimer, Signal, QObject
+from PySide6.QtCore import QTimer, Signal, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QTextCharFormat, QColor
 
 import ftml
 from ftml.exceptions import FTMLParseError
 from ftml.parser.ast import KeyValueNode, ScalarNode, ObjectNode, ListNode
 
-from .base_highlighter import BaseHighlighter
+from .base_highlighter import BaseHighlighter, compile_pattern, parse_color
 
 # Configure logging
 logger = logging.getLogger("ftml_ast_highlighter")
@@ -21,9 +22,206 @@ class ErrorSignaler(QObject):
     errorsChanged = Signal(list)  # Signal emitted when errors change
 
 
+def _line_start(content, line):
+    """Return the offset where the 1-based line starts, or -1 if content has fewer lines"""
+    pos = 0
+    for _ in range(line - 1):
+        pos = content.find('\n', pos) + 1
+        if pos == 0:
+            return -1
+    return pos
+
+
+# Re-attaching a highlighter, theme changes and explicit parses often ask for
+# the text that was just parsed, so keep the last few results
+def parse_ftml_content(content):
+    """
+    Parse FTML content into an AST, collecting errors for highlighting
+
+    Runs on a thread pool worker, so it must not touch any Qt widgets or documents.
+    Returns a dict with the keys ast, parse_error, errors, valid_content and
+    using_partial_highlighting.
+    """
+    ast = None
+    parse_error = None
+    errors = []
+    valid_content = content  # Assume content is valid until proven otherwise
+    using_partial_highlighting = False
+
+    try:
+        # Try to parse using FTML
+        logger.debug("Attempting to parse FTML content")
+        data = ftml.load(content, preserve_comments=True)
+        logger.debug("FTML load successful")
+
+        # Extract the AST from the returned data
+        if hasattr(data, "_ast_node"):
+            ast = data._ast_node
+            parse_error = None
+            logger.debug("Successfully parsed FTML document with AST")
+        else:
+            # If AST is not available, use partial highlighting
+            ast = None
+            using_partial_highlighting = True
+            logger.debug("Parsed FTML but AST not available, using partial highlighting")
+
+    except FTMLParseError as e:
+        # Handle parse error - still try to partially highlight
+        logger.debug("FTMLParseError caught: %s", e)
+        ast = None
+        parse_error = e
+        using_partial_highlighting = True
+        logger.debug("Set using_partial_highlighting=True due to parse error")
+
+        # Extract line and column from error message if available
+        error_msg = str(e)
+        # Try to extract line and column from the message
+        line_match = re.search(r'at line (\d+)', error_msg)
+        col_match = re.search(r'col (\d+)', error_msg)
+
+        if line_match and col_match:
+            line = int(line_match.group(1))
+            col = int(col_match.group(1))
+            logger.debug("Extracted from error message: line=%s, col=%s", line, col)
+
+            error_info = {
+                "line": line,
+                "col": col,
+                "message": error_msg,
+                "length": 1  # Default to 1 character
+            }
+
+            # Try to find the specific error token
+            token_match = re.search(r'Got\s+\w+\s+([^\s]+)', error_msg)
+            if token_match:
+                error_token = token_match.group(1)
+                error_info["token"] = error_token
+                error_info["length"] = len(error_token)
+                logger.debug("Extracted error token: '%s', length=%s", error_token, len(error_token))
+
+            # Add the error to our list
+            errors.append(error_info)
+            logger.debug("Added error at line %s, col %s", line, col)
+
+            # If we have an error location, try to highlight content up to that point
+            logger.debug("Attempting to create partial valid content up to error")
+            # Slice by offsets rather than splitting the whole document into lines
+            line_start = _line_start(content, line)
+            if line_start < 0:
+                # Error is past the last line, so every line is valid
+                valid_content = content[:-1] if content.endswith('\n') else content
+            else:
+                line_end = content.find('\n', line_start)
+                line_length = (len(content) if line_end < 0 else line_end) - line_start
+                if col <= line_length:
+                    # Lines before the error plus the error line up to the error
+                    valid_content = content[:line_start + col - 1]
+                else:
+                    # Lines before the error only
+                    valid_content = content[:max(0, line_start - 1)]
+
+            # Try to parse the valid portion, if possible
+            try:
+                if valid_content:
+                    logger.debug("Attempting to parse valid portion")
+                    partial_data = ftml.load(valid_content, preserve_comments=True)
+                    if hasattr(partial_data, "_ast_node"):
+                        ast = partial_data._ast_node
+                        logger.debug("Successfully parsed partial FTML document")
+            except Exception as parse_e:
+                logger.debug("Failed to parse partial content: %s", parse_e)
+                ast = None
+        else:
+            # If we couldn't extract line/col from the message, create a generic error
+            logger.debug("Couldn't extract line/col from error message, creating generic error")
+            errors.append({
+                "line": 1,
+                "col": 1,
+                "message": error_msg,
+                "length": 1
+            })
+
+    except Exception as e:
+        # Handle other errors - fall back to regex highlighting
+        logger.error(f"Unexpected error parsing FTML: {str(e)}", exc_info=True)
+        ast = None
+        parse_error = e
+        using_partial_highlighting = True
+        logger.debug("Set using_partial_highlighting=True due to unexpected error")
+
+        # Add a generic error
+        errors.append({
+            "line": 1,
+            "col": 1,
+            "message": f"Unexpected error: {str(e)}",
+            "length": 1
+        })
+        logger.debug("Added generic error at line 1, col 1")
+
+    return {
+        "ast": ast,
+        "parse_error": parse_error,
+        "errors": errors,
+        "valid_content": valid_content,
+        "using_partial_highlighting": using_partial_highlighting,
+    }
+
+
+# Helper class to emit signals (since QRunnable is not a QObject)
+class ParseSignals(QObject):
+    finished = Signal(int, object)  # Parse request id, result of parse_ftml_content
+
+
+class FTMLParseTask(QRunnable):
+    """Parse FTML content on a QThreadPool worker thread"""
+
+    def __init__(self, request_id, content):
+        super().__init__()
+        self.request_id = request_id
+        self.content = content
+        self.signals = ParseSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.request_id, parse_ftml_content(self.content))
+
+
 class FTMLASTHighlighter(BaseHighlighter):
     """AST-based syntax highlighter for FTML documents with theme support and error resilience"""
 
+    # Patterns used while highlighting blocks, compiled once for all highlighters
+
+    # Double-quoted strings (with escape sequences)
+    _DQUOTE_STRING_RE = compile_pattern(r'"(?:\\.|[^"\\])*"')
+    # Single-quoted strings ('' escapes a quote)
+    _SQUOTE_STRING_RE = compile_pattern(r"'(''|[^'])*'")
+    # Either kind of string literal, matched in one pass
+    _STRING_LITERAL_RE = compile_pattern(r'"(?:\\.|[^"\\])*"|\'(?:\'\'|[^\'])*\'')
+    # Outer /// doc comments, inner //! doc comments and regular // comments in one pass
+    _ANY_COMMENT_RE = compile_pattern(
+        r'(?<outer_doc>///.*$)|(?<inner_doc>//!.*$)|(?<comment>//(?![!/]).*$)')
+    # Format for each named group of _ANY_COMMENT_RE
+    _COMMENT_GROUP_FORMATS = {
+        "outer_doc": "outer_doc_comment",
+        "inner_doc": "inner_doc_comment",
+        "comment": "comment",
+    }
+    # Double-quoted key at the start of a line, followed by =
+    _DQUOTED_KEY_RE = compile_pattern(r'^[ \t]*("(?:\\.|[^"\\])*")[ \t]*(?==)')
+    # Single-quoted key at the start of a line, followed by =
+    _SQUOTED_KEY_RE = compile_pattern(r"^[ \t]*('(''|[^'])*')[ \t]*(?==)")
+    # Unquoted key at the start of a line, followed by =
+    _KEY_RE = compile_pattern(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*(?==)")
+    # Equals sign after a key
+    _EQUALS_RE = compile_pattern(r"=")
+    # Integer numbers
+    _INTEGER_RE = compile_pattern(r'\b-?\d+\b')
+    # Floating point numbers
+    _FLOAT_RE = compile_pattern(r'\b-?\d+\.\d+\b')
+    # Boolean values
+    _BOOLEAN_RE = compile_pattern(r'\b(true|false)\b')
+    # Null value
+    _NULL_RE = compile_pattern(r'\bnull\b')
+
     def __init__(self, document, theme_manager=None, error_highlighting=True, parse_delay=500,
                  highlight_error_delay=2000):
         logger.debug("Initializing FTMLASTHighlighter")
@@ -40,8 +238,8 @@ class FTMLASTHighlighter(BaseHighlighter):
         self.highlight_error_delay = highlight_error_delay  # Delay before showing errors
         self.last_activity_ts = time.time()  # Track when the user was last active
         logger.debug(
-            f"Configuration: error_highlighting={error_highlighting}, parse_delay={parse_delay}"
-            f"ms, highlight_error_delay={highlight_error_delay}ms")
+            "Configuration: error_highlighting=%s, parse_delay=%sms, highlight_error_delay=%sms",
+            error_highlighting, parse_delay, highlight_error_delay)
 
         # Initialize formats specific to AST highlighting
         self.initialize_ast_formats()
@@ -63,6 +261,7 @@ class FTMLASTHighlighter(BaseHighlighter):
         self.ast = None
         self.parse_error = None
         self.errors = []
+        self._errors_by_line = {}  # The same errors grouped by 1-based line number
 
         # The document content that was successfully parsed
         self.valid_content = ""
@@ -70,10 +269,20 @@ class FTMLASTHighlighter(BaseHighlighter):
         # A flag to indicate if we're using partial highlighting
         self.using_partial_highlighting = False
 
+        # Parses running on the thread pool; only the latest request id is applied
+        self._parse_request_id = 0
+        self._parse_tasks = set()
+        self._reparse_pending = False  # Content changed while a parse was running
+
+        # (request id, content digest) of the parse last started on the pool, and the
+        # (digest, result) of the last parse applied, reused while the content is unchanged
+        self._running_digest = None
+        self._last_parse = None
+
         # Start initial parsing timer
         logger.debug("Connecting contentsChange signal")
         self.document().contentsChange.connect(self.handle_content_change)
-        logger.debug(f"Starting initial parse timer with delay {self.parse_delay}ms")
+        logger.debug("Starting initial parse timer with delay %sms", self.parse_delay)
         self.parse_timer.start(self.parse_delay)  # Parse after delay
         logger.debug("FTMLASTHighlighter initialization complete")
 
@@ -99,11 +308,11 @@ class FTMLASTHighlighter(BaseHighlighter):
         error_format = QTextCharFormat()
         if self.theme_manager:
             # Get error color from theme manager
-            error_color = QColor(self.theme_manager.get_syntax_color("error"))
-            logger.debug(f"Using theme error color: {error_color.name()}")
+            error_color = parse_color(self.theme_manager.get_syntax_color("error"))
+            logger.debug("Using theme error color: %s", error_color.name())
         else:
             # Fallback to bright red if no theme manager
-            error_color = QColor("#ff0000")  # Default red
+            error_color = parse_color("#ff0000")  # Default red
             logger.debug("No theme manager, using default red color for errors")
 
         # Set up distinctive error formatting
@@ -119,9 +328,21 @@ class FTMLASTHighlighter(BaseHighlighter):
         self.formats["error"] = error_format
         logger.debug("Error format initialized with wave underline")
 
+    def update_theme(self, theme_manager=None):
+        """Re-create formats for the current theme, keeping the cached AST and errors"""
+        if theme_manager is not None:
+            self.theme_manager = theme_manager
+
+        logger.debug("Updating highlighter formats for theme change")
+        self.initialize_formats()
+        self.initialize_ast_formats()
+
+        # Only the formats changed, so reuse the last parse instead of re-parsing
+        self.rehighlight()
+
     def handle_content_change(self, position, removed, added):
         """Handle document content changes"""
-        logger.debug(f"Content changed: position={position}, removed={removed}, added={added}")
+        logger.debug("Content changed: position=%s, removed=%s, added=%s", position, removed, added)
 
         # Update the last activity timestamp
         self.last_activity_ts = time.time()
@@ -129,158 +350,119 @@ class FTMLASTHighlighter(BaseHighlighter):
         # Cancel any pending error display
         self.error_display_timer.stop()
 
+        # A parse still running describes content that no longer exists; drop its result
+        self._parse_request_id += 1
+
+        # Parsing runs on a worker thread, so a zero delay can skip the timer
+        # round trip and queue the parse straight away
+        if self.parse_delay == 0:
+            self.parse_document()
+            return
+
         # Reset the timer to parse after delay of inactivity
-        logger.debug(f"Restarting parse timer with delay {self.parse_delay}ms")
+        logger.debug("Restarting parse timer with delay %sms", self.parse_delay)
         self.parse_timer.start(self.parse_delay)
 
+    def set_error_highlighting(self, enabled):
+        """Turn inline error highlighting on or off, re-highlighting only on a change"""
+        if self.error_highlighting == enabled:
+            return
+
+        self.error_highlighting = enabled
+        self.rehighlight()
+
     def set_parse_delay(self, delay_ms):
-        """Set the delay before parsing after content changes"""
+        """Set the delay before parsing after content changes (0 parses on every change)"""
         old_delay = self.parse_delay
-        self.parse_delay = max(100, delay_ms)  # Ensure minimum 100ms delay
-        logger.debug(f"Parse delay changed from {old_delay}ms to {self.parse_delay}ms")
+        # Ensure minimum 100ms delay unless parsing immediately
+        self.parse_delay = 0 if delay_ms <= 0 else max(100, delay_ms)
+        logger.debug("Parse delay changed from %sms to %sms", old_delay, self.parse_delay)
 
     def parse_document(self):
-        """Parse the entire document to build AST"""
+        """Start parsing the entire document to build AST, off the GUI thread"""
         logger.debug("=== STARTING DOCUMENT PARSE ===")
 
         # Add a check to verify document exists
         doc = self.document()
         if doc is None:
-            logger.error("Document is None, cannot parse")
+            logger.debug("Highlighter is detached from its document, skipping parse")
             return
 
         content = doc.toPlainText()
-        logger.debug(f"Document length: {len(content)} characters")
+        logger.debug("Document length: %s characters", len(content))
 
-        # Reset errors and flags
-        old_errors = self.errors.copy()
-        old_error_count = len(old_errors)
-        self.errors = []
-        self.using_partial_highlighting = False
-        self.valid_content = content  # Assume content is valid until proven otherwise
-        logger.debug(f"Reset state: old_errors={old_error_count}, using_partial_highlighting=False")
+        # Newer requests supersede any parse still running
+        self._parse_request_id += 1
 
         if not content.strip():
             logger.debug("Empty document, skipping parse")
-            self.ast = None
-            self.parse_error = None
-            self.rehighlight()
-
-            # Emit errors changed signal if errors were cleared
-            if old_errors and not self.errors:
-                logger.debug("Cleared errors, emitting errorsChanged signal")
-                self._signaler.errorsChanged.emit(self.errors)
+            self.apply_parse_result(self._parse_request_id, {
+                "ast": None,
+                "parse_error": None,
+                "errors": [],
+                "valid_content": content,
+                "using_partial_highlighting": False,
+            })
             return
 
-        try:
-            # Try to parse using FTML
-            logger.debug("Attempting to parse FTML content")
-            data = ftml.load(content, preserve_comments=True)
-            logger.debug("FTML load successful")
-
-            # Extract the AST from the returned data
-            if hasattr(data, "_ast_node"):
-                self.ast = data._ast_node
-                self.parse_error = None
-                logger.debug("Successfully parsed FTML document with AST")
-            else:
-                # If AST is not available, use partial highlighting
-                self.ast = None
-                self.using_partial_highlighting = True
-                logger.debug("Parsed FTML but AST not available, using partial highlighting")
-
-        except FTMLParseError as e:
-            # Handle parse error - still try to partially highlight
-            logger.debug(f"FTMLParseError caught: {str(e)}")
-            self.ast = None
-            self.parse_error = e
-            self.using_partial_highlighting = True
-            logger.debug("Set using_partial_highlighting=True due to parse error")
-
-            # Extract line and column from error message if available
-            error_msg = str(e)
-            # Try to extract line and column from the message
-            line_match = re.search(r'at line (\d+)', error_msg)
-            col_match = re.search(r'col (\d+)', error_msg)
-
-            if line_match and col_match:
-                line = int(line_match.group(1))
-                col = int(col_match.group(1))
-                logger.debug(f"Extracted from error message: line={line}, col={col}")
-
-                error_info = {
-                    "line": line,
-                    "col": col,
-                    "message": error_msg,
-                    "length": 1  # Default to 1 character
-                }
-
-                # Try to find the specific error token
-                token_match = re.search(r'Got\s+\w+\s+([^\s]+)', error_msg)
-                if token_match:
-                    error_token = token_match.group(1)
-                    error_info["token"] = error_token
-                    error_info["length"] = len(error_token)
-                    logger.debug(f"Extracted error token: '{error_token}', length={len(error_token)}")
-
-                # Add the error to our list
-                self.errors.append(error_info)
-                logger.debug(f"Added error at line {line}, col {col}")
-
-                # If we have an error location, try to highlight content up to that point
-                logger.debug("Attempting to create partial valid content up to error")
-                content_lines = content.splitlines()
-                valid_lines = content_lines[:line - 1]  # Lines before error
-
-                if line <= len(content_lines):
-                    # Add the portion of the error line up to the error
-                    error_line = content_lines[line - 1]
-                    if col <= len(error_line):
-                        valid_lines.append(error_line[:col - 1])
-
-                self.valid_content = '\n'.join(valid_lines)
-
-                # Try to parse the valid portion, if possible
-                try:
-                    if self.valid_content:
-                        logger.debug("Attempting to parse valid portion")
-                        partial_data = ftml.load(self.valid_content, preserve_comments=True)
-                        if hasattr(partial_data, "_ast_node"):
-                            self.ast = partial_data._ast_node
-                            logger.debug("Successfully parsed partial FTML document")
-                except Exception as parse_e:
-                    logger.debug(f"Failed to parse partial content: {str(parse_e)}")
-                    self.ast = None
-            else:
-                # If we couldn't extract line/col from the message, create a generic error
-                logger.debug("Couldn't extract line/col from error message, creating generic error")
-                self.errors.append({
-                    "line": 1,
-                    "col": 1,
-                    "message": error_msg,
-                    "length": 1
-                })
-
-        except Exception as e:
-            # Handle other errors - fall back to regex highlighting
-            logger.error(f"Unexpected error parsing FTML: {str(e)}", exc_info=True)
-            self.ast = None
-            self.parse_error = e
-            self.using_partial_highlighting = True
-            logger.debug("Set using_partial_highlighting=True due to unexpected error")
-
-            # Add a generic error
-            self.errors.append({
-                "line": 1,
-                "col": 1,
-                "message": f"Unexpected error: {str(e)}",
-                "length": 1
-            })
-            logger.debug("Added generic error at line 1, col 1")
+        # Parsing the same content again gives the same result
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        if self._last_parse is not None and self._last_parse[0] == digest:
+            logger.debug("Content unchanged since the last parse, reusing its result")
+            self.apply_parse_result(self._parse_request_id, self._last_parse[1])
+            return
+
+        # Keep at most one parse on the shared pool; typing with a zero delay would
+        # otherwise queue a full parse per keystroke. Parse again once it reports back.
+        if self._parse_tasks:
+            logger.debug("Parse already running, re-parsing when it finishes")
+            self._reparse_pending = True
+            return
+
+        self._running_digest = (self._parse_request_id, digest)
+        task = FTMLParseTask(self._parse_request_id, content)
+        task.signals.finished.connect(self.apply_parse_result)
+        task.setAutoDelete(False)  # Owned by _parse_tasks until it reports back
+        self._parse_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def apply_parse_result(self, request_id, result):
+        """Apply a finished parse on the GUI thread and rehighlight"""
+        self._parse_tasks = {task for task in self._parse_tasks if task.request_id != request_id}
+        if request_id != self._parse_request_id:
+            logger.debug("Discarding stale parse result %s", request_id)
+            # Content changed while this parse ran; parse the latest content now
+            if self._reparse_pending and not self._parse_tasks:
+                self._reparse_pending = False
+                self.parse_document()
+            return
+
+        # Keep only this result for reuse, so older documents and their ASTs can be freed
+        if self._running_digest is not None and self._running_digest[0] == request_id:
+            self._last_parse = (self._running_digest[1], result)
+            self._running_digest = None
+
+        old_errors = self.errors
+        self.ast = result["ast"]
+        self.parse_error = result["parse_error"]
+        self.errors = result["errors"]
+        self._errors_by_line = {}
+        for error in self.errors:
+            # Validate positions once here so highlight_errors can index them directly
+            line = error.get("line")
+            col = error.get("col")
+            if not (isinstance(line, int) and line >= 1 and isinstance(col, int)):
+                logger.debug("Not highlighting error without a valid position: %s", error)
+                continue
+            self._errors_by_line.setdefault(line, []).append(error)
+        self.valid_content = result["valid_content"]
+        self.using_partial_highlighting = result["using_partial_highlighting"]
 
         # Emit signal if errors changed
         if old_errors != self.errors:
-            logger.debug(f"Errors changed from {old_error_count} to {len(self.errors)}, emitting signal")
+            logger.debug("Errors changed from %s to %s, emitting signal", len(old_errors), len(self.errors))
+            for err in self.errors:
+                logger.debug("Error to highlight: %s", err)
             self._signaler.errorsChanged.emit(self.errors)
         else:
             logger.debug("No change in errors, not emitting signal")
@@ -295,50 +477,39 @@ class FTMLASTHighlighter(BaseHighlighter):
             elapsed_ms = (time.time() - self.last_activity_ts) * 1000
             remaining_delay = max(0, self.highlight_error_delay - elapsed_ms)
             if remaining_delay > 0:
-                logger.debug(f"Scheduling error display in {remaining_delay:.0f}ms")
+                logger.debug("Scheduling error display in %.0fms", remaining_delay)
                 self.error_display_timer.start(int(remaining_delay))
 
-        # Emit signal if errors were added or removed
-        if old_errors != self.errors:
-            logger.debug(f"Errors changed from {len(old_errors)} to {len(self.errors)}, emitting signal")
-            for err in self.errors:
-                logger.debug(f"Error to highlight: {err}")
-            self._signaler.errorsChanged.emit(self.errors)
-        else:
-            logger.debug("No change in errors, not emitting signal")
-
-        # Reapply highlighting after any change (success or failure)
-        logger.debug("Calling rehighlight")
-
     def highlightBlock(self, text):
         """Apply highlighting to the given block of text"""
         block_number = self.currentBlock().blockNumber() + 1  # 1-based line numbers
-        logger.debug(f"Highlighting block {block_number}: '{text[:20]}{'...' if len(text) > 20 else ''}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Highlighting block %s: '%s%s'", block_number, text[:20], '...' if len(text) > 20 else '')
 
         # Set default block state
         self.setCurrentBlockState(0)
 
         # Always highlight comments first - these should always be highlighted
         # even if AST highlighting fails
-        logger.debug(f"Highlighting comments for block {block_number}")
+        logger.debug("Highlighting comments for block %s", block_number)
         self.highlight_comments(text)
 
         # Apply AST-based highlighting if available
         if self.ast:
             try:
-                logger.debug(f"Using AST-based highlighting for block {block_number}")
+                logger.debug("Using AST-based highlighting for block %s", block_number)
                 self.apply_ast_highlighting(text)
             except Exception as e:
                 logger.error(f"Error in AST highlighting for block {block_number}: {str(e)}", exc_info=True)
                 # If AST highlighting fails, we'll still have comment highlighting
         elif self.using_partial_highlighting:
-            logger.debug(f"Using fallback highlighting for block {block_number}")
+            logger.debug("Using fallback highlighting for block %s", block_number)
             # Fall back to regex-based highlighting for core elements
             self.apply_fallback_highlighting(text)
 
         # Always highlight errors if error highlighting is enabled
         if self.error_highlighting:
-            logger.debug(f"Checking for errors on block {block_number}, total errors: {len(self.errors)}")
+            logger.debug("Checking for errors on block %s, total errors: %s", block_number, len(self.errors))
             self.highlight_errors(text)
         else:
             logger.debug("Error highlighting is disabled")
@@ -347,19 +518,10 @@ class FTMLASTHighlighter(BaseHighlighter):
         """Highlight all types of comments while avoiding those inside string literals"""
         block_number = self.currentBlock().blockNumber() + 1
 
-        # First identify all string literals to avoid processing comments within them
+        # First identify all string literals (both quote styles in one pass)
+        # to avoid processing comments within them
         string_regions = []
-
-        # Find double-quoted strings
-        dquote_regex = QRegularExpression(r'"(?:\\.|[^"\\])*"')
-        match_iterator = dquote_regex.globalMatch(text)
-        while match_iterator.hasNext():
-            match = match_iterator.next()
-            string_regions.append((match.capturedStart(), match.capturedEnd()))
-
-        # Find single-quoted strings
-        squote_regex = QRegularExpression(r"'(''|[^'])*'")
-        match_iterator = squote_regex.globalMatch(text)
+        match_iterator = self._STRING_LITERAL_RE.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
             string_regions.append((match.capturedStart(), match.capturedEnd()))
@@ -371,54 +533,33 @@ class FTMLASTHighlighter(BaseHighlighter):
                     return True
             return False
 
-        # Regular comments //
-        comment_regex = QRegularExpression(r'//(?![!/]).*$')
-        match_iterator = comment_regex.globalMatch(text)
-        comment_count = 0
+        # All three comment styles in a single scan; the named group that
+        # matched picks the format
+        counts = dict.fromkeys(self._COMMENT_GROUP_FORMATS, 0)
+        match_iterator = self._ANY_COMMENT_RE.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
             comment_pos = match.capturedStart()
 
             # Only highlight if the comment is not inside a string
-            if not is_in_string(comment_pos):
-                self.setFormat(comment_pos, match.capturedLength(), self.formats["comment"])
-                comment_count += 1
-
-        # Inner doc comments //!
-        inner_doc_regex = QRegularExpression(r'//!.*$')
-        match_iterator = inner_doc_regex.globalMatch(text)
-        inner_doc_count = 0
-        while match_iterator.hasNext():
-            match = match_iterator.next()
-            comment_pos = match.capturedStart()
-
-            # Only highlight if the comment is not inside a string
-            if not is_in_string(comment_pos):
-                self.setFormat(comment_pos, match.capturedLength(), self.formats["inner_doc_comment"])
-                inner_doc_count += 1
-
-        # Outer doc comments ///
-        outer_doc_regex = QRegularExpression(r'///.*$')
-        match_iterator = outer_doc_regex.globalMatch(text)
-        outer_doc_count = 0
-        while match_iterator.hasNext():
-            match = match_iterator.next()
-            comment_pos = match.capturedStart()
+            if is_in_string(comment_pos):
+                continue
 
-            # Only highlight if the comment is not inside a string
-            if not is_in_string(comment_pos):
-                self.setFormat(comment_pos, match.capturedLength(), self.formats["outer_doc_comment"])
-                outer_doc_count += 1
+            for group, format_name in self._COMMENT_GROUP_FORMATS.items():
+                if match.capturedStart(group) >= 0:
+                    self.setFormat(comment_pos, match.capturedLength(), self.formats[format_name])
+                    counts[group] += 1
+                    break
 
-        if comment_count + inner_doc_count + outer_doc_count > 0:
+        if any(counts.values()):
             logger.debug(
-                f"Block {block_number}: Found {comment_count} regular comments, {inner_doc_count} inner doc comments, "
-                f"{outer_doc_count} outer doc comments")
+                "Block %d: Found %d regular comments, %d inner doc comments, %d outer doc comments",
+                block_number, counts['comment'], counts['inner_doc'], counts['outer_doc'])
 
     def apply_ast_highlighting(self, text):
         """Apply highlighting based on AST nodes"""
         block_number = self.currentBlock().blockNumber() + 1  # 1-based line numbers
-        logger.debug(f"Applying AST highlighting to block {block_number}")
+        logger.debug("Applying AST highlighting to block %s", block_number)
 
         # Process all elements on this line
         self.process_elements_on_line(self.ast, text, block_number)
@@ -426,7 +567,7 @@ class FTMLASTHighlighter(BaseHighlighter):
     def apply_fallback_highlighting(self, text):
         """Apply basic highlighting when AST is not available"""
         block_number = self.currentBlock().blockNumber() + 1
-        logger.debug(f"Applying fallback highlighting to block {block_number}")
+        logger.debug("Applying fallback highlighting to block %s", block_number)
 
         # This is a simplified fallback that uses regex patterns for basic highlighting
         formats_applied = 0
@@ -435,55 +576,23 @@ class FTMLASTHighlighter(BaseHighlighter):
         # Keys and equals signs (both regular and quoted)
         # ================================================================
 
-        # 1. First handle quoted keys - these need to be processed before string values
-        # Match double-quoted keys at the start of a line, followed by =
-        dquoted_key_regex = QRegularExpression(r'^[ \t]*("(?:\\.|[^"\\])*")[ \t]*(?==)')
-        match_iterator = dquoted_key_regex.globalMatch(text)
+        # Quoted keys first (double, then single), then regular unquoted keys.
+        # The key patterns are anchored to the start of the block, so each one
+        # can match at most once: a single match() avoids globalMatch retrying
+        # the pattern at every later offset of the line.
         key_count = 0
-        while match_iterator.hasNext():
-            match = match_iterator.next()
-            # Highlight the entire quoted key (including quotes) as a key
-            self.setFormat(match.capturedStart(1), match.capturedLength(1), self.formats["key"])
-            key_count += 1
-            formats_applied += 1
-
-            # Find the equals sign after the key
-            equals_regex = QRegularExpression(r"=")
-            equals_match = equals_regex.match(text, match.capturedEnd(1))
-            if equals_match.hasMatch():
-                self.setFormat(equals_match.capturedStart(), equals_match.capturedLength(), self.formats["equals"])
-                formats_applied += 1
-
-        # Match single-quoted keys at the start of a line, followed by =
-        squoted_key_regex = QRegularExpression(r"^[ \t]*('(''|[^'])*')[ \t]*(?==)")
-        match_iterator = squoted_key_regex.globalMatch(text)
-        while match_iterator.hasNext():
-            match = match_iterator.next()
-            # Highlight the entire quoted key (including quotes) as a key
-            self.setFormat(match.capturedStart(1), match.capturedLength(1), self.formats["key"])
-            key_count += 1
-            formats_applied += 1
-
-            # Find the equals sign after the key
-            equals_regex = QRegularExpression(r"=")
-            equals_match = equals_regex.match(text, match.capturedEnd(1))
-            if equals_match.hasMatch():
-                self.setFormat(equals_match.capturedStart(), equals_match.capturedLength(), self.formats["equals"])
-                formats_applied += 1
+        for key_regex in (self._DQUOTED_KEY_RE, self._SQUOTED_KEY_RE, self._KEY_RE):
+            match = key_regex.match(text)
+            if not match.hasMatch():
+                continue
 
-        # 2. Then handle regular unquoted keys
-        key_regex = QRegularExpression(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*(?==)")
-        match_iterator = key_regex.globalMatch(text)
-        while match_iterator.hasNext():
-            match = match_iterator.next()
-            # Highlight the key
+            # Highlight the key (including quotes for quoted keys)
             self.setFormat(match.capturedStart(1), match.capturedLength(1), self.formats["key"])
             key_count += 1
             formats_applied += 1
 
             # Find the equals sign after the key
-            equals_regex = QRegularExpression(r"=")
-            equals_match = equals_regex.match(text, match.capturedEnd(1))
+            equals_match = self._EQUALS_RE.match(text, match.capturedEnd(1))
             if equals_match.hasMatch():
                 self.setFormat(equals_match.capturedStart(), equals_match.capturedLength(), self.formats["equals"])
                 formats_applied += 1
@@ -501,7 +610,7 @@ class FTMLASTHighlighter(BaseHighlighter):
             return False
 
         # Double-quoted strings (with escape sequences)
-        string_regex = QRegularExpression(r'"(?:\\.|[^"\\])*"')
+        string_regex = self._DQUOTE_STRING_RE
         match_iterator = string_regex.globalMatch(text)
         string_count = 0
         while match_iterator.hasNext():
@@ -513,7 +622,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                 formats_applied += 1
 
         # Single-quoted strings (with proper escaping)
-        single_quote_regex = QRegularExpression(r"'(''|[^'])*'")
+        single_quote_regex = self._SQUOTE_STRING_RE
         match_iterator = single_quote_regex.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -527,7 +636,7 @@ class FTMLASTHighlighter(BaseHighlighter):
         # Numbers - AFTER strings so they don't override string formatting
         # ================================================================
         # Integer numbers
-        number_regex = QRegularExpression(r'\b-?\d+\b')
+        number_regex = self._INTEGER_RE
         match_iterator = number_regex.globalMatch(text)
         number_count = 0
         while match_iterator.hasNext():
@@ -539,7 +648,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                 formats_applied += 1
 
         # Floating point numbers
-        float_regex = QRegularExpression(r'\b-?\d+\.\d+\b')
+        float_regex = self._FLOAT_RE
         match_iterator = float_regex.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -553,7 +662,7 @@ class FTMLASTHighlighter(BaseHighlighter):
         # Booleans and null
         # ================================================================
         # Boolean values
-        boolean_regex = QRegularExpression(r'\b(true|false)\b')
+        boolean_regex = self._BOOLEAN_RE
         match_iterator = boolean_regex.globalMatch(text)
         bool_count = 0
         while match_iterator.hasNext():
@@ -564,7 +673,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                 formats_applied += 1
 
         # Null value
-        null_regex = QRegularExpression(r'\bnull\b')
+        null_regex = self._NULL_RE
         match_iterator = null_regex.globalMatch(text)
         null_count = 0
         while match_iterator.hasNext():
@@ -589,24 +698,25 @@ class FTMLASTHighlighter(BaseHighlighter):
 
         if formats_applied > 0:
             logger.debug(
-                f"Block {block_number}: Applied fallback formatting - {key_count} keys, {string_count} strings, "
-                f"{number_count} numbers, {bool_count} booleans, {null_count} nulls, {symbol_count} symbols")
+                "Block %d: Applied fallback formatting - %d keys, %d strings, "
+                "%d numbers, %d booleans, %d nulls, %d symbols",
+                block_number, key_count, string_count, number_count, bool_count, null_count, symbol_count)
 
     def process_elements_on_line(self, node, text, block_number):
         """
         Process all elements in the AST that might be on the current line.
         This includes top-level items and nested items.
         """
-        logger.debug(f"Processing AST elements on line {block_number}")
+        logger.debug("Processing AST elements on line %s", block_number)
         elements_found = 0
 
         # Process root level items
         if hasattr(node, "items") and isinstance(node.items, dict):
-            logger.debug(f"Node has {len(node.items)} items")
+            logger.debug("Node has %s items", len(node.items))
             for key, kv_node in node.items.items():
                 # Process the key-value pair itself if it's on this line
                 if hasattr(kv_node, 'line') and kv_node.line == block_number:
-                    logger.debug(f"Found key-value node for key '{key}' on line {block_number}")
+                    logger.debug("Found key-value node for key '%s' on line %s", key, block_number)
                     self.process_key_value_node(kv_node, text)
                     elements_found += 1
 
@@ -624,7 +734,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                 if hasattr(kv_node, "leading_comments"):
                     for comment in kv_node.leading_comments:
                         if hasattr(comment, 'line') and comment.line == block_number:
-                            logger.debug(f"Found leading comment on line {block_number}")
+                            logger.debug("Found leading comment on line %s", block_number)
                             self.highlight_comment_node(comment, text)
                             elements_found += 1
 
@@ -632,11 +742,11 @@ class FTMLASTHighlighter(BaseHighlighter):
                         kv_node.inline_comment and
                         hasattr(kv_node.inline_comment, 'line') and
                         kv_node.inline_comment.line == block_number):
-                    logger.debug(f"Found inline comment on line {block_number}")
+                    logger.debug("Found inline comment on line %s", block_number)
                     self.highlight_comment_node(kv_node.inline_comment, text)
                     elements_found += 1
 
-        logger.debug(f"Found {elements_found} AST elements on line {block_number}")
+        logger.debug("Found %s AST elements on line %s", elements_found, block_number)
         return elements_found > 0
 
     def process_key_value_node(self, node, text):
@@ -647,7 +757,7 @@ class FTMLASTHighlighter(BaseHighlighter):
 
         # Get the key and look for it in different forms
         key = node.key
-        logger.debug(f"Processing key: '{key}'")
+        logger.debug("Processing key: '%s'", key)
 
         # Look for potential quoted forms of the key in the text
         dquoted_key = f'"{key}"'
@@ -661,13 +771,13 @@ class FTMLASTHighlighter(BaseHighlighter):
             # Found double-quoted key
             key_pos = text.find(dquoted_key)
             key_length = len(dquoted_key)
-            logger.debug(f"Found double-quoted key at position {key_pos}")
+            logger.debug("Found double-quoted key at position %s", key_pos)
             self.setFormat(key_pos, key_length, self.formats["key"])
         elif squoted_key in text:
             # Found single-quoted key
             key_pos = text.find(squoted_key)
             key_length = len(squoted_key)
-            logger.debug(f"Found single-quoted key at position {key_pos}")
+            logger.debug("Found single-quoted key at position %s", key_pos)
             self.setFormat(key_pos, key_length, self.formats["key"])
         else:
             # Look for unquoted key
@@ -680,13 +790,13 @@ class FTMLASTHighlighter(BaseHighlighter):
                 at_boundary = (key_pos == 0 or text[key_pos - 1].isspace())
 
                 if at_boundary:
-                    logger.debug(f"Found unquoted key at position {key_pos}")
+                    logger.debug("Found unquoted key at position %s", key_pos)
                     self.setFormat(key_pos, key_length, self.formats["key"])
                 else:
-                    logger.debug(f"Found key but not at word boundary, position {key_pos}")
+                    logger.debug("Found key but not at word boundary, position %s", key_pos)
                     key_pos = -1  # Reset as we didn't find a valid key position
             else:
-                logger.debug(f"Key '{key}' not found in text")
+                logger.debug("Key '%s' not found in text", key)
                 key_pos = -1
 
         # Highlight equals sign if we found a valid key position
@@ -694,12 +804,12 @@ class FTMLASTHighlighter(BaseHighlighter):
             # Look for equals sign after the key
             equals_pos = text.find("=", key_pos + key_length)
             if equals_pos >= 0:
-                logger.debug(f"Highlighting equals sign at position {equals_pos}")
+                logger.debug("Highlighting equals sign at position %s", equals_pos)
                 self.setFormat(equals_pos, 1, self.formats["equals"])
 
                 # Highlight value if it's a scalar
                 if node.value and isinstance(node.value, ScalarNode):
-                    logger.debug(f"Processing scalar value of type {type(node.value.value).__name__}")
+                    logger.debug("Processing scalar value of type %s", type(node.value.value).__name__)
                     # Pass the full text and the position after equals sign
                     self.highlight_value_node(node.value, text, starting_pos=equals_pos + 1)
             else:
@@ -717,7 +827,7 @@ class FTMLASTHighlighter(BaseHighlighter):
             # Opening brace is on this line
             lbrace_pos = text.find("{")
             if lbrace_pos >= 0:
-                logger.debug(f"Highlighting opening brace at position {lbrace_pos}")
+                logger.debug("Highlighting opening brace at position %s", lbrace_pos)
                 self.setFormat(lbrace_pos, 1, self.formats["symbol"])
                 elements_found += 1
             else:
@@ -728,7 +838,7 @@ class FTMLASTHighlighter(BaseHighlighter):
         # if a closing brace belongs to this specific object
         rbrace_pos = text.rfind("}")
         if rbrace_pos >= 0:
-            logger.debug(f"Highlighting closing brace at position {rbrace_pos}")
+            logger.debug("Highlighting closing brace at position %s", rbrace_pos)
             self.setFormat(rbrace_pos, 1, self.formats["symbol"])
             elements_found += 1
         else:
@@ -736,11 +846,11 @@ class FTMLASTHighlighter(BaseHighlighter):
 
         # Process items in the object
         if hasattr(node, 'items'):
-            logger.debug(f"Object has {len(node.items)} items")
+            logger.debug("Object has %s items", len(node.items))
             for key, item_node in node.items.items():
                 # Check if this key-value pair is on this line
                 if hasattr(item_node, 'line') and item_node.line == block_number:
-                    logger.debug(f"Found item with key '{key}' on line {block_number}")
+                    logger.debug("Found item with key '%s' on line %s", key, block_number)
 
                     # Look for potential quoted forms of the key in the text
                     dquoted_key = f'"{key}"'
@@ -754,36 +864,36 @@ class FTMLASTHighlighter(BaseHighlighter):
                         # Found double-quoted key
                         key_pos = text.find(dquoted_key)
                         key_length = len(dquoted_key)
-                        logger.debug(f"Found double-quoted key at position {key_pos}")
+                        logger.debug("Found double-quoted key at position %s", key_pos)
                         self.setFormat(key_pos, key_length, self.formats["key"])
                     elif squoted_key in text:
                         # Found single-quoted key
                         key_pos = text.find(squoted_key)
                         key_length = len(squoted_key)
-                        logger.debug(f"Found single-quoted key at position {key_pos}")
+                        logger.debug("Found single-quoted key at position %s", key_pos)
                         self.setFormat(key_pos, key_length, self.formats["key"])
                     else:
                         # Look for unquoted key
                         key_pos = text.find(key)
                         key_length = len(key)
                         if key_pos >= 0:
-                            logger.debug(f"Highlighting key '{key}' at position {key_pos}")
+                            logger.debug("Highlighting key '%s' at position %s", key, key_pos)
                             self.setFormat(key_pos, key_length, self.formats["key"])
                         else:
-                            logger.debug(f"Key '{key}' not found in text")
+                            logger.debug("Key '%s' not found in text", key)
                             key_pos = -1
 
                     # Highlight equals sign
                     if key_pos >= 0:
                         equals_pos = text.find("=", key_pos + key_length)
                         if equals_pos >= 0:
-                            logger.debug(f"Highlighting equals sign at position {equals_pos}")
+                            logger.debug("Highlighting equals sign at position %s", equals_pos)
                             self.setFormat(equals_pos, 1, self.formats["equals"])
                             elements_found += 1
 
                             # Highlight the value after the equals sign
                             if item_node.value:
-                                logger.debug(f"Processing value of type {type(item_node.value).__name__}")
+                                logger.debug("Processing value of type %s", type(item_node.value).__name__)
 
                                 # For scalar values, highlight appropriately
                                 if isinstance(item_node.value, ScalarNode):
@@ -806,13 +916,13 @@ class FTMLASTHighlighter(BaseHighlighter):
                 if hasattr(item_node, "leading_comments"):
                     for comment in item_node.leading_comments:
                         if hasattr(comment, 'line') and comment.line == block_number:
-                            logger.debug(f"Found leading comment on line {block_number}")
+                            logger.debug("Found leading comment on line %s", block_number)
                             self.highlight_comment_node(comment, text)
                             elements_found += 1
 
                 if hasattr(item_node, "inline_comment") and item_node.inline_comment and hasattr(
                         item_node.inline_comment, 'line') and item_node.inline_comment.line == block_number:
-                    logger.debug(f"Found inline comment on line {block_number}")
+                    logger.debug("Found inline comment on line %s", block_number)
                     self.highlight_comment_node(item_node.inline_comment, text)
                     elements_found += 1
 
@@ -830,7 +940,7 @@ class FTMLASTHighlighter(BaseHighlighter):
             # Opening bracket is on this line
             lbracket_pos = text.find("[")
             if lbracket_pos >= 0:
-                logger.debug(f"Highlighting opening bracket at position {lbracket_pos}")
+                logger.debug("Highlighting opening bracket at position %s", lbracket_pos)
                 self.setFormat(lbracket_pos, 1, self.formats["symbol"])
                 elements_found += 1
             else:
@@ -839,7 +949,7 @@ class FTMLASTHighlighter(BaseHighlighter):
         # Check for closing bracket on this line
         rbracket_pos = text.rfind("]")
         if rbracket_pos >= 0:
-            logger.debug(f"Highlighting closing bracket at position {rbracket_pos}")
+            logger.debug("Highlighting closing bracket at position %s", rbracket_pos)
             self.setFormat(rbracket_pos, 1, self.formats["symbol"])
             elements_found += 1
         else:
@@ -849,22 +959,22 @@ class FTMLASTHighlighter(BaseHighlighter):
         comma_count = 0
         for i, char in enumerate(text):
             if char == ',':
-                logger.debug(f"Highlighting comma at position {i}")
+                logger.debug("Highlighting comma at position %s", i)
                 self.setFormat(i, 1, self.formats["symbol"])
                 comma_count += 1
                 elements_found += 1
 
         if comma_count > 0:
-            logger.debug(f"Highlighted {comma_count} commas")
+            logger.debug("Highlighted %s commas", comma_count)
 
         # Process elements in the list
         if hasattr(node, 'elements'):
-            logger.debug(f"List has {len(node.elements)} elements")
+            logger.debug("List has %s elements", len(node.elements))
 
             # Find all strings in the text for later matching
             string_matches = []
-            double_quote_pattern = QRegularExpression(r'"(?:\\.|[^"\\])*"')
-            single_quote_pattern = QRegularExpression(r"'(''|[^'])*'")
+            double_quote_pattern = self._DQUOTE_STRING_RE
+            single_quote_pattern = self._SQUOTE_STRING_RE
 
             match_iterator = double_quote_pattern.globalMatch(text)
             while match_iterator.hasNext():
@@ -886,7 +996,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                     if isinstance(elem, ScalarNode) and isinstance(elem.value, str):
                         # Find this string element in our collected matches
                         elem_str = elem.value
-                        logger.debug(f"Looking for string list element: '{elem_str}'")
+                        logger.debug("Looking for string list element: '%s'", elem_str)
 
                         # Try to find this element value in our collected string matches
                         for start, end, captured in string_matches:
@@ -896,7 +1006,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                                 # Double-quoted string
                                 unquoted = captured[1:-1].replace('\\"', '"')
                                 if unquoted == elem_str:
-                                    logger.debug(f"Found string list element at {start}-{end}: {captured}")
+                                    logger.debug("Found string list element at %s-%s: %s", start, end, captured)
                                     self.setFormat(start, end - start, self.formats["string"])
                                     elements_found += 1
                                     break
@@ -904,7 +1014,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                                 # Single-quoted string
                                 unquoted = captured[1:-1].replace("''", "'")
                                 if unquoted == elem_str:
-                                    logger.debug(f"Found string list element at {start}-{end}: {captured}")
+                                    logger.debug("Found string list element at %s-%s: %s", start, end, captured)
                                     self.setFormat(start, end - start, self.formats["string"])
                                     elements_found += 1
                                     break
@@ -927,14 +1037,14 @@ class FTMLASTHighlighter(BaseHighlighter):
     def highlight_value_node(self, node, text, starting_pos=0):
         """Highlight a scalar value node with position awareness"""
         if not isinstance(node, ScalarNode):
-            logger.debug(f"Not a ScalarNode, got {type(node).__name__}")
+            logger.debug("Not a ScalarNode, got %s", type(node).__name__)
             return
 
         # CRITICAL: Order matters here - check specific types before general types
         # 1. String values
         if isinstance(node.value, str):
             value_str = node.value
-            logger.debug(f"Processing string value: '{value_str[:20]}{'...' if len(value_str) > 20 else ''}'")
+            logger.debug("Processing string value: '%s%s'", value_str[:20], '...' if len(value_str) > 20 else '')
 
             # Find quoted form of the string in the text after starting_pos
             dquoted_value = f'"{value_str}"'
@@ -943,21 +1053,21 @@ class FTMLASTHighlighter(BaseHighlighter):
             # First try double quotes
             pos = text.find(dquoted_value, starting_pos)
             if pos >= 0:
-                logger.debug(f"Found double-quoted string at position {pos}")
+                logger.debug("Found double-quoted string at position %s", pos)
                 self.setFormat(pos, len(dquoted_value), self.formats["string"])
                 return
 
             # Then try single quotes
             pos = text.find(squoted_value, starting_pos)
             if pos >= 0:
-                logger.debug(f"Found single-quoted string at position {pos}")
+                logger.debug("Found single-quoted string at position %s", pos)
                 self.setFormat(pos, len(squoted_value), self.formats["string"])
                 return
 
             # If we didn't find an exact match, try regular expressions
             logger.debug("No exact string match, trying regex patterns")
-            double_quote_pattern = QRegularExpression(r'"(?:\\.|[^"\\])*"')
-            single_quote_pattern = QRegularExpression(r"'(''|[^'])*'")
+            double_quote_pattern = self._DQUOTE_STRING_RE
+            single_quote_pattern = self._SQUOTE_STRING_RE
 
             # Only search after starting position
             match_iterator = double_quote_pattern.globalMatch(text, starting_pos)
@@ -968,7 +1078,7 @@ class FTMLASTHighlighter(BaseHighlighter):
                 if content.startswith('"') and content.endswith('"'):
                     content = content[1:-1].replace('\\"', '"')
                     if content == value_str:
-                        logger.debug(f"Found matching double-quoted string via regex at {match.capturedStart()}")
+                        logger.debug("Found matching double-quoted string via regex at %s", match.capturedStart())
                         self.setFormat(match.capturedStart(), match.capturedLength(), self.formats["string"])
                         return
 
@@ -979,23 +1089,23 @@ class FTMLASTHighlighter(BaseHighlighter):
                 if content.startswith("'") and content.endswith("'"):
                     content = content[1:-1].replace("''", "'")
                     if content == value_str:
-                        logger.debug(f"Found matching single-quoted string via regex at {match.capturedStart()}")
+                        logger.debug("Found matching single-quoted string via regex at %s", match.capturedStart())
                         self.setFormat(match.capturedStart(), match.capturedLength(), self.formats["string"])
                         return
 
-            logger.debug(f"Could not find matching string value in text: '{value_str}'")
+            logger.debug("Could not find matching string value in text: '%s'", value_str)
 
         # 2. Boolean values
         elif isinstance(node.value, bool):
             # Find boolean value in the text
             value_str = str(node.value).lower()  # FTML uses lowercase true/false
-            logger.debug(f"Processing boolean value: {value_str}")
+            logger.debug("Processing boolean value: %s", value_str)
             pos = text.find(value_str, starting_pos)
             if pos >= 0:
-                logger.debug(f"Highlighting boolean at position {pos}")
+                logger.debug("Highlighting boolean at position %s", pos)
                 self.setFormat(pos, len(value_str), self.formats["boolean"])
             else:
-                logger.debug(f"Boolean '{value_str}' not found in text")
+                logger.debug("Boolean '%s' not found in text", value_str)
 
         # 3. Null values
         elif node.value is None:
@@ -1003,7 +1113,7 @@ class FTMLASTHighlighter(BaseHighlighter):
             logger.debug("Processing null value")
             pos = text.find("null", starting_pos)
             if pos >= 0:
-                logger.debug(f"Highlighting null at position {pos}")
+                logger.debug("Highlighting null at position %s", pos)
                 self.setFormat(pos, 4, self.formats["null"])
             else:
                 logger.debug("'null' not found in text")
@@ -1012,13 +1122,13 @@ class FTMLASTHighlighter(BaseHighlighter):
         elif isinstance(node.value, (int, float)):
             # Find the number in the text
             value_str = str(node.value)
-            logger.debug(f"Processing number value: {value_str}")
+            logger.debug("Processing number value: %s", value_str)
             pos = text.find(value_str, starting_pos)
             if pos >= 0:
-                logger.debug(f"Highlighting number at position {pos}")
+                logger.debug("Highlighting number at position %s", pos)
                 self.setFormat(pos, len(value_str), self.formats["number"])
             else:
-                logger.debug(f"Number '{value_str}' not found in text")
+                logger.debug("Number '%s' not found in text", value_str)
 
     def highlight_comment_node(self, comment, text):
         """Highlight a comment node"""
@@ -1036,22 +1146,22 @@ class FTMLASTHighlighter(BaseHighlighter):
         format_key = "comment"  # Changed from "doc_comment" to "comment" as default
 
         if comment_text.startswith("//!"):
-            logger.debug(f"Identified //! comment: {comment_text}")
+            logger.debug("Identified //! comment: %s", comment_text)
             format_key = "inner_doc_comment"
         elif comment_text.startswith("///"):
-            logger.debug(f"Identified /// comment: {comment_text}")
+            logger.debug("Identified /// comment: %s", comment_text)
             format_key = "outer_doc_comment"
         else:
-            logger.debug(f"Identified regular comment: {comment_text}")
+            logger.debug("Identified regular comment: %s", comment_text)
 
-        logger.debug(
-            f"Using format key: {format_key} for comment: '{comment_text[:20]}"
-            f"{'...' if len(comment_text) > 20 else ''}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using format key: %s for comment: '%s%s'",
+                         format_key, comment_text[:20], '...' if len(comment_text) > 20 else '')
 
         # Find the exact comment in the current line
         comment_pos = text.find(comment_text)
         if comment_pos >= 0:
-            logger.debug(f"Found exact comment text at position {comment_pos}")
+            logger.debug("Found exact comment text at position %s", comment_pos)
             self.setFormat(comment_pos, len(comment_text), self.formats[format_key])
         else:
             # If exact match fails, try to find the comment prefix
@@ -1064,11 +1174,11 @@ class FTMLASTHighlighter(BaseHighlighter):
 
             comment_pos = text.find(prefix)
             if comment_pos >= 0:
-                logger.debug(f"Found comment prefix '{prefix}' at position {comment_pos}")
+                logger.debug("Found comment prefix '%s' at position %s", prefix, comment_pos)
                 # Only highlight from the comment prefix to the end of the line
                 self.setFormat(comment_pos, len(text) - comment_pos, self.formats[format_key])
             else:
-                logger.debug(f"Comment prefix '{prefix}' not found in text")
+                logger.debug("Comment prefix '%s' not found in text", prefix)
 
     def highlight_errors(self, text):
         """Highlight parse errors in the text with wave underlines or themed highlighting"""
@@ -1089,109 +1199,82 @@ class FTMLASTHighlighter(BaseHighlighter):
 
         if elapsed_ms < self.highlight_error_delay:
             logger.debug(
-                f"Skipping error highlighting: only {elapsed_ms:.0f}ms since last activity "
-                f"(need {self.highlight_error_delay}ms)")
-            return
-
-        """Highlight parse errors in the text with wave underlines or themed highlighting"""
-        block_number = self.currentBlock().blockNumber() + 1
-
-        # Only process if error highlighting is enabled
-        if not self.error_highlighting:
-            logger.debug("Error highlighting is disabled")
+                "Skipping error highlighting: only %.0fms since last activity (need %sms)",
+                elapsed_ms, self.highlight_error_delay)
             return
 
-        if not self.errors:
-            logger.debug("No errors to highlight")
+        # Only the errors reported for this line need checking
+        line_errors = self._errors_by_line.get(block_number)
+        if not line_errors:
             return
+        logger.debug("Checking %s errors on line %s", len(line_errors), block_number)
 
-        # Log for debugging
-        logger.debug(f"Checking for errors on line {block_number}, errors count: {len(self.errors)}")
-
-        for error in self.errors:
-            logger.debug(f"Checking error: {error}")
-            if error["line"] == block_number:
-                logger.debug(f"Found error on line {block_number}: {error}")
+        # The line and format are the same for every error, so look them up once
+        trimmed_length = len(text.rstrip())
+        text_length = len(text)
+        error_format = self.formats["error"]
 
-                # Get error position and adjust if needed
-                col = max(0, error["col"] - 1)  # Convert 1-based to 0-based, ensure not negative
-                length = max(1, error.get("length", 1))  # Use length from error or default to 1
+        for error in line_errors:
+            logger.debug("Found error on line %s: %s", block_number, error)
 
-                logger.debug(f"Initial error position: col={col}, length={length}")
+            # Get error position and adjust if needed
+            col = max(0, error["col"] - 1)  # Convert 1-based to 0-based, ensure not negative
+            length = max(1, error.get("length", 1))  # Use length from error or default to 1
+            error_token = error.get("token")
 
-                # Check if position is at or beyond last non-whitespace character
-                trimmed_text = text.rstrip()
-                trimmed_length = len(trimmed_text)
+            logger.debug("Initial error position: col=%s, length=%s", col, length)
 
-                # If error position is beyond last meaningful character or at the very end
-                if col >= trimmed_length:
-                    logger.debug(f"Error position {col} is beyond last meaningful character (at {trimmed_length})")
+            # If error position is beyond last meaningful character or at the very end
+            if col >= trimmed_length:
+                logger.debug("Error position %s is beyond last meaningful character (at %s)", col, trimmed_length)
 
-                    # If we have non-empty text, highlight the last character
-                    if trimmed_length > 0:
-                        col = trimmed_length - 1
-                        length = 1
-                        logger.debug(f"Adjusted to highlight last character at position {col}")
-                    else:
-                        # If line is completely empty, highlight position 0
-                        col = 0
-                        length = 1
-                        logger.debug("Empty line, highlighting position 0")
-
-                # Try to find the specific error token if it's provided
-                elif "token" in error:
-                    # Look for this token in the text
-                    error_token = error["token"]
-                    logger.debug(f"Looking for error token: '{error_token}'")
-                    token_pos = text.find(error_token, col)
+                # If we have non-empty text, highlight the last character
+                if trimmed_length > 0:
+                    col = trimmed_length - 1
+                    length = 1
+                    logger.debug("Adjusted to highlight last character at position %s", col)
+                else:
+                    # If line is completely empty, highlight position 0
+                    col = 0
+                    length = 1
+                    logger.debug("Empty line, highlighting position 0")
+
+            # Try to find the specific error token if it's provided
+            elif error_token:
+                # Look for this token in the text
+                logger.debug("Looking for error token: '%s'", error_token)
+                token_pos = text.find(error_token, col)
+                if token_pos >= 0:
+                    # Found the token, use its position and length
+                    logger.debug("Found error token '%s' at position %s", error_token, token_pos)
+                    col = token_pos
+                    length = len(error_token)
+                else:
+                    logger.debug("Error token '%s' not found in text at col %s", error_token, col)
+                    # Try finding it anywhere in the line
+                    token_pos = text.find(error_token)
                     if token_pos >= 0:
-                        # Found the token, use its position and length
-                        logger.debug(f"Found error token '{error_token}' at position {token_pos}")
+                        logger.debug("Found error token '%s' at alternate position %s", error_token, token_pos)
                         col = token_pos
                         length = len(error_token)
                     else:
-                        logger.debug(f"Error token '{error_token}' not found in text at col {col}")
-                        # Try finding it anywhere in the line
-                        token_pos = text.find(error_token)
-                        if token_pos >= 0:
-                            logger.debug(f"Found error token '{error_token}' at alternate position {token_pos}")
-                            col = token_pos
-                            length = len(error_token)
-                        else:
-                            logger.debug("Error token not found anywhere in line, using default position")
-
-                # Check if position is within text bounds
-                if col < len(text):
-                    # Adjust length to not go beyond end of line
-                    length = min(length, len(text) - col)
-
-                    # Get the text being highlighted
-                    error_text = text[col:col + length]
-                    logger.debug(f"Highlighting error text: '{error_text}' at col {col}, length {length}")
-
-                    # Create a direct error format
-                    error_format = QTextCharFormat()
-                    error_format.setUnderlineStyle(QTextCharFormat.WaveUnderline)
-
-                    # Use theme-based error color instead of hardcoded red
-                    if self.theme_manager:
-                        error_color = QColor(self.theme_manager.get_syntax_color("error"))
-                        background_color = QColor(error_color)
-                        background_color.setAlpha(20)  # Very transparent
-                    else:
-                        # Fallback to default red if theme manager not available
-                        error_color = QColor("#ff0000")  # Bright red
-                        background_color = QColor("#ffeeee")  # Very light red
+                        logger.debug("Error token not found anywhere in line, using default position")
 
-                    error_format.setUnderlineColor(error_color)
-                    error_format.setBackground(background_color)
+            # Check if position is within text bounds
+            if col < text_length:
+                # Adjust length to not go beyond end of line
+                length = min(length, text_length - col)
 
-                    # Apply error format directly
-                    logger.debug(f"Applying error format at col {col}, length {length}, color: {error_color.name()}")
-                    self.setFormat(col, length, error_format)
+                # Get the text being highlighted
+                error_text = text[col:col + length]
+                logger.debug("Highlighting error text: '%s' at col %s, length %s", error_text, col, length)
 
-                    # Set block state to indicate error
-                    self.setCurrentBlockState(1)  # Use state 1 to indicate error
-                    logger.debug(f"Set block state to 1 for error on line {block_number}")
-                else:
-                    logger.debug(f"Error position {col} is outside text bounds (length={len(text)})")
+                # Apply error format directly
+                logger.debug("Applying error format at col %s, length %s", col, length)
+                self.setFormat(col, length, error_format)
+
+                # Set block state to indicate error
+                self.setCurrentBlockState(1)  # Use state 1 to indicate error
+                logger.debug("Set block state to 1 for error on line %s", block_number)
+            else:
+                logger.debug("Error position %s is outside text bounds (length=%s)", col, text_length)
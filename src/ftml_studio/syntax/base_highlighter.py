@@ -1,25 +1,86 @@
 # src/ftml_studio/syntax/base_highlighter.py
+import functools
 import logging
-from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
+from PySide6.QtGui import QSyntaxHighlighter, QTextBlockUserData, QTextCharFormat, QColor, QFont
 from PySide6.QtCore import QRegularExpression
 
 logger = logging.getLogger("syntax_highlighter")
 
 
+@functools.lru_cache(maxsize=None)
+def compile_pattern(pattern):
+    """Return a compiled QRegularExpression, shared by every highlighter using the pattern"""
+    regex = QRegularExpression(pattern)
+    regex.optimize()  # Compile now instead of on the first match
+    return regex
+
+
+@functools.lru_cache(maxsize=None)
+def parse_color(name):
+    """Return the QColor for a color string, parsed once and shared - copy it before modifying"""
+    return QColor(name)
+
+
+class BlockFormatCache(QTextBlockUserData):
+    """Formats the highlighting rules gave a block, replayed while its text is unchanged"""
+
+    def __init__(self):
+        super().__init__()
+        self.rules_key = None
+        self.fingerprint = None
+        self.ranges = []
+
+
 class BaseHighlighter(QSyntaxHighlighter):
     """Base syntax highlighter with improved theme integration"""
 
+    # Formats shared by every highlighter, keyed by their attributes
+    _shared_formats = {}
+
+    # Subclasses whose rules never overlap can set this and call finalize_rules()
+    # to match all rules in a single pass over each block
+    combine_rules = False
+
     def __init__(self, document, theme_manager=None):
         super().__init__(document)
         self.theme_manager = theme_manager
-        self.highlighting_rules = []
+
+        # Rules as parallel lists, so highlightBlock indexes them instead of unpacking tuples
+        self._patterns = []
+        self._formats = []
         self.formats = {}
 
+        # (combined pattern, [(group number, format), ...]) built by finalize_rules
+        self._combined_rules = None
+
+        # Color table of the active theme, resolved once per initialize_formats
+        self._role_colors = None
+
+        # Identifies the current rules and formats; replaced whenever they change so
+        # blocks cached with older ones are matched again
+        self._rules_key = object()
+
         # Initialize format cache
         self.initialize_formats()
 
+    @property
+    def highlighting_rules(self):
+        """The (pattern, format) rules in the order they are applied"""
+        return list(zip(self._patterns, self._formats))
+
+    @highlighting_rules.setter
+    def highlighting_rules(self, rules):
+        self._patterns = [pattern for pattern, _ in rules]
+        self._formats = [format for _, format in rules]
+        self._combined_rules = None
+        self._rules_key = object()
+
     def initialize_formats(self):
         """Initialize text formats based on theme - override in subclasses for custom formats"""
+        # Resolve the active theme once for all the formats created below
+        if self.theme_manager:
+            self._role_colors = self.theme_manager.get_syntax_colors()
+
         # Create standard formats using theme colors
         self._create_format("keyword", role="keyword", bold=True)
         self._create_format("function", role="function")
@@ -51,26 +112,37 @@ class BaseHighlighter(QSyntaxHighlighter):
             bold: Whether to apply bold style
             italic: Whether to apply italic style
             underline: Whether to apply underline style
-        """
-        fmt = QTextCharFormat()
 
+        The returned format is shared with other highlighters, so copy it before modifying.
+        """
         # Use theme colors if available and role is specified
         if self.theme_manager and role and not foreground:
-            foreground = self.theme_manager.get_syntax_color(role)
-
-        # Apply colors
-        if foreground:
-            fmt.setForeground(QColor(foreground))
-        if background:
-            fmt.setBackground(QColor(background))
-
-        # Apply font styles
-        if bold:
-            fmt.setFontWeight(QFont.Bold)
-        if italic:
-            fmt.setFontItalic(True)
-        if underline:
-            fmt.setFontUnderline(True)
+            colors = self._role_colors
+            foreground = colors.get(role) if colors is not None else None
+            if foreground is None:
+                foreground = self.theme_manager.get_syntax_color(role)  # Warns about unknown roles
+
+        # Reuse the format built for the same attributes by any highlighter
+        key = (foreground, background, bold, italic, underline)
+        fmt = self._shared_formats.get(key)
+        if fmt is None:
+            fmt = QTextCharFormat()
+
+            # Apply colors
+            if foreground:
+                fmt.setForeground(parse_color(foreground))
+            if background:
+                fmt.setBackground(parse_color(background))
+
+            # Apply font styles
+            if bold:
+                fmt.setFontWeight(QFont.Bold)
+            if italic:
+                fmt.setFontItalic(True)
+            if underline:
+                fmt.setFontUnderline(True)
+
+            self._shared_formats[key] = fmt
 
         # Store the format
         self.formats[name] = fmt
@@ -80,6 +152,7 @@ class BaseHighlighter(QSyntaxHighlighter):
         """Update all formats to match current theme - call when theme changes"""
         # Re-initialize formats with current theme colors
         self.initialize_formats()
+        self._rules_key = object()
         # Rehighlight the document with new formats
         self.rehighlight()
 
@@ -89,16 +162,82 @@ class BaseHighlighter(QSyntaxHighlighter):
             logger.warning(f"Format '{format_name}' not found, using default")
             self._create_format(format_name)  # Create a default format
 
-        self.highlighting_rules.append((
-            QRegularExpression(pattern),
-            self.formats[format_name]
-        ))
+        self._patterns.append(compile_pattern(pattern))
+        self._formats.append(self.formats[format_name])
+        self._combined_rules = None  # Rules changed, fall back to one pass per rule
+        self._rules_key = object()
+
+    def finalize_rules(self):
+        """
+        Compile all rules into one alternation when combine_rules is set.
+        Call after the last add_rule. Each position then takes the first rule that
+        matches there, instead of later rules overwriting earlier ones, so this is
+        only equivalent for rule sets whose matches never overlap.
+        """
+        if not self.combine_rules or not self._patterns:
+            return
+
+        alternatives = []
+        group_formats = []
+        group = 1
+        for pattern, format in zip(self._patterns, self._formats):
+            alternatives.append(f"({pattern.pattern()})")
+            group_formats.append((group, format))
+            group += pattern.captureCount() + 1  # Skip the rule's own groups
+        self._combined_rules = (compile_pattern("|".join(alternatives)), group_formats)
+        self._rules_key = object()
 
     def highlightBlock(self, text):
         """Apply highlighting rules to the given block of text"""
+        set_format = self.setFormat  # Looked up once for the whole block
+
+        # Qt clears a block's formats before highlighting it again, so an unchanged
+        # block (re-attaching, a rehighlight after parsing) replays its cached formats
+        # instead of running the rules again
+        fingerprint = (len(text), hash(text))
+        cache = self.currentBlockUserData()
+        if not isinstance(cache, BlockFormatCache):
+            cache = BlockFormatCache()
+            self.setCurrentBlockUserData(cache)
+        elif cache.rules_key is self._rules_key and cache.fingerprint == fingerprint:
+            for start, length, format in cache.ranges:
+                set_format(start, length, format)
+            return
+
+        ranges = self._match_rules(text)
+        for start, length, format in ranges:
+            set_format(start, length, format)
+
+        cache.rules_key = self._rules_key
+        cache.fingerprint = fingerprint
+        cache.ranges = ranges
+
+    def _match_rules(self, text):
+        """Return the (start, length, format) ranges the rules give the text, in the order to apply them"""
+        ranges = []
+        add_range = ranges.append
+
+        if self._combined_rules is not None:
+            # One pass: find which rule's group took part in each match
+            combined, group_formats = self._combined_rules
+            match_iterator = combined.globalMatch(text)
+            while match_iterator.hasNext():
+                match = match_iterator.next()
+                for group, format in group_formats:
+                    if match.capturedStart(group) >= 0:
+                        add_range((match.capturedStart(), match.capturedLength(), format))
+                        break
+            return ranges
+
         # Apply each highlighting rule
-        for pattern, format in self.highlighting_rules:
-            match_iterator = pattern.globalMatch(text)
+        patterns = self._patterns
+        formats = self._formats
+        for i in range(len(patterns)):
+            match_iterator = patterns[i].globalMatch(text)
+            if not match_iterator.hasNext():
+                continue
+            format = formats[i]
             while match_iterator.hasNext():
                 match = match_iterator.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+                add_range((match.capturedStart(), match.capturedLength(), format))
+        return ranges
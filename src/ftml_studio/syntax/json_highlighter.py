@@ -5,6 +5,10 @@ from .base_highlighter import BaseHighlighter
 class JSONHighlighter(BaseHighlighter):
     """Syntax highlighter for JSON documents"""
 
+    # Match every rule in one pass; a string is matched whole, so the symbol and
+    # number rules no longer recolor commas, colons or digits inside it
+    combine_rules = True
+
     def __init__(self, document, theme_manager=None):
         super().__init__(document, theme_manager)
         self.create_highlighting_rules()
@@ -17,38 +21,25 @@ class JSONHighlighter(BaseHighlighter):
         # Keys (property names in quotes) - BLUE
         self.add_rule(r'"(?:\\.|[^"\\])*"(?=\s*:)', "key")  # This rule makes keys blue
 
-        # Important: We need to check that these strings are NOT followed by a colon
-        # String at start of line
-        self.add_rule(r'^\s*"(?:\\.|[^"\\])*"(?!\s*:)', "string")
-        # String after delimiter
-        self.add_rule(r'(?<=:|\[|,)\s*"(?:\\.|[^"\\])*"', "string")
-
-        # Numbers
-        # Float at start of line
-        self.add_rule(r'^\s*-?\d+\.\d+([eE][+-]?\d+)?(?=\s*[,\}\]]|$)', "number")
-        # Float after delimiter
-        self.add_rule(r'(?<=:|\[|,)\s*-?\d+\.\d+([eE][+-]?\d+)?(?=\s*[,\}\]]|$)', "number")
+        # Values either start the line or follow a delimiter; one rule covers both
+        # positions so the single-pass alternation tries fewer alternatives.
+        # Strings must NOT be followed by a colon, or they are keys
+        self.add_rule(r'(?:^|(?<=[:\[,]))\s*"(?:\\.|[^"\\])*"(?!\s*:)', "string")
 
-        # Integer at start of line
-        self.add_rule(r'^\s*-?\d+(?=\s*[,\}\]]|$)', "number")
-        # Integer after delimiter
-        self.add_rule(r'(?<=:|\[|,)\s*-?\d+(?=\s*[,\}\]]|$)', "number")
+        # Numbers (integer or float)
+        self.add_rule(r'(?:^|(?<=[:\[,]))\s*-?\d+(?:\.\d+(?:[eE][+-]?\d+)?)?(?=\s*[,\}\]]|$)', "number")
 
         # Booleans
-        # Boolean at start of line
-        self.add_rule(r'^\s*(true|false)(?=\s*[,\}\]]|$)', "boolean")
-        # Boolean after delimiter
-        self.add_rule(r'(?<=:|\[|,)\s*(true|false)(?=\s*[,\}\]]|$)', "boolean")
+        self.add_rule(r'(?:^|(?<=[:\[,]))\s*(?:true|false)(?=\s*[,\}\]]|$)', "boolean")
 
         # Null
-        # Null at start of line
-        self.add_rule(r'^\s*null(?=\s*[,\}\]]|$)', "null")
-        # Null after delimiter
-        self.add_rule(r'(?<=:|\[|,)\s*null(?=\s*[,\}\]]|$)', "null")
+        self.add_rule(r'(?:^|(?<=[:\[,]))\s*null(?=\s*[,\}\]]|$)', "null")
 
         # Symbols
         self.add_rule(r'[:{}\[\],]', "symbol")
 
+        self.finalize_rules()
+
     def highlightBlock(self, text):
         """Apply highlighting rules to the given block of text"""
         # Call the base implementation
@@ -1,6 +1,6 @@
 # src/ftml_studio/syntax/schema_highlighter.py
 import logging
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Signal, QObject, QRunnable, QThreadPool
 
 import ftml
 from ftml.exceptions import FTMLParseError
@@ -11,6 +11,55 @@ from .base_highlighter import BaseHighlighter
 logger = logging.getLogger("ftml_schema_highlighter")
 
 
+def parse_schema_content(content):
+    """
+    Parse FTML schema content and return the errors to highlight
+
+    Runs on a thread pool worker, so it must not touch any Qt widgets or documents.
+    """
+    errors = []
+    try:
+        # Try to parse the schema using FTML
+        ftml.load_schema(content)
+        logger.debug("Successfully parsed FTML schema")
+
+    except FTMLParseError as e:
+        # Handle parse error
+        if hasattr(e, "line") and hasattr(e, "col"):
+            errors.append({
+                "line": e.line,
+                "col": e.col,
+                "message": str(e),
+                "length": 1  # Default to 1 character
+            })
+
+        logger.debug("FTML schema parse error: %s", e)
+
+    except Exception as e:
+        # Handle other errors
+        logger.debug("Error parsing FTML schema: %s", e)
+
+    return errors
+
+
+# Helper class to emit signals (since QRunnable is not a QObject)
+class SchemaParseSignals(QObject):
+    finished = Signal(int, object)  # Parse request id, errors from parse_schema_content
+
+
+class SchemaParseTask(QRunnable):
+    """Parse FTML schema content on a QThreadPool worker thread"""
+
+    def __init__(self, request_id, content):
+        super().__init__()
+        self.request_id = request_id
+        self.content = content
+        self.signals = SchemaParseSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.request_id, parse_schema_content(self.content))
+
+
 class SchemaHighlighter(BaseHighlighter):
     """Syntax highlighter for FTML Schema documents"""
 
@@ -31,6 +80,10 @@ class SchemaHighlighter(BaseHighlighter):
         # Schema errors to highlight
         self.errors = []
 
+        # Parses run on the thread pool; only the latest request's result is applied
+        self._parse_request_id = 0
+        self._parse_tasks = set()
+
         # Start initial parsing timer
         self.document().contentsChange.connect(self.handle_content_change)
         self.parse_timer.start(500)  # Parse after 500ms
@@ -104,42 +157,43 @@ class SchemaHighlighter(BaseHighlighter):
 
     def handle_content_change(self, position, removed, added):
         """Handle document content changes"""
+        # A parse still running describes content that no longer exists; drop its result
+        self._parse_request_id += 1
+
         # Reset the timer to parse after 500ms of inactivity
         self.parse_timer.start(500)
 
     def parse_schema(self):
-        """Parse the schema document to check for errors"""
-        content = self.document().toPlainText()
+        """Start parsing the schema document to check for errors, off the GUI thread"""
+        doc = self.document()
+        if doc is None:
+            return  # Detached from its document
 
-        # Reset errors
-        self.errors = []
+        content = doc.toPlainText()
+
+        # Newer requests supersede any parse still running
+        self._parse_request_id += 1
 
         if not content.strip():
+            self.apply_parse_result(self._parse_request_id, [])
             return
 
-        try:
-            # Try to parse the schema using FTML
-            ftml.load_schema(content)
-            logger.debug("Successfully parsed FTML schema")
-
-        except FTMLParseError as e:
-            # Handle parse error
-            if hasattr(e, "line") and hasattr(e, "col"):
-                self.errors.append({
-                    "line": e.line,
-                    "col": e.col,
-                    "message": str(e),
-                    "length": 1  # Default to 1 character
-                })
-
-            logger.debug(f"FTML schema parse error: {str(e)}")
-
-        except Exception as e:
-            # Handle other errors
-            logger.debug(f"Error parsing FTML schema: {str(e)}")
-
-        # Reapply highlighting
-        self.rehighlight()
+        task = SchemaParseTask(self._parse_request_id, content)
+        task.signals.finished.connect(self.apply_parse_result)
+        task.setAutoDelete(False)  # Owned by _parse_tasks until it reports back
+        self._parse_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def apply_parse_result(self, request_id, errors):
+        """Apply a finished schema parse on the GUI thread"""
+        self._parse_tasks = {task for task in self._parse_tasks if task.request_id != request_id}
+        if request_id != self._parse_request_id:
+            return  # The document changed since
+
+        # Reapply highlighting only when the errors to show changed
+        if errors != self.errors:
+            self.errors = errors
+            self.rehighlight()
 
     def highlightBlock(self, text):
         """Apply highlighting to the given block of text"""
@@ -1,11 +1,22 @@
 # src/ftml_studio/syntax/xml_highlighter.py
-from PySide6.QtCore import QRegularExpression
-from .base_highlighter import BaseHighlighter
+from .base_highlighter import BaseHighlighter, compile_pattern
 
 
 class XMLHighlighter(BaseHighlighter):
     """Syntax highlighter for XML documents"""
 
+    # Match every rule in one pass; comments, CDATA sections, processing instructions
+    # and DOCTYPEs are matched whole, so the tag rules no longer recolor their insides
+    combine_rules = True
+
+    # Text between a tag's closing bracket and the next opening one (no backtracking)
+    _TAG_CONTENT_RE = compile_pattern(r'>([^<]*)<')
+    # Integer or float text content
+    _NUMBER_RE = compile_pattern(r'^-?[0-9]+(\.[0-9]+)?$')
+
+    _BOOLEAN_WORDS = frozenset(("true", "false"))
+    _NULL_WORDS = frozenset(("null", "none", "nil"))
+
     def __init__(self, document, theme_manager=None):
         super().__init__(document, theme_manager)
         self.create_highlighting_rules()
@@ -28,8 +39,8 @@ class XMLHighlighter(BaseHighlighter):
         self.add_rule(r'<!DOCTYPE.*?>', "key")
 
         # XML Element brackets - highlight these as operators
+        self.add_rule(r'</(?=[a-zA-Z0-9_:-])', "operator")  # Closing tag start (before the bare bracket)
         self.add_rule(r'<(?=/|[a-zA-Z0-9_:-])', "operator")  # Opening bracket
-        self.add_rule(r'</(?=[a-zA-Z0-9_:-])', "operator")  # Closing tag start
         self.add_rule(r'(?<=[a-zA-Z0-9_:-])>', "operator")  # Closing bracket
         self.add_rule(r'(?<=[a-zA-Z0-9_:-])/>', "operator")  # Self-closing tag end
 
@@ -47,20 +58,23 @@ class XMLHighlighter(BaseHighlighter):
         # XML Entity references
         self.add_rule(r'&[a-zA-Z0-9#]+;', "number")
 
+        self.finalize_rules()
+
     def initialize_formats(self):
         """Initialize text formats with custom colors"""
         super().initialize_formats()
 
-        # XML-specific formatting adjustments using theme colors
+        # XML-specific formatting adjustments using theme colors (roles read the
+        # color table resolved once by the base class, and the formats are shared)
         if self.theme_manager:
             # Tags
-            self._create_format("key", foreground=self.theme_manager.get_syntax_color("keyword"), bold=True)
+            self._create_format("key", role="keyword", bold=True)
             # Attributes
-            self._create_format("symbol", foreground=self.theme_manager.get_syntax_color("operator"))
+            self._create_format("symbol", role="operator")
             # Values
-            self._create_format("string", foreground=self.theme_manager.get_syntax_color("string"))
+            self._create_format("string", role="string")
             # Entities
-            self._create_format("number", foreground=self.theme_manager.get_syntax_color("number"))
+            self._create_format("number", role="number")
         else:
             # Fallback colors if no theme manager
             self._create_format("key", foreground="#0000aa", bold=True)
@@ -81,45 +95,31 @@ class XMLHighlighter(BaseHighlighter):
 
     def _highlight_text_content(self, text):
         """Highlight text content between tags with type detection"""
-        # Define regex to find text content between tags
-        tag_content_regex = QRegularExpression(r'>(.*?)<')
-
-        # Find all matches
-        match_iterator = tag_content_regex.globalMatch(text)
+        # Find all text content between tags
+        match_iterator = self._TAG_CONTENT_RE.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
 
-            # Get the captured text content (group 1)
-            content = match.captured(1)
-
-            # Skip empty or whitespace-only content
-            if not content.strip():
+            # Get the captured text content (group 1), skipping whitespace-only content
+            content_stripped = match.captured(1).strip()
+            if not content_stripped:
                 continue
 
             # Apply the text format to the content
             start_pos = match.capturedStart(1)
             length = match.capturedLength(1)
 
-            # Only apply if there's content
-            if length > 0:
-                # Attempt to detect the content type and use appropriate formatting
-                content_stripped = content.strip()
-
-                # Check if it's a number (integer or float)
-                number_regex = QRegularExpression(r'^-?[0-9]+(\.[0-9]+)?$')
-                if number_regex.match(content_stripped).hasMatch():
-                    self.setFormat(start_pos, length, self.formats["number"])
-                    continue
-
-                # Check if it's a boolean (true/false, True/False)
-                if content_stripped.lower() in ["true", "false"]:
-                    self.setFormat(start_pos, length, self.formats["boolean"])
-                    continue
-
-                # Check if it's null (null, None, nil)
-                if content_stripped.lower() in ["null", "none", "nil"]:
-                    self.setFormat(start_pos, length, self.formats["null"])
-                    continue
-
+            # Attempt to detect the content type and use appropriate formatting
+            word = content_stripped.lower()
+            if self._NUMBER_RE.match(content_stripped).hasMatch():
+                # Integer or float
+                self.setFormat(start_pos, length, self.formats["number"])
+            elif word in self._BOOLEAN_WORDS:
+                # true/false, True/False
+                self.setFormat(start_pos, length, self.formats["boolean"])
+            elif word in self._NULL_WORDS:
+                # null, None, nil
+                self.setFormat(start_pos, length, self.formats["null"])
+            else:
                 # Default to string for all other content
                 self.setFormat(start_pos, length, self.formats["string"])
@@ -1,6 +1,5 @@
 # src/ftml_studio/syntax/yaml_highlighter.py
-from PySide6.QtCore import QRegularExpression
-from .base_highlighter import BaseHighlighter
+from .base_highlighter import BaseHighlighter, compile_pattern
 
 
 class YAMLHighlighter(BaseHighlighter):
@@ -56,7 +55,7 @@ class YAMLHighlighter(BaseHighlighter):
 
     def _highlight_comments(self, text, highlighted):
         """Highlight comment lines"""
-        pattern = QRegularExpression(r'#.*$')
+        pattern = compile_pattern(r'#.*$')
         match_iterator = pattern.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -70,7 +69,7 @@ class YAMLHighlighter(BaseHighlighter):
     def _highlight_keys(self, text, highlighted):
         """Highlight all keys including those in list contexts"""
         # Normal keys (with colon)
-        key_pattern = QRegularExpression(r'^\s*([A-Za-z0-9_-]+)(?=\s*:)')
+        key_pattern = compile_pattern(r'^\s*([A-Za-z0-9_-]+)(?=\s*:)')
         match_iterator = key_pattern.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -82,7 +81,7 @@ class YAMLHighlighter(BaseHighlighter):
                 self._mark_highlighted(start, length, highlighted)
 
         # Keys in indented lines
-        indented_key_pattern = QRegularExpression(r'^\s+([A-Za-z0-9_-]+)(?=\s*:)')
+        indented_key_pattern = compile_pattern(r'^\s+([A-Za-z0-9_-]+)(?=\s*:)')
         match_iterator = indented_key_pattern.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -94,7 +93,7 @@ class YAMLHighlighter(BaseHighlighter):
                 self._mark_highlighted(start, length, highlighted)
 
         # Keys after list item dashes
-        list_key_pattern = QRegularExpression(r'^\s*-\s+([A-Za-z0-9_-]+)(?=\s*:)')
+        list_key_pattern = compile_pattern(r'^\s*-\s+([A-Za-z0-9_-]+)(?=\s*:)')
         match_iterator = list_key_pattern.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -108,7 +107,7 @@ class YAMLHighlighter(BaseHighlighter):
     def _highlight_list_markers(self, text, highlighted):
         """Highlight list item markers and their values"""
         # List item dashes
-        dash_pattern = QRegularExpression(r'(^\s*-)(\s+)([^:\n#]+)(?=\s*$|\s+#)')
+        dash_pattern = compile_pattern(r'(^\s*-)(\s+)([^:\n#]+)(?=\s*$|\s+#)')
         match_iterator = dash_pattern.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -130,7 +129,7 @@ class YAMLHighlighter(BaseHighlighter):
     def _highlight_inline_lists(self, text, highlighted):
         """Handle inline lists like [item1, item2, item3]"""
         # Find anything that looks like an inline list
-        list_pattern = QRegularExpression(r'\[([^\]]*)\]')
+        list_pattern = compile_pattern(r'\[([^\]]*)\]')
         match_iterator = list_pattern.globalMatch(text)
 
         while match_iterator.hasNext():
@@ -149,7 +148,7 @@ class YAMLHighlighter(BaseHighlighter):
                 self._mark_highlighted(list_start + list_length - 1, 1, highlighted)
 
             # Highlight individual items
-            item_pattern = QRegularExpression(r'([^,]+)(?:,|$)')
+            item_pattern = compile_pattern(r'([^,]+)(?:,|$)')
             item_start = 0
 
             item_match_iterator = item_pattern.globalMatch(list_content)
@@ -182,7 +181,7 @@ class YAMLHighlighter(BaseHighlighter):
     def _highlight_values(self, text, highlighted):
         """Highlight scalar values after keys"""
         # This pattern catches all text after a colon until end of line or a comment
-        value_pattern = QRegularExpression(r':\s+([^:#\[\]{}][^#\n]*?)(?=$|\s+#)')
+        value_pattern = compile_pattern(r':\s+([^:#\[\]{}][^#\n]*?)(?=$|\s+#)')
         match_iterator = value_pattern.globalMatch(text)
 
         while match_iterator.hasNext():
@@ -210,14 +209,14 @@ class YAMLHighlighter(BaseHighlighter):
             elif value_text.lower() in ["null", "~", "none"]:
                 format = self.formats["null"]
             # Check for numbers
-            elif QRegularExpression(r'^-?\d+(\.\d+)?$').match(value_text).hasMatch():
+            elif compile_pattern(r'^-?\d+(\.\d+)?$').match(value_text).hasMatch():
                 format = self.formats["number"]
 
             self.setFormat(start, length, format)
             self._mark_highlighted(start, length, highlighted)
 
         # Handle quoted strings specifically
-        quoted_pattern = QRegularExpression(r':\s+(["\'])(.*?)\1')
+        quoted_pattern = compile_pattern(r':\s+(["\'])(.*?)\1')
         match_iterator = quoted_pattern.globalMatch(text)
 
         while match_iterator.hasNext():
@@ -1,24 +1,57 @@
 # src/ftml_studio/ui/elements/converter.py
+import functools
+import hashlib
+import importlib
 import logging
 import os
 import sys
-from PySide6.QtWidgets import (QWidget, QSplitter, QTextEdit, QComboBox,
+from collections import OrderedDict
+from PySide6.QtWidgets import (QWidget, QSplitter, QPlainTextEdit, QComboBox,
                                QPushButton, QVBoxLayout,
                                QHBoxLayout, QLabel, QFileDialog,
                                QMessageBox, QApplication)
-from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt, QSettings
-from ftml.exceptions import FTMLParseError
+from PySide6.QtGui import QTextCursor
+from PySide6.QtCore import Qt, QSettings, QTimer, QObject, Signal, QRunnable, QThreadPool
 
+from ftml_studio import syntax
 from ftml_studio.logger import setup_logger, LOG_LEVELS
-from ftml_studio.converters.ftml_conversion_validator import FTMLConversionValidator
-from ftml_studio.converters.json_converter import JSONConverter
 from ftml_studio.ui.themes import theme_manager
+from ftml_studio.ui.file_io import save_text_file
+from ftml_studio.ui.fonts import monospace_font
+from ftml_studio.ui.settings_cache import settings_cache
 
 # Configure logging
 logger = setup_logger("ftml_studio.converter")
 
 
+# Helper class to emit signals (since QRunnable is not a QObject)
+class ConvertSignals(QObject):
+    finished = Signal(int, str, object)  # Request id, result, (is_valid, message) or None
+    failed = Signal(int, str)  # Request id, error message
+
+
+class ConvertTask(QRunnable):
+    """Run a conversion (and optional validation of its result) on a QThreadPool worker thread"""
+
+    def __init__(self, request_id, converter, content, validate=None):
+        super().__init__()
+        self.request_id = request_id
+        self.converter = converter
+        self.content = content
+        self.validate = validate
+        self.signals = ConvertSignals()
+
+    def run(self):
+        try:
+            result = self.converter.convert(self.content)
+            validation = self.validate(result) if self.validate is not None else None
+        except Exception as e:
+            logger.error(f"Conversion error: {str(e)}", exc_info=True)
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            self.signals.finished.emit(self.request_id, result, validation)
+
+
 # Create a simple FormatSelector widget
 class FormatSelector(QWidget):
     """Format selector with label"""
@@ -32,117 +65,103 @@ class FormatSelector(QWidget):
         self.label = QLabel(label_text)
         self.combo = QComboBox()
 
-        for fmt in formats:
-            self.combo.addItem(fmt)
+        self.combo.addItems(formats)
+
+        # Index of each format in the combo box, and the current selection
+        self._index = {fmt: i for i, fmt in enumerate(formats)}
+        self._current = self.combo.currentText()
+        # currentIndexChanged is emitted before currentTextChanged, and other widgets
+        # connect to it later, so this slot runs before anything reads the selection
+        self.combo.currentIndexChanged.connect(self._on_current_index_changed)
 
         layout.addWidget(self.label)
         layout.addWidget(self.combo)
 
     def get_selected_format(self):
         """Get the currently selected format"""
-        return self.combo.currentText()
+        return self._current
 
     def set_selected_format(self, format):
         """Set the selected format"""
-        index = self.combo.findText(format)
+        index = self._index.get(format, -1)
         if index >= 0:
             self.combo.setCurrentIndex(index)
 
+    def _on_current_index_changed(self, index):
+        """Keep the cached selection in step with the combo box"""
+        self._current = self.combo.itemText(index)
+
 
 # Get converter for the specified formats
 def get_converter(source_fmt, target_fmt):
     """Return the appropriate converter based on source and target formats"""
-    logger.debug(f"Getting converter for {source_fmt} to {target_fmt}")
-
+    # Normalize so "JSON" and "json" share one cache entry
+    return _create_converter(source_fmt.lower(), target_fmt.lower())
+
+
+# Highlighter class (exported by ftml_studio.syntax) for each format
+_HIGHLIGHTER_CLASSES = {
+    "ftml": "FTMLASTHighlighter",
+    "json": "JSONHighlighter",
+    "yaml": "YAMLHighlighter",
+    "toml": "TOMLHighlighter",
+    "xml": "XMLHighlighter",
+}
+
+# Converter for each (source, target) pair: (module in ftml_studio.converters, class, constructor
+# keyword arguments). Modules are imported on first use so unused converters are never loaded.
+_CONVERTER_CLASSES = {
     # FTML conversions
-    if source_fmt.lower() == "json" and target_fmt.lower() == "ftml":
-        logger.debug("Creating JSON to FTML converter")
-        return JSONConverter(reverse=True)
-    elif source_fmt.lower() == "ftml" and target_fmt.lower() == "json":
-        logger.debug("Creating FTML to JSON converter")
-        return JSONConverter(reverse=False)
-    elif source_fmt.lower() == "yaml" and target_fmt.lower() == "ftml":
-        logger.debug("Creating YAML to FTML converter")
-        from ftml_studio.converters.yaml_converter import YAMLConverter
-        return YAMLConverter(reverse=True)
-    elif source_fmt.lower() == "ftml" and target_fmt.lower() == "yaml":
-        logger.debug("Creating FTML to YAML converter")
-        from ftml_studio.converters.yaml_converter import YAMLConverter
-        return YAMLConverter(reverse=False)
-    elif source_fmt.lower() == "toml" and target_fmt.lower() == "ftml":
-        logger.debug("Creating TOML to FTML converter")
-        from ftml_studio.converters.toml_converter import TOMLConverter
-        return TOMLConverter(reverse=True)
-    elif source_fmt.lower() == "ftml" and target_fmt.lower() == "toml":
-        logger.debug("Creating FTML to TOML converter")
-        from ftml_studio.converters.toml_converter import TOMLConverter
-        return TOMLConverter(reverse=False)
-    elif source_fmt.lower() == "xml" and target_fmt.lower() == "ftml":
-        logger.debug("Creating XML to FTML converter")
-        from ftml_studio.converters.xml_converter import XMLConverter
-        return XMLConverter(reverse=True)
-    elif source_fmt.lower() == "ftml" and target_fmt.lower() == "xml":
-        logger.debug("Creating FTML to XML converter")
-        from ftml_studio.converters.xml_converter import XMLConverter
-        return XMLConverter(reverse=False)
+    ("json", "ftml"): ("json_converter", "JSONConverter", {"reverse": True}),
+    ("ftml", "json"): ("json_converter", "JSONConverter", {"reverse": False}),
+    ("yaml", "ftml"): ("yaml_converter", "YAMLConverter", {"reverse": True}),
+    ("ftml", "yaml"): ("yaml_converter", "YAMLConverter", {"reverse": False}),
+    ("toml", "ftml"): ("toml_converter", "TOMLConverter", {"reverse": True}),
+    ("ftml", "toml"): ("toml_converter", "TOMLConverter", {"reverse": False}),
+    ("xml", "ftml"): ("xml_converter", "XMLConverter", {"reverse": True}),
+    ("ftml", "xml"): ("xml_converter", "XMLConverter", {"reverse": False}),
 
     # Direct format conversions
-    elif source_fmt.lower() == "json" and target_fmt.lower() == "yaml":
-        logger.debug("Creating JSON to YAML converter")
-        from ftml_studio.converters.yaml_converter import JSONToYAMLConverter
-        return JSONToYAMLConverter()
-    elif source_fmt.lower() == "yaml" and target_fmt.lower() == "json":
-        logger.debug("Creating YAML to JSON converter")
-        from ftml_studio.converters.yaml_converter import YAMLToJSONConverter
-        return YAMLToJSONConverter()
-    elif source_fmt.lower() == "json" and target_fmt.lower() == "toml":
-        logger.debug("Creating JSON to TOML converter")
-        from ftml_studio.converters.toml_converter import JSONToTOMLConverter
-        return JSONToTOMLConverter()
-    elif source_fmt.lower() == "toml" and target_fmt.lower() == "json":
-        logger.debug("Creating TOML to JSON converter")
-        from ftml_studio.converters.toml_converter import TOMLToJSONConverter
-        return TOMLToJSONConverter()
-    elif source_fmt.lower() == "json" and target_fmt.lower() == "xml":
-        logger.debug("Creating JSON to XML converter")
-        from ftml_studio.converters.xml_converter import JSONToXMLConverter
-        return JSONToXMLConverter()
-    elif source_fmt.lower() == "xml" and target_fmt.lower() == "json":
-        logger.debug("Creating XML to JSON converter")
-        from ftml_studio.converters.xml_converter import XMLToJSONConverter
-        return XMLToJSONConverter()
-    elif source_fmt.lower() == "yaml" and target_fmt.lower() == "toml":
-        logger.debug("Creating YAML to TOML converter")
-        from ftml_studio.converters.yaml_converter import YAMLToTOMLConverter
-        return YAMLToTOMLConverter()
-    elif source_fmt.lower() == "yaml" and target_fmt.lower() == "xml":
-        logger.debug("Creating YAML to XML converter")
-        from ftml_studio.converters.yaml_converter import YAMLToXMLConverter
-        return YAMLToXMLConverter()
-    elif source_fmt.lower() == "toml" and target_fmt.lower() == "yaml":
-        logger.debug("Creating TOML to YAML converter")
-        from ftml_studio.converters.toml_converter import TOMLToYAMLConverter
-        return TOMLToYAMLConverter()
-    elif source_fmt.lower() == "toml" and target_fmt.lower() == "xml":
-        logger.debug("Creating TOML to XML converter")
-        from ftml_studio.converters.toml_converter import TOMLToXMLConverter
-        return TOMLToXMLConverter()
-    elif source_fmt.lower() == "xml" and target_fmt.lower() == "yaml":
-        logger.debug("Creating XML to YAML converter")
-        from ftml_studio.converters.xml_converter import XMLToYAMLConverter
-        return XMLToYAMLConverter()
-    elif source_fmt.lower() == "xml" and target_fmt.lower() == "toml":
-        logger.debug("Creating XML to TOML converter")
-        from ftml_studio.converters.xml_converter import XMLToTOMLConverter
-        return XMLToTOMLConverter()
-    else:
+    ("json", "yaml"): ("yaml_converter", "JSONToYAMLConverter", {}),
+    ("yaml", "json"): ("yaml_converter", "YAMLToJSONConverter", {}),
+    ("json", "toml"): ("toml_converter", "JSONToTOMLConverter", {}),
+    ("toml", "json"): ("toml_converter", "TOMLToJSONConverter", {}),
+    ("json", "xml"): ("xml_converter", "JSONToXMLConverter", {}),
+    ("xml", "json"): ("xml_converter", "XMLToJSONConverter", {}),
+    ("yaml", "toml"): ("yaml_converter", "YAMLToTOMLConverter", {}),
+    ("yaml", "xml"): ("yaml_converter", "YAMLToXMLConverter", {}),
+    ("toml", "yaml"): ("toml_converter", "TOMLToYAMLConverter", {}),
+    ("toml", "xml"): ("toml_converter", "TOMLToXMLConverter", {}),
+    ("xml", "yaml"): ("xml_converter", "XMLToYAMLConverter", {}),
+    ("xml", "toml"): ("xml_converter", "XMLToTOMLConverter", {}),
+}
+
+
+# Converters keep no state between convert() calls, so one instance per pair is reused
+@functools.lru_cache(maxsize=32)
+def _create_converter(source_fmt, target_fmt):
+    """Create the converter for a pair of lower-case formats"""
+    entry = _CONVERTER_CLASSES.get((source_fmt, target_fmt))
+    if entry is None:
         logger.warning(f"Unsupported conversion: {source_fmt} to {target_fmt}")
         raise ValueError(f"Conversion from {source_fmt} to {target_fmt} is not supported")
 
+    module_name, class_name, kwargs = entry
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Creating %s for %s to %s", class_name, source_fmt, target_fmt)
+    module = importlib.import_module(f"ftml_studio.converters.{module_name}")
+    return getattr(module, class_name)(**kwargs)
+
 
 class ConverterWidget(QWidget):
     """Widget for converting between FTML and other formats"""
 
+    # Characters read per event loop pass when loading a file
+    LOAD_CHUNK_SIZE = 128 * 1024
+
+    # Number of recent conversion results kept for repeated Convert clicks
+    CONVERT_CACHE_SIZE = 8
+
     def __init__(self, parent=None):
         super().__init__(parent)
         logger.debug("Initializing ConverterWidget")
@@ -150,9 +169,25 @@ class ConverterWidget(QWidget):
         # Create settings to store widget state
         self.settings = QSettings("FTMLStudio", "ConverterWidget")
 
+        # (path, decoded text, characters inserted so far, detached source highlighter)
+        # of a file being loaded in chunks, if any
+        self._loading_file = None
+
+        # Highlighters created so far, keyed by (side, format), and the ones in use
+        self._highlighter_cache = {}
+        self.source_highlighter = None
+        self.target_highlighter = None
+        self._pending_highlighter_sides = set()
+
+        # Conversions run on the thread pool; only the latest request's result is shown
+        self._convert_request_id = 0
+        self._convert_tasks = set()
+
+        # (source format, target format, source digest) -> (result, validation), oldest first
+        self._convert_cache = OrderedDict()
+
         # Get the global error indicators setting
-        app_settings = QSettings("FTMLStudio", "AppSettings")
-        self.error_highlighting_enabled = app_settings.value("editor/showErrorIndicators", True, type=bool)
+        self.error_highlighting_enabled = settings_cache.value("editor/showErrorIndicators", True, type=bool)
         logger.debug(f"Initializing with error highlighting: {self.error_highlighting_enabled}")
 
         # Set up the UI
@@ -219,19 +254,17 @@ class ConverterWidget(QWidget):
         right_controls_layout.addWidget(self.save_btn)
         right_controls_layout.addStretch(1)  # This pushes controls to the left
 
-        # Text areas
-        self.source_text = QTextEdit()
-        self.target_text = QTextEdit()
+        # Text areas (plain text editors lay out large documents block by block)
+        self.source_text = QPlainTextEdit()
+        self.target_text = QPlainTextEdit()
+        self.source_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.target_text.setLineWrapMode(QPlainTextEdit.NoWrap)
 
         # Set monospace font
-        font = QFont("Consolas", 11)
-        font.setFixedPitch(True)
+        font = monospace_font(11)
         self.source_text.setFont(font)
         self.target_text.setFont(font)
 
-        self.source_text.setAcceptRichText(False)
-        self.target_text.setAcceptRichText(False)
-
         # Assemble the left container
         left_layout.addWidget(left_controls)
         left_layout.addWidget(self.source_text, 1)  # 1 gives it stretch priority
@@ -250,10 +283,6 @@ class ConverterWidget(QWidget):
         convert_layout = QHBoxLayout(convert_container)
         convert_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.convert_btn = QPushButton(" Convert → ")
-        self.convert_btn.setObjectName("convertButton")  # Important for CSS styling
-        self.convert_btn.clicked.connect(self.convert)
-
         # Create a centered button with arrow icon
         self.convert_btn = QPushButton(" Convert → ")
         self.convert_btn.setObjectName("convertButton")
@@ -273,9 +302,9 @@ class ConverterWidget(QWidget):
         # Apply syntax highlighting based on selected formats
         self.update_syntax_highlighting()
 
-        # Connect format selection changes to update highlighting
-        self.source_format.combo.currentIndexChanged.connect(self.update_syntax_highlighting)
-        self.target_format.combo.currentIndexChanged.connect(self.update_syntax_highlighting)
+        # Connect format selection changes to update highlighting (only the side that changed)
+        self.source_format.combo.currentIndexChanged.connect(lambda: self._schedule_highlighter_update("source"))
+        self.target_format.combo.currentIndexChanged.connect(lambda: self._schedule_highlighter_update("target"))
 
         logger.debug("UI setup complete")
 
@@ -296,8 +325,7 @@ class ConverterWidget(QWidget):
         target_cursor_pos = self.target_text.textCursor().position()
 
         # Update fonts
-        font = QFont("Consolas", size)
-        font.setFixedPitch(True)
+        font = monospace_font(size)
         self.source_text.setFont(font)
         self.target_text.setFont(font)
 
@@ -317,12 +345,10 @@ class ConverterWidget(QWidget):
     def setup_initial_font(self):
         """Set up the initial font based on settings"""
         # Get settings
-        app_settings = QSettings("FTMLStudio", "AppSettings")
-        font_size = app_settings.value("editor/fontSize", 11, type=int)
+        font_size = settings_cache.value("editor/fontSize", 11, type=int)
 
         # Apply font
-        font = QFont("Consolas", font_size)
-        font.setFixedPitch(True)
+        font = monospace_font(font_size)
         self.source_text.setFont(font)
         self.target_text.setFont(font)
         logger.debug(f"Set initial converter font size to {font_size}")
@@ -333,6 +359,10 @@ class ConverterWidget(QWidget):
         Validates if the given content is valid FTML
         Returns (is_valid, error_message)
         """
+        # Only needed once something is converted to FTML
+        from ftml.exceptions import FTMLParseError
+        from ftml_studio.converters.ftml_conversion_validator import FTMLConversionValidator
+
         logger.debug("Validating FTML content")
         if not ftml_content.strip():
             return False, "Empty FTML content"
@@ -350,80 +380,95 @@ class ConverterWidget(QWidget):
             return False, f"Invalid FTML: {str(e)}"
 
     def update_syntax_highlighting(self):
-        """Update syntax highlighting based on selected formats"""
+        """Update syntax highlighting of both editors based on selected formats"""
         # Get the current global error indicators setting
-        app_settings = QSettings("FTMLStudio", "AppSettings")
-        self.error_highlighting_enabled = app_settings.value("editor/showErrorIndicators", True, type=bool)
-
-        # Import highlighters on-demand
-        from ftml_studio.syntax import (
-            JSONHighlighter, YAMLHighlighter,
-            TOMLHighlighter, XMLHighlighter, FTMLASTHighlighter
-        )
-
-        # Source highlighting - first clear any existing highlighter by setting document to None
-        if hasattr(self, 'source_highlighter'):
-            self.source_highlighter.setDocument(None)
-
-        # Create new highlighter based on source format
-        source_format = self.source_format.get_selected_format().lower()
-        if source_format == "ftml":
-            self.source_highlighter = FTMLASTHighlighter(
-                self.source_text.document(),
-                theme_manager,
-                error_highlighting=self.error_highlighting_enabled  # Apply global setting
-            )
-            logger.debug(
-                f"Created FTML highlighter for source with error highlighting={self.error_highlighting_enabled}")
-        elif source_format == "json":
-            self.source_highlighter = JSONHighlighter(self.source_text.document(), theme_manager)
-        elif source_format == "yaml":
-            self.source_highlighter = YAMLHighlighter(self.source_text.document(), theme_manager)
-        elif source_format == "toml":
-            self.source_highlighter = TOMLHighlighter(self.source_text.document(), theme_manager)
-        elif source_format == "xml":
-            self.source_highlighter = XMLHighlighter(self.source_text.document(), theme_manager)
-
-        # Target highlighting - first clear any existing highlighter by setting document to None
-        if hasattr(self, 'target_highlighter'):
-            self.target_highlighter.setDocument(None)
-
-        # Create new highlighter based on target format
-        target_format = self.target_format.get_selected_format().lower()
-        if target_format == "ftml":
-            self.target_highlighter = FTMLASTHighlighter(
-                self.target_text.document(),
-                theme_manager,
-                error_highlighting=self.error_highlighting_enabled  # Apply global setting
-            )
-            logger.debug(
-                f"Created FTML highlighter for target with error highlighting={self.error_highlighting_enabled}")
-        elif target_format == "json":
-            self.target_highlighter = JSONHighlighter(self.target_text.document(), theme_manager)
-        elif target_format == "yaml":
-            self.target_highlighter = YAMLHighlighter(self.target_text.document(), theme_manager)
-        elif target_format == "toml":
-            self.target_highlighter = TOMLHighlighter(self.target_text.document(), theme_manager)
-        elif target_format == "xml":
-            self.target_highlighter = XMLHighlighter(self.target_text.document(), theme_manager)
+        self.error_highlighting_enabled = settings_cache.value("editor/showErrorIndicators", True, type=bool)
+
+        self._update_source_highlighter()
+        self._update_target_highlighter()
+
+    def _update_source_highlighter(self):
+        """Attach the highlighter for the selected source format"""
+        self.source_highlighter = self._attach_highlighter(
+            "source", self.source_text, self.source_format.get_selected_format().lower())
+
+    def _update_target_highlighter(self):
+        """Attach the highlighter for the selected target format"""
+        self.target_highlighter = self._attach_highlighter(
+            "target", self.target_text, self.target_format.get_selected_format().lower())
+
+    def _schedule_highlighter_update(self, side):
+        """Update one side's highlighter once the current burst of format changes is handled"""
+        if not self._pending_highlighter_sides:
+            QTimer.singleShot(0, self._flush_highlighter_updates)
+        self._pending_highlighter_sides.add(side)
+
+    def _flush_highlighter_updates(self):
+        """Update the highlighters of the sides whose format changed"""
+        sides, self._pending_highlighter_sides = self._pending_highlighter_sides, set()
+        self.error_highlighting_enabled = settings_cache.value("editor/showErrorIndicators", True, type=bool)
+        if "source" in sides:
+            self._update_source_highlighter()
+        if "target" in sides:
+            self._update_target_highlighter()
+
+    def _attach_highlighter(self, side, text_edit, fmt):
+        """
+        Attach the highlighter for a format to one side's editor, detaching the side's current one.
+        Highlighters are kept per (side, format) and re-attached when the format is selected again.
+        """
+        current = getattr(self, f"{side}_highlighter", None)
+        highlighter = self._highlighter_cache.get((side, fmt))
+        if current is not None and current is not highlighter:
+            current.setDocument(None)
+
+        document = text_edit.document()
+        if highlighter is None:
+            class_name = _HIGHLIGHTER_CLASSES.get(fmt)
+            if class_name is None:
+                return None
+
+            # Highlighter modules are imported on first access
+            highlighter_class = getattr(syntax, class_name)
+            if fmt == "ftml":
+                highlighter = highlighter_class(
+                    document,
+                    theme_manager,
+                    error_highlighting=self.error_highlighting_enabled  # Apply global setting
+                )
+                logger.debug(
+                    f"Created FTML highlighter for {side} with error highlighting={self.error_highlighting_enabled}")
+            else:
+                highlighter = highlighter_class(document, theme_manager)
+            self._highlighter_cache[(side, fmt)] = highlighter
+        elif highlighter.document() is not document:
+            # Re-attaching re-highlights the document; the FTML highlighter also
+            # needs to re-parse whatever changed while it was detached
+            highlighter.setDocument(document)
+            if fmt == "ftml":
+                highlighter.parse_document()
+
+        if fmt == "ftml":
+            highlighter.set_error_highlighting(self.error_highlighting_enabled)
+        return highlighter
 
     def recreate_highlighters(self):
         """Recreate the highlighters to apply new theme colors"""
-        # Store current content
-        source_content = self.source_text.toPlainText()
-        target_content = self.target_text.toPlainText()
-
         # Get the current global error indicators setting
-        app_settings = QSettings("FTMLStudio", "AppSettings")
-        self.error_highlighting_enabled = app_settings.value("editor/showErrorIndicators", True, type=bool)
+        self.error_highlighting_enabled = settings_cache.value("editor/showErrorIndicators", True, type=bool)
         logger.debug(f"Recreating highlighters with error highlighting={self.error_highlighting_enabled}")
 
-        # Re-apply syntax highlighting based on selected formats
-        self.update_syntax_highlighting()
+        # Drop the cached highlighters, their formats use the old theme colors
+        for highlighter in self._highlighter_cache.values():
+            highlighter.setDocument(None)
+            highlighter.deleteLater()
+        self._highlighter_cache.clear()
+        self.source_highlighter = None
+        self.target_highlighter = None
 
-        # Restore content
-        self.source_text.setPlainText(source_content)
-        self.target_text.setPlainText(target_content)
+        # Re-apply syntax highlighting based on selected formats; attaching a
+        # highlighter re-highlights the text, so the content is left as it is
+        self.update_syntax_highlighting()
 
     def save_state(self):
         """Save splitter state"""
@@ -439,6 +484,11 @@ class ConverterWidget(QWidget):
         """Convert from source format to target format"""
         source_fmt = self.source_format.get_selected_format()
         target_fmt = self.target_format.get_selected_format()
+        # Converting a partly loaded file would show (and cache) a result for truncated text
+        if self._loading_file is not None:
+            self.status_label.setText("⚠️ Warning: Wait for the file to finish loading")
+            return
+
         source_content = self.source_text.toPlainText()
 
         # Update status label
@@ -451,59 +501,167 @@ class ConverterWidget(QWidget):
 
         try:
             converter = get_converter(source_fmt, target_fmt)
-            result = converter.convert(source_content)
-
-            # Temporarily remove highlighter to avoid parsing errors during text change
-            if hasattr(self, 'target_highlighter'):
-                self.target_highlighter.setDocument(None)
-
-            # Set the text content
-            self.target_text.setPlainText(result)
-
-            # Reapply highlighting with correct format
-            self.update_syntax_highlighting()
+        except Exception as e:
+            logger.error(f"Conversion error: {str(e)}", exc_info=True)
+            self._show_conversion_error(str(e))
+            return
 
-            # If target is FTML, validate it
-            if target_fmt.lower() == "ftml":
-                is_valid, error_msg = self.validate_ftml(result)
-                if not is_valid:
-                    self.status_label.setText("❌ Conversion failed: Invalid FTML")
-                    logger.warning(f"FTML validation failed: {error_msg}")
-                    QMessageBox.warning(self, "Validation Error",
-                                        f"The conversion completed but produced invalid FTML:\n\n{error_msg}")
-                    return
+        self._convert_request_id += 1
 
-            success_msg = f"✅ Successfully converted from {source_fmt} to {target_fmt}"
-            self.status_label.setText(success_msg)
-            logger.info(f"Conversion from {source_fmt} to {target_fmt} successful")
+        # Converting the same content again gives the same result, so show the stored one
+        digest = hashlib.blake2b(source_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        cache_key = (source_fmt, target_fmt, digest)
+        cached = self._convert_cache.get(cache_key)
+        if cached is not None:
+            self._convert_cache.move_to_end(cache_key)
+            result, validation = cached
+            self._on_converted(source_fmt, target_fmt, cache_key, self._convert_request_id, result, validation)
+            return
 
-        except Exception as e:
-            error_msg = f"❌ Conversion failed: {str(e)}"
-            self.status_label.setText(error_msg)
-            self.target_text.setPlainText(f"Error: {str(e)}")
-            logger.error(f"Conversion error: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, "Conversion Error", str(e))
+        # Convert (and validate FTML output) off the UI thread so large inputs don't freeze it
+        validate = self.validate_ftml if target_fmt.lower() == "ftml" else None
+        task = ConvertTask(self._convert_request_id, converter, source_content, validate)
+        task.signals.finished.connect(
+            functools.partial(self._on_converted, source_fmt, target_fmt, cache_key))
+        task.signals.failed.connect(self._on_convert_failed)
+        task.setAutoDelete(False)  # Owned by _convert_tasks until it reports back
+        self._convert_tasks.add(task)
+        self.convert_btn.setEnabled(False)  # Until this conversion reports back
+        QThreadPool.globalInstance().start(task)
+
+    def _finish_convert_task(self, request_id):
+        """Drop a finished conversion task and report whether its result is still wanted"""
+        self._convert_tasks = {task for task in self._convert_tasks if task.request_id != request_id}
+        if request_id != self._convert_request_id:
+            return False
+        self._update_convert_button()
+        return True
+
+    def _update_convert_button(self):
+        """Enable Convert unless a file is loading or the latest conversion is still running"""
+        converting = any(task.request_id == self._convert_request_id for task in self._convert_tasks)
+        self.convert_btn.setEnabled(self._loading_file is None and not converting)
+
+    def _on_converted(self, source_fmt, target_fmt, cache_key, request_id, result, validation):
+        """Show the result of a background conversion"""
+        if not self._finish_convert_task(request_id):
+            return  # A newer conversion was started since
+
+        self._convert_cache[cache_key] = (result, validation)
+        if len(self._convert_cache) > self.CONVERT_CACHE_SIZE:
+            self._convert_cache.popitem(last=False)
+
+        # Temporarily remove highlighter to avoid parsing errors during text change
+        target_highlighter = getattr(self, 'target_highlighter', None)
+        if target_highlighter is not None:
+            target_highlighter.setDocument(None)
+
+        # Set the text content
+        self.target_text.setPlainText(result)
+
+        # Re-attach the highlighter on the next event loop turn, so the text is
+        # shown before the whole result is highlighted
+        if target_highlighter is not None:
+            QTimer.singleShot(0, functools.partial(self._reattach_target_highlighter, target_highlighter))
+
+        # If target is FTML, it was validated with the conversion
+        if validation is not None:
+            is_valid, error_msg = validation
+            if not is_valid:
+                self.status_label.setText("❌ Conversion failed: Invalid FTML")
+                logger.warning(f"FTML validation failed: {error_msg}")
+                QMessageBox.warning(self, "Validation Error",
+                                    f"The conversion completed but produced invalid FTML:\n\n{error_msg}")
+                return
+
+        success_msg = f"✅ Successfully converted from {source_fmt} to {target_fmt}"
+        self.status_label.setText(success_msg)
+        logger.info(f"Conversion from {source_fmt} to {target_fmt} successful")
+
+    def _on_convert_failed(self, request_id, message):
+        """Report a background conversion that raised"""
+        if self._finish_convert_task(request_id):
+            self._show_conversion_error(message)
+
+    def _show_conversion_error(self, message):
+        """Show a conversion error in the status label, the target pane and a dialog"""
+        self.status_label.setText(f"❌ Conversion failed: {message}")
+        self.target_text.setPlainText(f"Error: {message}")
+        QMessageBox.critical(self, "Conversion Error", message)
+
+    def _reattach_target_highlighter(self, highlighter):
+        """Re-attach the target highlighter detached by convert, unless it was replaced since"""
+        if highlighter is self.target_highlighter and highlighter.document() is None:
+            highlighter.setDocument(self.target_text.document())
 
     def load_file(self):
         """Load content from a file"""
         source_fmt = self.source_format.get_selected_format()
         file_filter = f"{source_fmt.upper()} Files (*.{source_fmt});;All Files (*)"
 
-        logger.debug(f"Opening file dialog for {source_fmt} files")
+        logger.debug("Opening file dialog for %s files", source_fmt)
         file_path, _ = QFileDialog.getOpenFileName(
             self, f"Open {source_fmt.upper()} File", "", file_filter)
 
         if file_path:
-            logger.debug(f"Loading file: {file_path}")
+            logger.debug("Loading file: %s", file_path)
+            self._finish_file_load()  # Abandon any load still in progress
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.source_text.setPlainText(content)
-                self.status_label.setText(f"Loaded file: {file_path}")
-                logger.info(f"Successfully loaded file: {file_path}")
+                # Read bytes in one call and decode once, normalising newlines like text mode
+                with open(file_path, 'rb') as f:
+                    content = f.read().decode('utf-8')
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             except Exception as e:
                 logger.error(f"Error loading file: {str(e)}", exc_info=True)
                 QMessageBox.critical(self, "Error", f"Could not open file: {str(e)}")
+                return
+
+            # Insert the text a chunk at a time so the UI keeps painting on large inputs,
+            # with the highlighter detached so the file is highlighted once at the end.
+            # Undo is off meanwhile so the chunks are not recorded (like setPlainText), and the
+            # source is read-only and Convert disabled until the whole file is in.
+            self.source_text.clear()
+            self.source_text.document().setUndoRedoEnabled(False)
+            self.source_text.setReadOnly(True)
+            if self.source_highlighter is not None:
+                self.source_highlighter.setDocument(None)
+            self._loading_file = (file_path, content, 0, self.source_highlighter)
+            self._update_convert_button()
+            self.status_label.setText(f"Loading file: {file_path}")
+            self._load_next_chunk()
+
+    def _load_next_chunk(self):
+        """Append the next chunk of the file being loaded and schedule the one after"""
+        if self._loading_file is None:
+            return
+        file_path, content, offset, highlighter = self._loading_file
+
+        chunk = content[offset:offset + self.LOAD_CHUNK_SIZE]
+        if not chunk:
+            self._finish_file_load()
+            self.status_label.setText(f"Loaded file: {file_path}")
+            logger.info(f"Successfully loaded file: {file_path}")
+            return
+
+        cursor = QTextCursor(self.source_text.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(chunk)
+        self._loading_file = (file_path, content, offset + len(chunk), highlighter)
+        QTimer.singleShot(0, self._load_next_chunk)
+
+    def _finish_file_load(self):
+        """Stop inserting the file being loaded in chunks, if any, and re-attach the source highlighter"""
+        if self._loading_file is None:
+            return
+        highlighter = self._loading_file[3]
+        self._loading_file = None
+        self.source_text.document().setUndoRedoEnabled(True)
+        self.source_text.setReadOnly(False)
+        self._update_convert_button()
+
+        # Unless the source format changed meanwhile (which attached another highlighter)
+        if highlighter is not None and highlighter is self.source_highlighter and highlighter.document() is None:
+            highlighter.setDocument(self.source_text.document())
 
     def save_result(self):
         """Save conversion result to a file"""
@@ -517,15 +675,14 @@ class ConverterWidget(QWidget):
 
         file_filter = f"{target_fmt.upper()} Files (*.{target_fmt});;All Files (*)"
 
-        logger.debug(f"Opening save dialog for {target_fmt} files")
+        logger.debug("Opening save dialog for %s files", target_fmt)
         file_path, _ = QFileDialog.getSaveFileName(
             self, f"Save {target_fmt.upper()} File", "", file_filter)
 
         if file_path:
-            logger.debug(f"Saving to file: {file_path}")
+            logger.debug("Saving to file: %s", file_path)
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(result_content)
+                save_text_file(file_path, result_content)
                 self.status_label.setText(f"Saved to file: {file_path}")
                 logger.info(f"Successfully saved to file: {file_path}")
                 QMessageBox.information(self, "Success", "File saved successfully")
@@ -1,45 +1,88 @@
 # src/ftml_studio/ui/elements/editor.py
+import functools
 import logging
-import re
 import sys
 import os
+import threading
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
-                               QPushButton, QLabel, QApplication,
-                               QTextEdit, QFileDialog,
-                               QMessageBox, QComboBox, QMainWindow, QStyle)
-from PySide6.QtCore import Qt, QSettings, QSize
-from PySide6.QtGui import QFont, QTextCursor, QColor, QIcon, QAction
-import ftml
-from ftml.exceptions import FTMLParseError
+                               QLabel, QApplication, QToolBar, QToolButton,
+                               QTextEdit, QPlainTextEdit, QFileDialog,
+                               QMessageBox, QComboBox, QMainWindow, QStyle, QProgressBar)
+from PySide6.QtCore import (Qt, QSettings, QSize, QTimer,
+                            QObject, Signal, QRunnable, QThreadPool)
+from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor, QIcon, QAction
 
 from ftml_studio.ui.themes import theme_manager
-from ftml_studio.syntax import FTMLASTHighlighter
+from ftml_studio.ui.fonts import monospace_font
+from ftml_studio.ui.file_io import save_text_file
+from ftml_studio.ui.settings_cache import settings_cache
 from ftml_studio.logger import setup_logger, LOG_LEVELS
 
 # Configure logging
 logger = setup_logger("ftml_studio.editor_window")
 
 
-class ThemedIcon:
-    """Utility class for theme-aware icons"""
+# Icon folders, resolved once at import
+_ICONS_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "icons"))
+_ICONS_DARK = os.path.join(_ICONS_ROOT, "dark")
+_ICONS_LIGHT = os.path.join(_ICONS_ROOT, "light")
 
-    @staticmethod
-    def load(icon_name, parent=None, is_dark_theme=False):
-        """Load an icon from the appropriate theme folder or fallback to system icon"""
-        # Select folder based on theme
-        folder = "light" if is_dark_theme else "dark"
 
-        # Path to the icon file in the theme-specific folder
-        icon_path = os.path.join(os.path.dirname(__file__), f"../icons/{folder}/{icon_name}.png")
+def _list_icon_files(folder):
+    """Return the set of file names in an icon folder (empty if missing)"""
+    try:
+        return frozenset(os.listdir(folder))
+    except OSError:
+        return frozenset()
+
+
+# Available icon files per folder, so lookups need no filesystem probes
+_ICON_FILES = {
+    _ICONS_ROOT: _list_icon_files(_ICONS_ROOT),
+    _ICONS_DARK: _list_icon_files(_ICONS_DARK),
+    _ICONS_LIGHT: _list_icon_files(_ICONS_LIGHT),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_icon_path(icon_name, is_dark_theme):
+    """Resolve the icon file for the given theme, or None if no file exists"""
+    # Select folder based on theme
+    folder = _ICONS_LIGHT if is_dark_theme else _ICONS_DARK
+    file_name = f"{icon_name}.png"
+
+    # Path to the icon file in the theme-specific folder
+    if file_name in _ICON_FILES[folder]:
+        return os.path.join(folder, file_name)
+
+    # Try fallback path if main path doesn't exist
+    if file_name in _ICON_FILES[_ICONS_ROOT]:
+        fallback_path = os.path.join(_ICONS_ROOT, file_name)
+        logger.debug(f"Using fallback icon at: {fallback_path}")
+        return fallback_path
+
+    return None
+
 
-        # Try fallback path if main path doesn't exist
-        if not os.path.exists(icon_path):
-            fallback_path = os.path.join(os.path.dirname(__file__), f"../icons/{icon_name}.png")
-            if os.path.exists(fallback_path):
-                logger.debug(f"Using fallback icon at: {fallback_path}")
-                return QIcon(fallback_path)
+class ThemedIcon:
+    """Utility class for theme-aware icons"""
+
+    # Loaded icons keyed by (icon_name, is_dark_theme)
+    _icon_cache = {}
 
+    @classmethod
+    def load(cls, icon_name, parent=None, is_dark_theme=False):
+        """Load an icon from the appropriate theme folder or fallback to system icon"""
+        key = (icon_name, is_dark_theme)
+        cached = cls._icon_cache.get(key)
+        if cached is not None:
+            return cached
+
+        icon_path = _resolve_icon_path(icon_name, is_dark_theme)
+        if icon_path is not None:
+            icon = QIcon(icon_path)
+        else:
             # If neither path works, use a system icon
             logger.warning(f"Icon not found: {icon_name}, using system fallback")
 
@@ -53,15 +96,92 @@ class ThemedIcon:
 
             # Get appropriate system icon or default to file icon
             icon_type = system_icon_map.get(icon_name, QStyle.SP_FileIcon)
-            return QApplication.style().standardIcon(icon_type)
+            icon = QApplication.style().standardIcon(icon_type)
+
+        cls._icon_cache[key] = icon
+        return icon
 
-        # Return the themed icon if found
-        return QIcon(icon_path)
+    @classmethod
+    def preload(cls, icon_names):
+        """Load the given icons for both themes so later theme switches hit the cache"""
+        for icon_name in icon_names:
+            for is_dark_theme in (False, True):
+                cls.load(icon_name, is_dark_theme=is_dark_theme)
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached icons so the next load re-reads them from disk"""
+        cls._icon_cache.clear()
+        _resolve_icon_path.cache_clear()
+
+
+# Helper class to emit signals (since QRunnable is not a QObject)
+class FileIOSignals(QObject):
+    finished = Signal(str, str)  # file path, file content ("" for writes)
+    failed = Signal(str, str)  # file path, error message
+
+
+class FileReadTask(QRunnable):
+    """Read a file on a QThreadPool worker thread"""
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = FileIOSignals()
+
+    def run(self):
+        try:
+            # Read bytes and decode once, then normalise newlines like text mode would
+            with open(self.file_path, 'rb') as file:
+                content = file.read().decode('utf-8')
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+        else:
+            self.signals.finished.emit(self.file_path, content)
+
+
+class FileWriteTask(QRunnable):
+    """Write text to a file on a QThreadPool worker thread"""
+
+    def __init__(self, file_path, content):
+        super().__init__()
+        self.file_path = file_path
+        self.content = content
+        self.signals = FileIOSignals()
+        self.done = threading.Event()  # Set once the write has finished or failed
+
+    def run(self):
+        try:
+            save_text_file(self.file_path, self.content)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+        else:
+            self.signals.finished.emit(self.file_path, "")
+        finally:
+            self.done.set()
 
 
 class FTMLEditorWidget(QWidget):
     """Widget for the FTML AST Highlighter with theme support"""
 
+    BASE_TITLE = "FTML Studio"
+
+    # Toolbar actions and the icon each one shows
+    _TOOLBAR_ICONS = (
+        ("new_action", "new"),
+        ("open_action", "open"),
+        ("save_action", "save"),
+        ("save_as_action", "save_as"),
+    )
+
+    # Status label styles
+    STATUS_STYLE_ERROR = "color: red;"
+    STATUS_STYLE_VALID = "color: green;"
+    STATUS_STYLE_INFO = "color: gray;"
+    STATUS_STYLE_ACTIVE_ERROR = (
+        "color: red; background-color: rgba(255, 0, 0, 0.1); padding: 2px 5px; border-radius: 3px;")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         logger.debug("Initializing FTML AST Editor")
@@ -73,9 +193,53 @@ class FTMLEditorWidget(QWidget):
         self.current_file = None
         self.is_modified = False
 
+        # Window that shows the file name, and the title last set on it
+        self._titleable_parent = parent if hasattr(parent, 'setWindowTitle') else None
+        self._last_title = None
+
         # Error tracking
         self.current_errors = []
         self.error_line_highlighted = None
+        self._error_line_format = None  # Built on first use, reset on theme change
+        self._error_display_dirty = False  # Errors arrived while the editor was hidden
+
+        # Fingerprint of the errors last shown and the status text they produced
+        self._last_errors_key = None
+        self._last_errors_status = None
+
+        # Text and style last applied to the status label
+        self._status_text = None
+        self._status_style = ""
+
+        # Extra selections waiting to be applied on the next event-loop turn
+        self._pending_selections = None
+        self._flushing_selections = False
+
+        # Files larger than this (in characters) open without syntax highlighting
+        self.big_file_threshold = 500 * 1024
+        self.highlighting_enabled = True
+
+        # File reads/writes running on the thread pool, kept alive until they report back
+        self._io_tasks = set()
+
+        # One write per file at a time: the running task and the latest write queued behind it
+        self._running_writes = {}
+        self._queued_writes = {}
+
+        # Bumped whenever the document is replaced, so late save results for the old one are ignored
+        self._document_generation = 0
+
+        # Background file opens; only the latest request's file is shown
+        self._open_request_id = 0
+
+        # Explicit parses running on the thread pool; only the latest request is applied
+        self._parse_request_id = 0
+        self._parse_tasks = set()
+
+        # Coalesce bursts of keystrokes into a single status refresh
+        self._parse_timer = QTimer(self)
+        self._parse_timer.setSingleShot(True)
+        self._parse_timer.timeout.connect(self._do_parse)
 
         self.setup_ui()
         logger.debug("UI setup complete")
@@ -95,17 +259,19 @@ class FTMLEditorWidget(QWidget):
         editor_layout = QVBoxLayout(editor_container)
         editor_layout.setContentsMargins(10, 5, 10, 5)
 
-        # Editor - using standard QTextEdit
-        self.editor = QTextEdit()
-        self.editor.setAcceptRichText(False)
+        # Editor - plain text only, so use QPlainTextEdit and its per-block layout
+        self.editor = QPlainTextEdit()
+        self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.editor.setObjectName("codeEditor")  # For stylesheet targeting
         self.editor.setPlaceholderText(
             "// Enter your FTML here\n// Example:\n// name = \"My Document\"\n// version = 1.0")
-        font = QFont("Consolas", 11)
-        font.setFixedPitch(True)
+        font = monospace_font(11)
         self.editor.setFont(font)
         logger.debug("Created Editor")
 
+        # Import the highlighter on-demand so the parser loads with the first editor
+        from ftml_studio.syntax import FTMLASTHighlighter
+
         # Apply highlighter with theme support
         self.highlighter = FTMLASTHighlighter(
             self.editor.document(),
@@ -136,6 +302,14 @@ class FTMLEditorWidget(QWidget):
         status_layout.addWidget(self.status_label)
         status_layout.addStretch()
 
+        # Busy indicator shown while a file is read or written in the background
+        self.io_progress = QProgressBar()
+        self.io_progress.setRange(0, 0)  # Indeterminate
+        self.io_progress.setFixedWidth(120)
+        self.io_progress.setTextVisible(False)
+        self.io_progress.hide()
+        status_layout.addWidget(self.io_progress)
+
         # Add containers to main layout
         main_layout.addWidget(editor_container, 1)  # Editor gets all available space
         main_layout.addWidget(status_container)
@@ -149,12 +323,10 @@ class FTMLEditorWidget(QWidget):
     def setup_initial_font(self):
         """Set up the initial font based on settings"""
         # Get settings
-        app_settings = QSettings("FTMLStudio", "AppSettings")
-        font_size = app_settings.value("editor/fontSize", 11, type=int)
+        font_size = settings_cache.value("editor/fontSize", 11, type=int)
 
         # Apply font
-        font = QFont("Consolas", font_size)
-        font.setFixedPitch(True)
+        font = monospace_font(font_size)
         self.editor.setFont(font)
         logger.debug(f"Set initial editor font size to {font_size}")
 
@@ -166,8 +338,7 @@ class FTMLEditorWidget(QWidget):
         cursor_pos = self.editor.textCursor().position()
 
         # Update the font
-        font = QFont("Consolas", size)
-        font.setFixedPitch(True)
+        font = monospace_font(size)
         self.editor.setFont(font)
 
         # Restore cursor position
@@ -179,151 +350,135 @@ class FTMLEditorWidget(QWidget):
         self.editor.update()
 
     def setup_toolbar(self, main_layout):
-        """Set up the horizontal toolbar with file operations buttons"""
-        # Create toolbar layout
-        toolbar_layout = QHBoxLayout()
-        toolbar_layout.setContentsMargins(10, 5, 10, 5)
-        toolbar_layout.setSpacing(10)
-
+        """Set up the horizontal toolbar with file operation actions"""
         # Get current theme
         is_dark = theme_manager.get_active_theme() == theme_manager.DARK
 
-        # Create themed buttons
-        # New button
-        self.new_button = QPushButton()
-        self.new_button.setIcon(ThemedIcon.load("new", self, is_dark))
-        self.new_button.setToolTip("New (Ctrl+N)")
-        self.new_button.setObjectName("toolbarButton")
-        self.new_button.setFixedSize(QSize(32, 32))
-        self.new_button.clicked.connect(self.new_file)
-
-        # Open button
-        self.open_button = QPushButton()
-        self.open_button.setIcon(ThemedIcon.load("open", self, is_dark))
-        self.open_button.setToolTip("Open (Ctrl+O)")
-        self.open_button.setObjectName("toolbarButton")
-        self.open_button.setFixedSize(QSize(32, 32))
-        self.open_button.clicked.connect(self.open_file)
-
-        # Save button
-        self.save_button = QPushButton()
-        self.save_button.setIcon(ThemedIcon.load("save", self, is_dark))
-        self.save_button.setToolTip("Save (Ctrl+S)")
-        self.save_button.setObjectName("toolbarButton")
-        self.save_button.setFixedSize(QSize(32, 32))
-        self.save_button.clicked.connect(self.save_file)
-        # Initially disabled until content is modified
-        self.save_button.setEnabled(False)
-
-        # Save As button
-        self.save_as_button = QPushButton()
-        self.save_as_button.setIcon(ThemedIcon.load("save_as", self, is_dark))
-        self.save_as_button.setToolTip("Save As (Ctrl+Shift+S)")
-        self.save_as_button.setObjectName("toolbarButton")
-        self.save_as_button.setFixedSize(QSize(32, 32))
-        self.save_as_button.clicked.connect(self.save_file_as)
-
-        # Add buttons to toolbar layout
-        toolbar_layout.addWidget(self.new_button)
-        toolbar_layout.addWidget(self.open_button)
-        toolbar_layout.addWidget(self.save_button)
-        toolbar_layout.addWidget(self.save_as_button)
-        toolbar_layout.addStretch(1)  # Push buttons to the left
-
-        # Create a container widget for the toolbar
-        self.toolbar_container = QWidget()
-        self.toolbar_container.setObjectName("toolbarContainer")
-        self.toolbar_container.setLayout(toolbar_layout)
-
-        # Apply stylesheet to the container
-        self.toolbar_container.setStyleSheet(self.get_toolbar_style(is_dark))
-
-        # Add toolbar container to main layout
-        main_layout.addWidget(self.toolbar_container)
+        # Load the toolbar icons for both themes so the first theme switch is free
+        ThemedIcon.preload([icon_name for _, icon_name in self._TOOLBAR_ICONS])
 
-        # Set up keyboard shortcuts
-        # New shortcut
-        self.new_action = QAction("New", self)
+        # Each action carries its icon, tooltip and shortcut, and the toolbar
+        # creates the buttons for it
+        # New action
+        self.new_action = QAction(ThemedIcon.load("new", self, is_dark), "New", self)
         self.new_action.setShortcut("Ctrl+N")
+        self.new_action.setToolTip("New (Ctrl+N)")
         self.new_action.triggered.connect(self.new_file)
-        self.addAction(self.new_action)
 
-        # Open shortcut
-        self.open_action = QAction("Open", self)
+        # Open action
+        self.open_action = QAction(ThemedIcon.load("open", self, is_dark), "Open", self)
         self.open_action.setShortcut("Ctrl+O")
+        self.open_action.setToolTip("Open (Ctrl+O)")
         self.open_action.triggered.connect(self.open_file)
-        self.addAction(self.open_action)
 
-        # Save shortcut
-        self.save_action = QAction("Save", self)
+        # Save action
+        self.save_action = QAction(ThemedIcon.load("save", self, is_dark), "Save", self)
         self.save_action.setShortcut("Ctrl+S")
+        self.save_action.setToolTip("Save (Ctrl+S)")
         self.save_action.triggered.connect(self.save_file)
-        self.addAction(self.save_action)
+        # Initially disabled until content is modified
+        self.save_action.setEnabled(False)
 
-        # Save As shortcut
-        self.save_as_action = QAction("Save As", self)
+        # Save As action
+        self.save_as_action = QAction(ThemedIcon.load("save_as", self, is_dark), "Save As", self)
         self.save_as_action.setShortcut("Ctrl+Shift+S")
+        self.save_as_action.setToolTip("Save As (Ctrl+Shift+S)")
         self.save_as_action.triggered.connect(self.save_file_as)
-        self.addAction(self.save_as_action)
-
-    def get_toolbar_style(self, is_dark):
-        """Get theme-aware toolbar style"""
-        accent_color = theme_manager.accent_color
-
-        if is_dark:
-            return f"""
-                #toolbarContainer {{
-                    border-left: 0px solid #444444;
-                }}
-
-                QPushButton[objectName="toolbarButton"] {{
-                    color: white;
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 4px;
-                    margin: 2px;
-                }}
-
-                QPushButton[objectName="toolbarButton"]:hover {{
-                    background-color: #444444;
-                }}
-
-                QPushButton[objectName="toolbarButton"]:pressed {{
-                    background-color: {accent_color};
-                }}
-
-                QPushButton[objectName="toolbarButton"]:disabled {{
-                    opacity: 0.5;
-                }}
-            """
-        else:
-            return f"""
-                #toolbarContainer {{
-                    border-left: 0px solid #cccccc;
-                }}
-
-                QPushButton[objectName="toolbarButton"] {{
-                    color: #333333;
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 4px;
-                    margin: 2px;
-                }}
-
-                QPushButton[objectName="toolbarButton"]:hover {{
-                    background-color: #e0e0e0;
-                }}
-
-                QPushButton[objectName="toolbarButton"]:pressed {{
-                    background-color: {accent_color};
-                }}
-
-                QPushButton[objectName="toolbarButton"]:disabled {{
-                    opacity: 0.5;
-                }}
-            """
+
+        # Create the toolbar
+        self.toolbar_container = QToolBar()
+        self.toolbar_container.setObjectName("toolbarContainer")
+        self.toolbar_container.setMovable(False)
+        self.toolbar_container.setIconSize(QSize(16, 16))
+        self.toolbar_container.addAction(self.new_action)
+        self.toolbar_container.addAction(self.open_action)
+        self.toolbar_container.addAction(self.save_action)
+        self.toolbar_container.addAction(self.save_as_action)
+
+        # Apply stylesheet to the toolbar
+        self.apply_toolbar_style(is_dark)
+
+        # Add toolbar to main layout
+        main_layout.addWidget(self.toolbar_container)
+
+        # Enable highlighting shortcut (for large files opened without it)
+        self.enable_highlighting_action = QAction("Enable Highlighting", self)
+        self.enable_highlighting_action.setShortcut("F7")
+        self.enable_highlighting_action.triggered.connect(self.enable_highlighting)
+        self.addAction(self.enable_highlighting_action)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def get_toolbar_style(light_accent_color, dark_accent_color):
+        """Get the toolbar style for both themes, selected by the themeDark property"""
+        return f"""
+            #toolbarContainer {{
+                padding: 5px 10px;
+                spacing: 10px;
+            }}
+
+            #toolbarContainer[themeDark="true"] {{
+                border-left: 0px solid #444444;
+            }}
+
+            #toolbarContainer[themeDark="false"] {{
+                border-left: 0px solid #cccccc;
+            }}
+
+            #toolbarContainer QToolButton {{
+                background-color: transparent;
+                border: none;
+                border-radius: 4px;
+                padding: 4px;
+                margin: 2px;
+                min-width: 24px;
+                min-height: 24px;
+            }}
+
+            #toolbarContainer[themeDark="true"] QToolButton {{
+                color: white;
+            }}
+
+            #toolbarContainer[themeDark="false"] QToolButton {{
+                color: #333333;
+            }}
+
+            #toolbarContainer[themeDark="true"] QToolButton:hover {{
+                background-color: #444444;
+            }}
+
+            #toolbarContainer[themeDark="false"] QToolButton:hover {{
+                background-color: #e0e0e0;
+            }}
+
+            #toolbarContainer[themeDark="true"] QToolButton:pressed {{
+                background-color: {dark_accent_color};
+            }}
+
+            #toolbarContainer[themeDark="false"] QToolButton:pressed {{
+                background-color: {light_accent_color};
+            }}
+
+            #toolbarContainer QToolButton:disabled {{
+                opacity: 0.5;
+            }}
+        """
+
+    def apply_toolbar_style(self, is_dark):
+        """Switch the toolbar theme by flipping the themeDark property"""
+        self.toolbar_container.setProperty("themeDark", is_dark)
+
+        style = self.get_toolbar_style(theme_manager.light_accent_color, theme_manager.dark_accent_color)
+        if self.toolbar_container.styleSheet() != style:
+            # Accent colors changed (or first call), install the new stylesheet
+            self.toolbar_container.setStyleSheet(style)
+            return
+
+        # Same stylesheet, so only re-resolve the rules for the new property value
+        container_style = self.toolbar_container.style()
+        for widget in [self.toolbar_container] + self.toolbar_container.findChildren(QToolButton):
+            container_style.unpolish(widget)
+            container_style.polish(widget)
 
     def status_label_clicked(self, event):
         """Handle click on the status label for error navigation"""
@@ -344,58 +499,88 @@ class FTMLEditorWidget(QWidget):
         self.navigate_to_error(line, col)
 
         # Highlight the status label to show it's active
-        self.status_label.setStyleSheet(
-            "color: red; background-color: rgba(255, 0, 0, 0.1); padding: 2px 5px; border-radius: 3px;")
+        self.set_status_style(self.STATUS_STYLE_ACTIVE_ERROR)
 
         # Remember which line we highlighted
         self.error_line_highlighted = line
 
     def navigate_to_error(self, line, col):
         """Navigate to the specified error position and highlight the line"""
-        cursor = QTextCursor(self.editor.document())
-        cursor.movePosition(QTextCursor.Start)
-
-        # Move to the error line
-        for _ in range(line - 1):
-            if not cursor.movePosition(QTextCursor.NextBlock):
-                break
-
-        # Move to the column if possible
-        if col > 1:
-            for _ in range(col - 1):
-                if not cursor.movePosition(QTextCursor.Right):
-                    break
+        cursor = self._error_cursor(line, col)
 
         # Set cursor in the editor
         self.editor.setTextCursor(cursor)
 
-        # Highlight the entire line
-        cursor.movePosition(QTextCursor.StartOfBlock)
-        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        # Reuse the same cursor to select the entire line by its block offsets
+        block = cursor.block()
+        cursor.setPosition(block.position())
+        cursor.setPosition(block.position() + block.length() - 1, QTextCursor.KeepAnchor)
 
         # Create selection format
         selection = QTextEdit.ExtraSelection()
-
-        error_color = QColor(theme_manager.get_syntax_color("error"))
-        highlight_color = QColor(error_color)
-        highlight_color.setAlpha(30)  # Very light background
-
-        selection.format.setBackground(highlight_color)
+        selection.format = self._get_error_line_format()
         selection.cursor = cursor
 
         # Apply the selection
-        self.editor.setExtraSelections([selection])
+        self.set_error_selections([selection])
 
         # Center the error in the view
         self.editor.ensureCursorVisible()
 
+    def _get_error_line_format(self):
+        """Return the format for the highlighted error line, building it once per theme"""
+        if self._error_line_format is None:
+            highlight_color = QColor(theme_manager.get_syntax_color("error"))
+            highlight_color.setAlpha(30)  # Very light background
+
+            self._error_line_format = QTextCharFormat()
+            self._error_line_format.setBackground(highlight_color)
+        return self._error_line_format
+
+    def _error_cursor(self, line, col):
+        """Return a cursor at the 1-based line and column, clamped to the document"""
+        document = self.editor.document()
+
+        # Look the block up by number instead of stepping through every line
+        block = document.findBlockByNumber(max(0, line - 1))
+        if not block.isValid():
+            block = document.lastBlock()
+
+        # Clamp the column to the end of the line (length() includes the separator)
+        offset = min(max(0, col - 1), block.length() - 1)
+
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + offset)
+        return cursor
+
+    def set_error_selections(self, selections):
+        """Queue extra selections so several updates in a row cost a single repaint"""
+        first_request = self._pending_selections is None
+        self._pending_selections = selections
+        if first_request:
+            QTimer.singleShot(0, self._flush_selections)
+
+    def _flush_selections(self):
+        """Apply the most recently queued extra selections"""
+        if self._flushing_selections or self._pending_selections is None:
+            return
+
+        self._flushing_selections = True
+        try:
+            selections = self._pending_selections
+            self._pending_selections = None
+            self.editor.setExtraSelections(selections)
+            self.editor.update()
+        finally:
+            self._flushing_selections = False
+
     def clear_error_highlight(self):
         """Clear any error highlighting"""
-        self.editor.setExtraSelections([])
+        self.set_error_selections([])
         self.error_line_highlighted = None
 
         # Reset status label style but keep it red for error indication
-        self.status_label.setStyleSheet("color: red;")
+        self.set_status_style(self.STATUS_STYLE_ERROR)
 
     def setup_context_menu(self):
         """Set up the context menu for the editor"""
@@ -403,24 +588,47 @@ class FTMLEditorWidget(QWidget):
         self.editor.setContextMenuPolicy(Qt.CustomContextMenu)
         self.editor.customContextMenuRequested.connect(self.show_context_menu)
 
-    def show_context_menu(self, position):
-        """Show the context menu with added file operations"""
-        # Get the standard context menu
-        menu = self.editor.createStandardContextMenu()
+        # The menu is built the first time it is requested
+        self.context_menu = None
+
+    def build_context_menu(self):
+        """Build the context menu once; show_context_menu only refreshes the action states"""
+        self.context_menu = self.editor.createStandardContextMenu()
+        self.context_menu.setParent(self, self.context_menu.windowFlags())
 
         # Add separator
-        menu.addSeparator()
+        self.context_menu.addSeparator()
 
-        # Add file operations
-        save_action = menu.addAction("Save")
-        save_action.triggered.connect(self.save_file)
-        save_action.setEnabled(self.is_modified)
+        # Add file operations (the save action is enabled by set_modified)
+        self.context_menu.addAction(self.save_action)
+        self.context_menu.addAction(self.save_as_action)
 
-        save_as_action = menu.addAction("Save As...")
-        save_as_action.triggered.connect(self.save_file_as)
+    def show_context_menu(self, position):
+        """Show the context menu with added file operations"""
+        if self.context_menu is None:
+            self.build_context_menu()
+
+        # The standard actions only get their enabled state when the menu is
+        # created, so bring them up to date with the editor
+        document = self.editor.document()
+        has_selection = self.editor.textCursor().hasSelection()
+        writable = not self.editor.isReadOnly()
+        enabled_states = {
+            "edit-undo": writable and document.isUndoAvailable(),
+            "edit-redo": writable and document.isRedoAvailable(),
+            "edit-cut": writable and has_selection,
+            "edit-copy": has_selection,
+            "edit-paste": writable and self.editor.canPaste(),
+            "edit-delete": writable and has_selection,
+            "select-all": not document.isEmpty(),
+        }
+        for action in self.context_menu.actions():
+            enabled = enabled_states.get(action.objectName())
+            if enabled is not None:
+                action.setEnabled(enabled)
 
         # Show the menu
-        menu.exec(self.editor.viewport().mapToGlobal(position))
+        self.context_menu.exec(self.editor.viewport().mapToGlobal(position))
 
     def new_file(self):
         """Create a new FTML file"""
@@ -428,13 +636,18 @@ class FTMLEditorWidget(QWidget):
         if self.is_modified and self.check_unsaved_changes():
             return
 
+        # Abandon any open still reading, the new document replaces it
+        self._open_request_id += 1
+        self.editor.setReadOnly(False)
+
         # Clear editor
+        self._document_generation += 1
+        self.set_highlighting_enabled(True)
         self.editor.clear()
         self.current_file = None
-        self.is_modified = False
-        self.update_title()
-        self.status_label.setText("New file created")
-        self.status_label.setStyleSheet("")  # Reset style
+        self.set_modified(False)
+        self.update_title()  # File name changed
+        self.set_status("New file created")
 
         # Clear any error highlights
         self.clear_error_highlight()
@@ -451,67 +664,178 @@ class FTMLEditorWidget(QWidget):
             self, "Open FTML File", "", "FTML Files (*.ftml);;All Files (*)")
 
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                self.editor.setPlainText(content)
-                self.current_file = file_path
-                self.is_modified = False
-                self.update_title()
-                self.status_label.setText(f"Opened {os.path.basename(file_path)}")
-                self.status_label.setStyleSheet("")  # Reset style
-
-                # Clear any error highlights
-                self.clear_error_highlight()
-
-                logger.info(f"Opened file: {file_path}")
-            except Exception as e:
-                logger.error(f"Error opening file: {str(e)}", exc_info=True)
-                QMessageBox.critical(self, "Error", f"Could not open file: {str(e)}")
+            self.set_status(f"Opening {os.path.basename(file_path)}...")
+            self._open_request_id += 1
+            request_id = self._open_request_id
+            generation = self._document_generation
+
+            # The file replaces the editor content, so keep it unchanged until the read reports back
+            self.editor.setReadOnly(True)
+            self._start_io_task(
+                FileReadTask(file_path),
+                lambda path, content: self._on_file_loaded(request_id, generation, path, content),
+                "open", on_done=lambda: self._on_open_done(request_id))
+
+    def _on_open_done(self, request_id):
+        """Make the editor editable again once the latest open has finished or failed"""
+        if request_id == self._open_request_id:
+            self.editor.setReadOnly(False)
+
+    def _on_file_loaded(self, request_id, generation, file_path, content):
+        """Show a file read in the background in the editor"""
+        # Another open, or a new file, was started while this file was being read
+        if request_id != self._open_request_id or generation != self._document_generation:
+            logger.debug(f"Discarding stale open of {file_path}")
+            return
+
+        # Skip highlighting for large files, it can take minutes on multi-MB documents
+        large_file = len(content) > self.big_file_threshold
+        self.set_highlighting_enabled(not large_file)
+
+        self._document_generation += 1
+        self.editor.setPlainText(content)
+        self.current_file = file_path
+        self.set_modified(False)
+        self.update_title()  # File name changed
+        if large_file:
+            self.set_status("Highlighting disabled: large file - press F7 to enable")
+        else:
+            self.set_status(f"Opened {os.path.basename(file_path)}")
+
+        # Clear any error highlights
+        self.clear_error_highlight()
+
+        logger.info(f"Opened file: {file_path}")
 
     def save_file(self):
         """Save the current FTML file"""
         if self.current_file:
-            try:
-                with open(self.current_file, 'w', encoding='utf-8') as file:
-                    file.write(self.editor.toPlainText())
-                self.is_modified = False
-                self.update_title()
-                self.status_label.setText(f"Saved {os.path.basename(self.current_file)}")
-                self.status_label.setStyleSheet("")  # Reset style
-                logger.info(f"Saved file: {self.current_file}")
-                # Update save button state
-                self.save_button.setEnabled(False)
-            except Exception as e:
-                logger.error(f"Error saving file: {str(e)}", exc_info=True)
-                QMessageBox.critical(self, "Error", f"Could not save file: {str(e)}")
+            self._write_file(self.current_file)
         else:
             self.save_file_as()
 
     def save_file_as(self):
         """Save the current FTML file with a new name"""
+        file_path = self._ask_save_path()
+        if file_path:
+            self._write_file(file_path)
+
+    def _ask_save_path(self):
+        """Ask the user where to save, returning None if the dialog was cancelled"""
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save FTML File", "", "FTML Files (*.ftml);;All Files (*)")
 
-        if file_path:
-            # Add .ftml extension if not present and no extension was specified
-            if '.' not in os.path.basename(file_path):
-                file_path += '.ftml'
-
-            try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(self.editor.toPlainText())
-                self.current_file = file_path
-                self.is_modified = False
-                self.update_title()
-                self.status_label.setText(f"Saved {os.path.basename(file_path)}")
-                self.status_label.setStyleSheet("")  # Reset style
-                logger.info(f"Saved file as: {file_path}")
-                # Update save button state
-                self.save_button.setEnabled(False)
-            except Exception as e:
-                logger.error(f"Error saving file: {str(e)}", exc_info=True)
-                QMessageBox.critical(self, "Error", f"Could not save file: {str(e)}")
+        if not file_path:
+            return None
+
+        # Add .ftml extension if not present and no extension was specified
+        if '.' not in os.path.basename(file_path):
+            file_path += '.ftml'
+        return file_path
+
+    def _write_file(self, file_path):
+        """Write the editor content to file_path in the background"""
+        # Remember the document revision so edits made during the write keep the file modified
+        write = (self.editor.toPlainText(), self.editor.document().revision(), self._document_generation)
+
+        # Writes to the same file must land in order, so wait for the running one
+        if file_path in self._running_writes:
+            self._queued_writes[file_path] = write
+            return
+
+        self._start_write(file_path, *write)
+
+    def _start_write(self, file_path, content, revision, generation):
+        """Start a background write of content to file_path"""
+        task = FileWriteTask(file_path, content)
+        self._running_writes[file_path] = task
+        self._start_io_task(task, lambda path, _: self._on_file_saved(path, revision, generation), "save",
+                            on_done=lambda: self._on_write_done(task))
+
+    def _on_write_done(self, task):
+        """Start the write queued behind a finished one, if any"""
+        if self._running_writes.get(task.file_path) is not task:
+            return
+
+        del self._running_writes[task.file_path]
+        write = self._queued_writes.pop(task.file_path, None)
+        if write is not None:
+            self._start_write(task.file_path, *write)
+
+    def _save_now(self):
+        """
+        Save the current document before returning, for callers that replace it next
+        Returns True if the document was saved
+        """
+        file_path = self.current_file or self._ask_save_path()
+        if not file_path:
+            return False
+
+        # Let a background write of this file finish first so it cannot overwrite this one
+        self._queued_writes.pop(file_path, None)
+        task = self._running_writes.get(file_path)
+        if task is not None:
+            if QThreadPool.globalInstance().tryTake(task):
+                # Never started, drop it
+                del self._running_writes[file_path]
+                self._io_tasks.discard(task)
+                self.io_progress.setVisible(bool(self._io_tasks))
+            else:
+                task.done.wait()
+
+        revision = self.editor.document().revision()
+        try:
+            save_text_file(file_path, self.editor.toPlainText())
+        except Exception as e:
+            logger.error(f"Could not save file {file_path}: {e}")
+            QMessageBox.critical(self, "Error", f"Could not save file: {e}")
+            return False
+
+        self._on_file_saved(file_path, revision, self._document_generation)
+        return True
+
+    def _on_file_saved(self, file_path, revision, generation):
+        """Update the file state once a background write has finished"""
+        logger.info(f"Saved file: {file_path}")
+
+        # The document was replaced while saving, the file state belongs to the new one
+        if generation != self._document_generation:
+            return
+
+        self.current_file = file_path
+
+        # If the document changed while saving, it is still modified
+        if revision == self.editor.document().revision():
+            self.set_modified(False)
+        self.update_title()  # File name may have changed
+        self.set_status(f"Saved {os.path.basename(file_path)}")
+
+    def _start_io_task(self, task, on_finished, action, on_done=None):
+        """
+        Run a file task on the global thread pool and show progress until it reports back
+        on_done, if given, runs after the task has either finished or failed
+        """
+        def finish(file_path, content):
+            self._io_tasks.discard(task)
+            self.io_progress.setVisible(bool(self._io_tasks))
+            on_finished(file_path, content)
+            if on_done is not None:
+                on_done()
+
+        def fail(file_path, message):
+            self._io_tasks.discard(task)
+            self.io_progress.setVisible(bool(self._io_tasks))
+            if on_done is not None:
+                on_done()
+            logger.error(f"Could not {action} file {file_path}: {message}")
+            QMessageBox.critical(self, "Error", f"Could not {action} file: {message}")
+
+        task.signals.finished.connect(finish)
+        task.signals.failed.connect(fail)
+        task.setAutoDelete(False)  # Owned by _io_tasks until it reports back
+        self._io_tasks.add(task)
+        self.io_progress.show()
+        QThreadPool.globalInstance().start(task)
 
     def check_unsaved_changes(self):
         """
@@ -529,8 +853,9 @@ class FTMLEditorWidget(QWidget):
         )
 
         if reply == QMessageBox.Save:
-            self.save_file()
-            return False
+            # Save before returning, the caller replaces the document next;
+            # a failed or cancelled save keeps the changes
+            return not self._save_now()
         elif reply == QMessageBox.Cancel:
             return True
         else:  # Discard
@@ -538,53 +863,103 @@ class FTMLEditorWidget(QWidget):
 
     def update_title(self):
         """Update the title to show the current file"""
-        if hasattr(self, 'parent') and self.parent() and hasattr(self.parent(), 'setWindowTitle'):
-            title = "FTML Studio"
-            if self.current_file:
-                filename = os.path.basename(self.current_file)
-                title = f"{filename} - {title}"
-                if self.is_modified:
-                    title = f"*{title}"
-            self.parent().setWindowTitle(title)
+        if self._titleable_parent is None:
+            return
+
+        title = self.BASE_TITLE
+        if self.current_file:
+            filename = os.path.basename(self.current_file)
+            title = f"{filename} - {title}"
+            if self.is_modified:
+                title = f"*{title}"
+
+        # Skip the window manager round trip when nothing changed
+        if title != self._last_title:
+            self._last_title = title
+            self._titleable_parent.setWindowTitle(title)
 
     def update_toolbar_theme(self, is_dark):
         """Update toolbar styling and icons based on theme change"""
         # Update toolbar container styling
         if hasattr(self, 'toolbar_container'):
-            self.toolbar_container.setStyleSheet(self.get_toolbar_style(is_dark))
+            self.apply_toolbar_style(is_dark)
             logger.debug(f"Updated toolbar styling for {'dark' if is_dark else 'light'} theme")
 
         # Update toolbar icons
         self.update_toolbar_icons(is_dark)
 
     def update_toolbar_icons(self, is_dark):
-        """Update toolbar button icons based on theme"""
-        if hasattr(self, 'new_button'):
-            self.new_button.setIcon(ThemedIcon.load("new", self, is_dark))
-
-        if hasattr(self, 'open_button'):
-            self.open_button.setIcon(ThemedIcon.load("open", self, is_dark))
-
-        if hasattr(self, 'save_button'):
-            self.save_button.setIcon(ThemedIcon.load("save", self, is_dark))
-
-        if hasattr(self, 'save_as_button'):
-            self.save_as_button.setIcon(ThemedIcon.load("save_as", self, is_dark))
+        """Update toolbar action icons based on theme"""
+        for attr, icon_name in self._TOOLBAR_ICONS:
+            action = getattr(self, attr, None)
+            if action is not None:
+                action.setIcon(ThemedIcon.load(icon_name, self, is_dark))
 
     def on_text_changed(self):
         """Handle text changes"""
-        # Update status immediately
-        self.update_status()
+        # Restart the timer so the status refreshes once typing pauses
+        self._parse_timer.start(self.highlighter.parse_delay)
+
+        # Results of an explicit parse started before this edit are out of date
+        self._parse_request_id += 1
 
         # Clear error highlight if it exists
         if self.error_line_highlighted is not None:
             self.clear_error_highlight()
 
         # Track modifications
-        if not self.is_modified:
-            self.is_modified = True
-            self.update_title()
-            self.save_button.setEnabled(True)
+        self.set_modified(True)
+
+    def set_modified(self, modified):
+        """Update the modified flag, refreshing the title and save action only when it flips"""
+        if modified == self.is_modified:
+            return
+
+        self.is_modified = modified
+        self.update_title()
+        self.save_action.setEnabled(modified)
+
+    def set_highlighting_enabled(self, enabled):
+        """Attach or detach the syntax highlighter from the editor document"""
+        if enabled == self.highlighting_enabled:
+            return
+
+        self.highlighting_enabled = enabled
+        if enabled:
+            self.highlighter.setDocument(self.editor.document())
+            self.highlighter.parse_timer.start(self.highlighter.parse_delay)
+        else:
+            self.highlighter.setDocument(None)
+        logger.debug(f"Syntax highlighting {'enabled' if enabled else 'disabled'}")
+
+    def enable_highlighting(self):
+        """Re-attach the highlighter after a large file disabled it"""
+        if self.highlighting_enabled:
+            return
+
+        self.set_highlighting_enabled(True)
+        self.set_status("Highlighting enabled")
+
+    def update_error_highlighting(self, enabled):
+        """Turn inline error highlighting on or off"""
+        self.highlighter.set_error_highlighting(enabled)
+
+    def _do_parse(self):
+        """Refresh the status once the editor has been quiet for parse_delay"""
+        self.update_status()
+
+    def set_status(self, text, style=""):
+        """Show a status message, skipping the label update when nothing changed"""
+        if text != self._status_text:
+            self._status_text = text
+            self.status_label.setText(text)
+        self.set_status_style(style)
+
+    def set_status_style(self, style):
+        """Restyle the status label only if the style changed (setStyleSheet re-polishes it)"""
+        if style != self._status_style:
+            self._status_style = style
+            self.status_label.setStyleSheet(style)
 
     def update_error_display(self, errors):
         """Update error message in the status bar based on errors from the highlighter"""
@@ -593,6 +968,21 @@ class FTMLEditorWidget(QWidget):
         # Store current errors for navigation
         self.current_errors = errors
 
+        # Nobody sees the status bar while another page is shown; refresh it in showEvent
+        if not self.isVisible():
+            self._error_display_dirty = True
+            return
+        self._error_display_dirty = False
+
+        # The same errors re-reported while their message is still showing need no work
+        errors_key = tuple(
+            (e.get('line'), e.get('col'), e.get('message'), e.get('token')) for e in errors)
+        if (errors and errors_key == self._last_errors_key
+                and self._status_text == self._last_errors_status
+                and self.error_line_highlighted is None):
+            logger.debug("Errors unchanged, keeping current error display")
+            return
+
         # Clear any existing error highlight
         if self.error_line_highlighted is not None:
             self.clear_error_highlight()
@@ -609,115 +999,99 @@ class FTMLEditorWidget(QWidget):
             if len(errors) > 1:
                 error_text += f" (+{len(errors) - 1} more errors)"
 
-            self.status_label.setText(error_text)
-            self.status_label.setStyleSheet("color: red;")
+            self.set_status(error_text, self.STATUS_STYLE_ERROR)
+            self._last_errors_key = errors_key
+            self._last_errors_status = error_text
         else:
+            self._last_errors_key = None
             # No errors - show success message
             if hasattr(self.highlighter, 'ast') and self.highlighter.ast is not None:
-                self.status_label.setText("✓ Valid FTML")
-                self.status_label.setStyleSheet("color: green;")
+                self.set_status("✓ Valid FTML", self.STATUS_STYLE_VALID)
             else:
-                self.status_label.setText("Document parsed")
-                self.status_label.setStyleSheet("color: gray;")
+                self.set_status("Document parsed", self.STATUS_STYLE_INFO)
+
+    def showEvent(self, event):
+        """Catch up on errors reported while the editor was hidden"""
+        super().showEvent(event)
+        if self._error_display_dirty:
+            self.update_error_display(self.current_errors)
 
     def update_status(self):
         """Update the parse status based on highlighter state"""
         content = self.editor.toPlainText()
 
         if not content:
-            self.status_label.setText("Empty document")
-            self.status_label.setStyleSheet("color: gray;")
+            self.set_status("Empty document", self.STATUS_STYLE_INFO)
             return
 
         # Let the highlighter handle the parsing
         # We'll update the status when we receive the errorsChanged signal
 
     def parse_ftml(self):
-        """Parse the FTML and update the status display"""
+        """Parse the FTML on a worker thread and update the status display when done"""
+        # Share the highlighter's parse task instead of repeating it
+        from ftml_studio.syntax.ast_highlighter import FTMLParseTask
+
         logger.debug("Parsing FTML")
+
+        # Newer requests supersede any parse still running
+        self._parse_request_id += 1
+
         content = self.editor.toPlainText()
         if not content:
-            self.status_label.setText("Empty document")
-            self.status_label.setStyleSheet("color: gray;")
+            self.set_status("Empty document", self.STATUS_STYLE_INFO)
             return
 
-        try:
-            # Parse the FTML
-            logger.debug("Parsing FTML for validation")
-            ftml.load(content)
-            logger.debug("FTML parsed successfully")
-
-            # Set success status
-            self.status_label.setText("✓ Valid FTML")
-            self.status_label.setStyleSheet("color: green;")
-
-            # Clear errors list
-            self.current_errors = []
-
-        except FTMLParseError as e:
-            error_message = str(e)
-            logger.debug(f"FTML parse error in parse_ftml: {error_message}")
-
-            # Extract line and column from error message if available
-            line_match = re.search(r'at line (\d+)', error_message)
-            col_match = re.search(r'col (\d+)', error_message)
-
-            if line_match and col_match:
-                line = int(line_match.group(1))
-                col = int(col_match.group(1))
-                error_text = f"✗ Parsing Error: Line {line}, Column {col} - {error_message}"
-
-                # Create error entry
-                self.current_errors = [{
-                    'line': line,
-                    'col': col,
-                    'message': error_message
-                }]
-            else:
-                error_text = f"✗ Parsing Error: {error_message}"
-                self.current_errors = []
-
-            # Set error status
-            self.status_label.setText(error_text)
-            self.status_label.setStyleSheet("color: red;")
-
-        except Exception as e:
-            logger.debug(f"Other error in parse_ftml: {str(e)}")
+        task = FTMLParseTask(self._parse_request_id, content)
+        task.signals.finished.connect(self._on_ftml_parsed)
+        task.setAutoDelete(False)  # Owned by _parse_tasks until it reports back
+        self._parse_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_ftml_parsed(self, request_id, result):
+        """Show the result of the latest parse_ftml request"""
+        self._parse_tasks = {task for task in self._parse_tasks if task.request_id != request_id}
+        if request_id != self._parse_request_id:
+            logger.debug(f"Discarding stale parse result {request_id}")
+            return
 
-            # Set error status
-            self.status_label.setText(f"✗ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: red;")
+        if result["errors"]:
+            self.update_error_display(result["errors"])
+        else:
+            logger.debug("FTML parsed successfully")
             self.current_errors = []
+            self.set_status("✓ Valid FTML", self.STATUS_STYLE_VALID)
 
     def recreate_highlighter(self):
-        """Recreate the highlighter to apply new theme colors and update UI elements"""
+        """Apply new theme colors to the highlighter and update UI elements"""
+        from ftml_studio.syntax import FTMLASTHighlighter
+
         # Store cursor position
         cursor_pos = self.editor.textCursor().position()
 
         # Check current theme
         is_dark = theme_manager.get_active_theme() == theme_manager.DARK
-        logger.debug(f"Recreating highlighter with theme: {'DARK' if is_dark else 'LIGHT'}")
+        logger.debug(f"Updating highlighter for theme: {'DARK' if is_dark else 'LIGHT'}")
 
-        # Delete and recreate highlighter if it exists
-        if hasattr(self, 'highlighter'):
-            # Disconnect old signals if connected
-            if hasattr(self.highlighter, 'errorsChanged'):
-                try:
-                    self.highlighter.errorsChanged.disconnect(self.update_error_display)
-                except Exception:
-                    pass  # In case not connected
-
-            del self.highlighter
+        # The error line color comes from the theme
+        self._error_line_format = None
+        self._last_errors_key = None
 
-        # Create new highlighter with current theme
-        self.highlighter = FTMLASTHighlighter(
-            self.editor.document(),
-            theme_manager,
-            error_highlighting=True
-        )
-
-        # Reconnect signals
-        self.highlighter.errorsChanged.connect(self.update_error_display)
+        if hasattr(self, 'highlighter'):
+            # Update formats in place so the parsed AST and errors are kept
+            self.highlighter.update_theme(theme_manager)
+        else:
+            # Create new highlighter with current theme
+            self.highlighter = FTMLASTHighlighter(
+                self.editor.document(),
+                theme_manager,
+                error_highlighting=True
+            )
+            self.highlighter.errorsChanged.connect(self.update_error_display)
+
+            # Keep large files unhighlighted until the user asks for it
+            if not self.highlighting_enabled:
+                self.highlighter.setDocument(None)
 
         # Restore cursor position
         cursor = self.editor.textCursor()
@@ -730,7 +1104,7 @@ class FTMLEditorWidget(QWidget):
         # Force update of the editor
         self.editor.update()
 
-        logger.debug("Recreated highlighter with theme support")
+        logger.debug("Updated highlighter with theme support")
 
 
 class FTMLEditorTestWindow(QMainWindow):
@@ -812,9 +1186,8 @@ class FTMLEditorTestWindow(QMainWindow):
         # Update editor's error highlighting
         self.editor_widget.update_error_highlighting(enabled)
 
-        # Save the setting globally
-        app_settings = QSettings("FTMLStudio", "AppSettings")
-        app_settings.setValue("editor/showErrorIndicators", enabled)
+        # Save the setting globally (written out once toggling stops)
+        settings_cache.set("editor/showErrorIndicators", enabled)
 
         # Show status
         self.statusBar().showMessage(f"Error highlighting {'enabled' if enabled else 'disabled'}")
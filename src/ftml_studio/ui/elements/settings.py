@@ -11,6 +11,7 @@ from PySide6.QtCore import Qt, QSettings, Signal
 from PySide6.QtGui import QColor, QFont
 
 from ftml_studio.ui.themes import theme_manager
+from ftml_studio.ui.settings_cache import settings_cache
 from ftml_studio.logger import setup_logger, LOG_LEVELS
 
 # Configure logging
@@ -89,6 +90,34 @@ class SettingsPanel(QWidget):
         # Center the panel
         self.set_alignment(Qt.AlignCenter)
 
+        # Show the stored settings in the controls
+        self.load_current()
+
+    def load_current(self):
+        """Sync the controls with the stored settings without emitting change signals"""
+        controls = [self.theme_combo, self.font_size_spinner, self.show_errors_checkbox]
+        for control in controls:
+            control.blockSignals(True)
+
+        # Set current theme in combo box
+        current_theme = theme_manager.current_theme
+        if current_theme == theme_manager.LIGHT:
+            self.theme_combo.setCurrentIndex(0)
+        elif current_theme == theme_manager.DARK:
+            self.theme_combo.setCurrentIndex(1)
+        else:  # AUTO
+            self.theme_combo.setCurrentIndex(2)
+
+        # Get saved editor settings or use defaults
+        self.font_size_spinner.setValue(self.get_font_size_setting())
+        self.show_errors_checkbox.setChecked(self.get_error_indicators_setting())
+
+        for control in controls:
+            control.blockSignals(False)
+
+        # Set button colors to current accent colors
+        self.update_color_buttons()
+
     def create_appearance_tab(self):
         """Create the appearance settings tab with separate accent colors for each theme"""
         appearance_widget = QWidget()
@@ -107,15 +136,6 @@ class SettingsPanel(QWidget):
         self.theme_combo.addItem("Dark")
         self.theme_combo.addItem("Auto (System)")
 
-        # Set current theme in combo box
-        current_theme = theme_manager.current_theme
-        if current_theme == theme_manager.LIGHT:
-            self.theme_combo.setCurrentIndex(0)
-        elif current_theme == theme_manager.DARK:
-            self.theme_combo.setCurrentIndex(1)
-        else:  # AUTO
-            self.theme_combo.setCurrentIndex(2)
-
         # Connect theme change
         self.theme_combo.currentIndexChanged.connect(self.change_theme)
 
@@ -137,9 +157,6 @@ class SettingsPanel(QWidget):
         self.dark_accent_btn.setToolTip("Select dark theme accent color")
         self.dark_accent_btn.clicked.connect(self.select_dark_accent_color)
 
-        # Set button colors to current accent colors
-        self.update_color_buttons()
-
         # Add to layout
         theme_layout.addWidget(light_accent_label, 1, 0)
         theme_layout.addWidget(self.light_accent_btn, 1, 1)
@@ -170,10 +187,6 @@ class SettingsPanel(QWidget):
         self.font_size_spinner.setRange(8, 24)  # Reasonable range for editor fonts
         self.font_size_spinner.setSingleStep(1)
 
-        # Get saved font size or use default (11)
-        saved_font_size = self.settings.value("editor/fontSize", 11, type=int)
-        self.font_size_spinner.setValue(saved_font_size)
-
         # Connect change signal
         self.font_size_spinner.valueChanged.connect(self.save_font_size)
 
@@ -198,10 +211,6 @@ class SettingsPanel(QWidget):
         # Show error indicators checkbox
         self.show_errors_checkbox = QCheckBox("Show error indicators in all FTML editors")
 
-        # Load the setting
-        show_errors = self.settings.value("editor/showErrorIndicators", True, type=bool)
-        self.show_errors_checkbox.setChecked(show_errors)
-
         # Connect to save setting
         self.show_errors_checkbox.stateChanged.connect(self.save_error_indicators)
 
@@ -227,7 +236,7 @@ class SettingsPanel(QWidget):
         logger.debug(f"Saving font size: {size}")
 
         # Save the setting
-        self.settings.setValue("editor/fontSize", size)
+        settings_cache.set("editor/fontSize", size)
 
         # Emit the specific signal for font size change
         self.fontSizeChanged.emit(size)
@@ -360,7 +369,7 @@ class SettingsPanel(QWidget):
         enabled = bool(state)
 
         # Save the setting
-        self.settings.setValue("editor/showErrorIndicators", enabled)
+        settings_cache.set("editor/showErrorIndicators", enabled)
 
         # Emit signal that settings changed
         self.settingsChanged.emit()
@@ -386,10 +395,11 @@ class SettingsPanel(QWidget):
     def reset_settings(self):
         """Reset all settings to default values"""
         # Store the current settings before clearing
-        old_error_indicator_setting = self.settings.value("editor/showErrorIndicators", True, type=bool)
-        old_font_size = self.settings.value("editor/fontSize", 11, type=int)
+        old_error_indicator_setting = self.get_error_indicators_setting()
+        old_font_size = self.get_font_size_setting()
 
-        # Clear all settings
+        # Clear all settings (writing pending ones first so they are cleared too)
+        settings_cache.flush()
         self.settings.clear()
 
         # Reset theme to default (AUTO)
@@ -441,13 +451,15 @@ class SettingsPanel(QWidget):
                 parent_layout.addWidget(self)
                 parent_layout.addStretch(1)
 
-    def get_error_indicators_setting(self):
+    @staticmethod
+    def get_error_indicators_setting():
         """Utility method to get the current error indicators setting"""
-        return self.settings.value("editor/showErrorIndicators", True, type=bool)
+        return settings_cache.value("editor/showErrorIndicators", True, type=bool)
 
-    def get_font_size_setting(self):
+    @staticmethod
+    def get_font_size_setting():
         """Utility method to get the current font size setting"""
-        return self.settings.value("editor/fontSize", 11, type=int)
+        return settings_cache.value("editor/fontSize", 11, type=int)
 
 
 class SettingsTestWindow(QMainWindow):
@@ -1,12 +1,13 @@
 # src/ftml_studio/ui/elements/sidebar.py
+import functools
 import logging
 import os
 import sys
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                                QPushButton, QFrame, QStyle, QApplication,
                                QMainWindow, QComboBox, QLabel)
-from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, Signal
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, Signal, QObject
+from PySide6.QtGui import QIcon, QPalette, QColor
 
 from ftml_studio.ui.themes import theme_manager
 from ftml_studio.logger import setup_logger, LOG_LEVELS
@@ -14,13 +15,65 @@ from ftml_studio.logger import setup_logger, LOG_LEVELS
 # Configure logging
 logger = setup_logger("ftml_studio.sidebar")
 
+# Hamburger button style sheets (they do not depend on the accent color)
+_HAMBURGER_STYLE_DARK = """
+    QPushButton#hamburgerButton {
+        text-align: left;
+        padding-left: 10px;
+        border: none;
+        border-radius: 0;
+        margin: 0;
+        color: white;
+        background-color: transparent;
+    }
+
+    QPushButton#hamburgerButton:hover {
+        background-color: #444444;
+    }
+"""
+
+_HAMBURGER_STYLE_LIGHT = """
+    QPushButton#hamburgerButton {
+        text-align: left;
+        padding-left: 10px;
+        border: none;
+        border-radius: 0;
+        margin: 0;
+        color: #333333;
+        background-color: transparent;
+    }
+
+    QPushButton#hamburgerButton:hover {
+        background-color: #d0d0d0;
+    }
+"""
+
 
 class ThemedIcon:
     """Utility class for theme-aware icons"""
 
-    @staticmethod
-    def load(icon_name, parent=None, is_dark_theme=False):
+    # Loaded icons keyed by (icon_name, is_dark_theme)
+    _icon_cache = {}
+
+    @classmethod
+    def load(cls, icon_name, parent=None, is_dark_theme=False):
         """Load an icon from the appropriate theme folder or fallback to system icon"""
+        key = (icon_name, is_dark_theme)
+        icon = cls._icon_cache.get(key)
+        if icon is None:
+            icon = cls._icon_cache[key] = cls._load_uncached(icon_name, is_dark_theme)
+        return icon
+
+    @classmethod
+    def preload(cls, icon_names):
+        """Load the given icons for both themes so later theme switches hit the cache"""
+        for icon_name in icon_names:
+            for is_dark_theme in (False, True):
+                cls.load(icon_name, is_dark_theme=is_dark_theme)
+
+    @staticmethod
+    def _load_uncached(icon_name, is_dark_theme):
+        """Load an icon from disk (or the system style) without consulting the cache"""
         # Select folder based on theme
         folder = "light" if is_dark_theme else "dark"
 
@@ -149,6 +202,9 @@ class Sidebar(QWidget):
         self.expanded = False
         self.setObjectName("sidebar")
 
+        # Connection to the running animation's finished signal, if any
+        self._animation_connection = None
+
         # Fixed width when collapsed
         self.collapsed_width = 50
 
@@ -189,6 +245,10 @@ class Sidebar(QWidget):
 
     def setup_ui(self):
         """Setup the sidebar UI components"""
+        # Load every sidebar icon for both themes up front, so hovers and
+        # theme switches never touch the disk
+        ThemedIcon.preload(["menu", "menu_open", "menu_close", "editor", "converter", "settings"])
+
         # Main layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -268,51 +328,29 @@ class Sidebar(QWidget):
         # self.setStyleSheet(self.get_sidebar_style(is_dark))
 
         # Hamburger button styling
-        self.hamburger_btn.setStyleSheet(self.get_hamburger_style(is_dark))
+        hamburger_style = self.get_hamburger_style(is_dark)
+        if self.hamburger_btn.styleSheet() != hamburger_style:
+            self.hamburger_btn.setStyleSheet(hamburger_style)
 
         # Regular buttons styling
+        self.style_buttons(is_dark, accent_color)
+
+    def style_buttons(self, is_dark, accent_color):
+        """Set the sidebar button style, skipping buttons that already have it"""
         button_style = self.get_button_style(is_dark, self.expanded, accent_color)
         for btn in [self.editor_btn, self.converter_btn, self.settings_btn]:
-            btn.setStyleSheet(button_style)
+            # setStyleSheet re-polishes the button even when the sheet is identical
+            if btn.styleSheet() != button_style:
+                btn.setStyleSheet(button_style)
 
     def get_hamburger_style(self, is_dark):
         """Get hamburger button style"""
-        if is_dark:
-            return """
-                QPushButton#hamburgerButton {
-                    text-align: left;
-                    padding-left: 10px;
-                    border: none;
-                    border-radius: 0;
-                    margin: 0;
-                    color: white;
-                    background-color: transparent;
-                }
-
-                QPushButton#hamburgerButton:hover {
-                    background-color: #444444;
-                }
-            """
-        else:
-            return """
-                QPushButton#hamburgerButton {
-                    text-align: left;
-                    padding-left: 10px;
-                    border: none;
-                    border-radius: 0;
-                    margin: 0;
-                    color: #333333;
-                    background-color: transparent;
-                }
-
-                QPushButton#hamburgerButton:hover {
-                    background-color: #d0d0d0;
-                }
-            """
+        return _HAMBURGER_STYLE_DARK if is_dark else _HAMBURGER_STYLE_LIGHT
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def get_button_style(is_dark, is_expanded, accent_color):
-        """Get sidebar button style"""
+        """Get sidebar button style (built once per theme and accent color)"""
         # Use theme-appropriate text colors for both normal and checked states
         checked_text_color = "white" if is_dark else "#333333"
 
@@ -374,9 +412,10 @@ class Sidebar(QWidget):
             logger.debug("Collapsing sidebar - removing button texts")
             for btn in [self.editor_btn, self.converter_btn, self.settings_btn]:
                 btn.setText("")
-                # Apply styling
-                is_dark = theme_manager.get_active_theme() == theme_manager.DARK
-                btn.setStyleSheet(self.get_button_style(is_dark, self.expanded, theme_manager.accent_color))
+
+            # Apply styling
+            is_dark = theme_manager.get_active_theme() == theme_manager.DARK
+            self.style_buttons(is_dark, theme_manager.accent_color)
 
             # Force layout update
             self.layout().invalidate()
@@ -400,10 +439,10 @@ class Sidebar(QWidget):
         # Connect animation finished signal
         if self.expanded:
             logger.debug("Connecting add_button_texts to animation finished")
-            self.animation.finished.connect(self.animation_finished)
+            self._animation_connection = self.animation.finished.connect(self.animation_finished)
         else:
             # For collapse animation, just update hover icon when animation finishes
-            self.animation.finished.connect(self.update_hamburger_hover)
+            self._animation_connection = self.animation.finished.connect(self.update_hamburger_hover)
 
         # Start animation
         self.animation.start()
@@ -417,24 +456,18 @@ class Sidebar(QWidget):
         self.add_button_texts()
 
         # Update hamburger hover icon if it's still being hovered
+        # (this also disconnects the animation signal)
         self.update_hamburger_hover()
 
-        # Disconnect to avoid multiple connections
-        try:
-            self.animation.finished.disconnect(self.animation_finished)
-        except Exception:
-            pass  # Signal might not be connected
-
     def update_hamburger_hover(self):
         """Update hamburger button hover icon based on current sidebar state"""
         # Update the hamburger button's hover icon if it's currently hovered
         self.hamburger_btn.update_hover_icon()
 
-        # Disconnect any animation signal
-        try:
-            self.animation.finished.disconnect()
-        except Exception:
-            pass  # Signal might not be connected
+        # Disconnect the animation signal to avoid multiple connections
+        if self._animation_connection is not None:
+            QObject.disconnect(self._animation_connection)
+            self._animation_connection = None
 
     def add_button_texts(self):
         """Add button texts after expansion animation completes"""
@@ -447,22 +480,15 @@ class Sidebar(QWidget):
             elif btn.icon_name == "settings":
                 btn.setText("Settings")
 
-            # Apply theme-aware styling
-            is_dark = theme_manager.get_active_theme() == theme_manager.DARK
-            btn.setStyleSheet(self.get_button_style(is_dark, self.expanded, theme_manager.accent_color))
+        # Apply theme-aware styling
+        is_dark = theme_manager.get_active_theme() == theme_manager.DARK
+        self.style_buttons(is_dark, theme_manager.accent_color)
 
         # If hamburger button is still being hovered, update its icon
         if self.hamburger_btn.is_hovered:
-            is_dark = theme_manager.get_active_theme() == theme_manager.DARK
             hover_icon = "menu_close" if self.expanded else "menu_open"
             self.hamburger_btn.setIcon(ThemedIcon.load(hover_icon, self, is_dark))
 
-        # Disconnect to avoid multiple connections
-        try:
-            self.animation.finished.disconnect(self.add_button_texts)
-        except Exception:
-            pass  # Signal might not be connected
-
     def update_theme(self):
         """Update styling when theme changes"""
         is_dark = theme_manager.get_active_theme() == theme_manager.DARK
@@ -473,8 +499,7 @@ class Sidebar(QWidget):
 
         # Update border frame color based on theme
         if hasattr(self, 'border_frame'):
-            border_color = "#252525" if is_dark else "#bfbfbf"  # Dark gray for dark theme, light gray for light theme
-            self.border_frame.setStyleSheet(f"background-color: {border_color};")
+            self.set_border_color(is_dark)
 
         # Update button icons
         for btn in [self.editor_btn, self.converter_btn, self.settings_btn, self.hamburger_btn]:
@@ -492,9 +517,8 @@ class Sidebar(QWidget):
         self.border_frame.setFixedWidth(1)
 
         # Set initial color based on current theme
-        is_dark = theme_manager.get_active_theme() == theme_manager.DARK
-        border_color = "#252525" if is_dark else "#bfbfbf"  # Dark gray for dark theme, light gray for light theme
-        self.border_frame.setStyleSheet(f"background-color: {border_color};")
+        self.border_frame.setAutoFillBackground(True)
+        self.set_border_color(theme_manager.get_active_theme() == theme_manager.DARK)
 
         # Position it at the right edge of the sidebar
         self.border_frame.setGeometry(self.width() - 1, 0, 1, self.height())
@@ -505,6 +529,13 @@ class Sidebar(QWidget):
         # Make it visible
         self.border_frame.show()
 
+    def set_border_color(self, is_dark):
+        """Color the border frame through its palette (no style sheet to re-parse)"""
+        border_color = "#252525" if is_dark else "#bfbfbf"  # Dark gray for dark theme, light gray for light theme
+        palette = self.border_frame.palette()
+        palette.setColor(QPalette.Window, QColor(border_color))
+        self.border_frame.setPalette(palette)
+
     def update_border_frame_position(self, event):
         """Update the border frame position when sidebar is resized"""
         if hasattr(self, 'border_frame'):
@@ -0,0 +1,29 @@
+# src/ftml_studio/ui/file_io.py
+import os
+from PySide6.QtCore import QIODevice, QSaveFile
+
+
+def save_text_file(file_path, content):
+    """
+    Write text to a file as UTF-8 with the platform line endings, like text mode would
+
+    The text goes to a temporary file that replaces the target only once it is
+    complete, so a failed save never leaves a truncated file behind.
+    Raises OSError if the file cannot be written.
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+
+    save_file = QSaveFile(file_path)
+    if not save_file.open(QIODevice.WriteOnly):
+        raise OSError(save_file.errorString())
+
+    # Encode once and write the bytes in one call
+    data = content.encode('utf-8')
+    if save_file.write(data) != len(data):
+        error = save_file.errorString()
+        save_file.cancelWriting()
+        raise OSError(error)
+
+    if not save_file.commit():
+        raise OSError(save_file.errorString())
@@ -0,0 +1,12 @@
+# src/ftml_studio/ui/fonts.py
+import functools
+from PySide6.QtGui import QFont
+
+
+@functools.lru_cache(maxsize=None)
+def monospace_font(size):
+    """Return the editor font at the given point size, built once and shared by every editor"""
+    font = QFont("Consolas", size)
+    font.setStyleHint(QFont.Monospace)  # Any monospace family when Consolas is missing
+    font.setFixedPitch(True)
+    return font
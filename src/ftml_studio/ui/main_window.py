@@ -3,7 +3,8 @@ import sys
 import os
 from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout,
                                QWidget, QStackedWidget, QApplication)
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import Qt, QSettings, QRect
+from PySide6.QtGui import QGuiApplication
 
 from ftml_studio.ui.elements.ftml_editor import FTMLEditorWidget
 from ftml_studio.ui.elements.converter import ConverterWidget
@@ -26,6 +27,11 @@ class MainWindow(BaseWindow):
         self.resize(1200, 800)
         self.settings = QSettings("FTMLStudio", "MainWindow")
 
+        # Values last read from or written to the settings, so unchanged ones are not rewritten
+        self._saved_rect = None
+        self._saved_maximized = None
+        self._saved_mode = None
+
         logger.debug("Initializing MainWindow")
 
         # Ensure icons directory exists
@@ -79,8 +85,8 @@ class MainWindow(BaseWindow):
         self.converter_widget = ConverterWidget()
         self.content_widget.addWidget(self.converter_widget)
 
-        # Create settings widget (replacing the old implementation)
-        self.setup_settings_panel()
+        # Settings widget is created the first time settings are shown
+        self.settings_panel = None
 
         # Create status bar for application-wide messages
         self.statusBar().showMessage("Ready")
@@ -174,6 +180,12 @@ class MainWindow(BaseWindow):
         self.previous_mode = self.content_widget.currentIndex()
         logger.debug(f"Storing previous mode: {self.previous_mode}")
 
+        # Build the settings panel once and reuse it afterwards
+        if self.settings_panel is None:
+            self.setup_settings_panel()
+        else:
+            self.settings_panel.load_current()
+
         # Show settings panel
         self.content_widget.setCurrentWidget(self.settings_panel)
         self.statusBar().showMessage("Settings")
@@ -224,61 +236,116 @@ class MainWindow(BaseWindow):
 
     def apply_error_indicators_setting(self):
         """Apply the global error indicators setting to all editor components"""
-        # Get the current setting from settings panel
-        if hasattr(self, 'settings_panel'):
-            enabled = self.settings_panel.get_error_indicators_setting()
-            logger.debug(f"Applying error indicators setting: {enabled}")
-
-            # Apply to editor widget
-            if hasattr(self, 'editor_widget'):
-                if hasattr(self.editor_widget, 'highlighter'):
-                    self.editor_widget.highlighter.error_highlighting = enabled
-                    self.editor_widget.highlighter.rehighlight()
-                    logger.debug(f"Applied error highlighting setting to editor: {enabled}")
-
-                # If editor has a checkbox, update it to match the global setting
-                if hasattr(self.editor_widget, 'show_errors_checkbox'):
-                    self.editor_widget.show_errors_checkbox.setChecked(enabled)
-                    logger.debug(f"Updated editor's checkbox to: {enabled}")
-
-            # Apply to converter widget - for any FTML highlighters it contains
-            if hasattr(self, 'converter_widget'):
-                # Update any FTML highlighters in the converter
-                if hasattr(self.converter_widget, 'source_highlighter') and hasattr(
-                        self.converter_widget.source_highlighter, '__class__'):
-                    if self.converter_widget.source_highlighter.__class__.__name__ == 'FTMLASTHighlighter':
-                        self.converter_widget.source_highlighter.error_highlighting = enabled
-                        self.converter_widget.source_highlighter.rehighlight()
-                        logger.debug(f"Applied error highlighting to converter source editor: {enabled}")
-
-                if hasattr(self.converter_widget, 'target_highlighter') and hasattr(
-                        self.converter_widget.target_highlighter, '__class__'):
-                    if self.converter_widget.target_highlighter.__class__.__name__ == 'FTMLASTHighlighter':
-                        self.converter_widget.target_highlighter.error_highlighting = enabled
-                        self.converter_widget.target_highlighter.rehighlight()
-                        logger.debug(f"Applied error highlighting to converter target editor: {enabled}")
+        # Get the current setting (the settings panel may not exist yet)
+        enabled = SettingsPanel.get_error_indicators_setting()
+        logger.debug(f"Applying error indicators setting: {enabled}")
+
+        # Apply to editor widget
+        if hasattr(self, 'editor_widget'):
+            if hasattr(self.editor_widget, 'highlighter'):
+                self.editor_widget.highlighter.set_error_highlighting(enabled)
+                logger.debug(f"Applied error highlighting setting to editor: {enabled}")
+
+            # If editor has a checkbox, update it to match the global setting
+            if hasattr(self.editor_widget, 'show_errors_checkbox'):
+                self.editor_widget.show_errors_checkbox.setChecked(enabled)
+                logger.debug(f"Updated editor's checkbox to: {enabled}")
+
+        # Apply to converter widget - for any FTML highlighters it contains
+        if hasattr(self, 'converter_widget'):
+            # Update any FTML highlighters in the converter
+            if hasattr(self.converter_widget, 'source_highlighter') and hasattr(
+                    self.converter_widget.source_highlighter, '__class__'):
+                if self.converter_widget.source_highlighter.__class__.__name__ == 'FTMLASTHighlighter':
+                    self.converter_widget.source_highlighter.set_error_highlighting(enabled)
+                    logger.debug(f"Applied error highlighting to converter source editor: {enabled}")
+
+            if hasattr(self.converter_widget, 'target_highlighter') and hasattr(
+                    self.converter_widget.target_highlighter, '__class__'):
+                if self.converter_widget.target_highlighter.__class__.__name__ == 'FTMLASTHighlighter':
+                    self.converter_widget.target_highlighter.set_error_highlighting(enabled)
+                    logger.debug(f"Applied error highlighting to converter target editor: {enabled}")
 
     def save_window_state(self):
         """Save window position, size and state"""
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("windowState", self.saveState())
+        changed = False
+
+        # The window has no toolbars or dock widgets, so its position, size and
+        # maximized flag are all there is to keep (no saveGeometry/saveState blobs)
+        rect = self.normalGeometry() if self.isMaximized() else self.geometry()
+        rect = [rect.x(), rect.y(), rect.width(), rect.height()]
+        if rect != self._saved_rect:
+            self.settings.setValue("windowRect", rect)
+            self._saved_rect = rect
+            changed = True
+
+        maximized = self.isMaximized()
+        if maximized != self._saved_maximized:
+            self.settings.setValue("windowMaximized", maximized)
+            self._saved_maximized = maximized
+            changed = True
 
         # Save current mode (editor or converter)
         current_index = self.content_widget.currentIndex()
-        if current_index < 2:  # Only save if it's editor or converter, not settings
+        # Only save if it's editor or converter, not settings
+        if current_index < 2 and current_index != self._saved_mode:
             self.settings.setValue("mode", current_index)
+            self._saved_mode = current_index
+            changed = True
+
+        # Flush all window settings to storage in one write, and skip it if nothing changed
+        if changed:
+            self.settings.sync()
+
+    @staticmethod
+    def _fit_to_screens(rect):
+        """
+        Move and shrink rect to fit the available area of the screen it overlaps most
+        Returns None if it overlaps no screen
+        """
+        best, best_area = None, 0
+        for screen in QGuiApplication.screens():
+            available = screen.availableGeometry()
+            overlap = rect.intersected(available)
+            area = overlap.width() * overlap.height()
+            if area > best_area:
+                best, best_area = available, area
+
+        if best is None:
+            return None
+
+        width = min(rect.width(), best.width())
+        height = min(rect.height(), best.height())
+        x = min(max(rect.x(), best.x()), best.x() + best.width() - width)
+        y = min(max(rect.y(), best.y()), best.y() + best.height() - height)
+        return QRect(x, y, width, height)
 
     def restore_window_state(self):
         """Restore window position, size and state"""
-        if self.settings.contains("geometry"):
-            self.restoreGeometry(self.settings.value("geometry"))
-
-        if self.settings.contains("windowState"):
-            self.restoreState(self.settings.value("windowState"))
+        if self.settings.contains("windowRect"):
+            try:
+                rect = [int(value) for value in self.settings.value("windowRect")]
+                x, y, width, height = rect
+            except (TypeError, ValueError):
+                logger.warning("Ignoring invalid saved window position")
+            else:
+                self._saved_rect = rect
+                # The screen it was on may be gone (e.g. an unplugged monitor)
+                geometry = self._fit_to_screens(QRect(x, y, width, height))
+                if geometry is not None:
+                    self.setGeometry(geometry)
+                else:
+                    logger.info("Saved window position is off-screen, using the default")
+
+        if self.settings.contains("windowMaximized"):
+            self._saved_maximized = self.settings.value("windowMaximized", False, type=bool)
+            if self._saved_maximized:
+                self.setWindowState(self.windowState() | Qt.WindowMaximized)
 
         # Restore last mode if available
         if self.settings.contains("mode"):
             mode = int(self.settings.value("mode", 0))
+            self._saved_mode = mode
             # Apply mode after UI is set up
             QApplication.instance().processEvents()
             self.switch_mode(mode)
@@ -0,0 +1,73 @@
+# src/ftml_studio/ui/settings_cache.py
+import logging
+from PySide6.QtCore import QCoreApplication, QSettings, QTimer
+
+logger = logging.getLogger("settings_cache")
+
+
+class SettingsCache:
+    """Write-behind cache for application settings that change often (toggles, spinners)"""
+
+    # Delay in milliseconds before pending values are written out
+    FLUSH_DELAY = 500
+
+    # Singleton instance
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SettingsCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self.settings = QSettings("FTMLStudio", "AppSettings")
+        self._pending = {}
+
+        # Created on first write, once a QApplication exists
+        self._flush_timer = None
+
+    def value(self, key, default=None, type=None):
+        """Get a setting, including values that have not been written out yet"""
+        if key in self._pending:
+            return self._pending[key]
+        if type is None:
+            return self.settings.value(key, default)
+        return self.settings.value(key, default, type=type)
+
+    def set(self, key, value):
+        """Store a setting in memory and schedule a single write for the batch"""
+        self._pending[key] = value
+
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self.flush)
+
+            # Make sure nothing pending is lost on exit
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.flush)
+
+        self._flush_timer.start(self.FLUSH_DELAY)
+
+    def flush(self):
+        """Write all pending settings and sync them to storage"""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        logger.debug(f"Flushing {len(self._pending)} pending settings")
+        for key, value in self._pending.items():
+            self.settings.setValue(key, value)
+        self._pending.clear()
+        self.settings.sync()
+
+
+# Create a singleton instance
+settings_cache = SettingsCache()
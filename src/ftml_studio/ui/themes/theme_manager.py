@@ -7,9 +7,10 @@
 
 import logging
 import platform
+from types import MappingProxyType
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
-from PySide6.QtCore import QSettings
+from ftml_studio.ui.settings_cache import settings_cache
 
 logger = logging.getLogger("theme_manager")
 
@@ -23,6 +24,43 @@ class ThemeManager:
     AUTO = "auto"
     THEMES = [LIGHT, DARK, AUTO]
 
+    # Syntax highlighting colors for each theme (the accent color is added per instance)
+    _LIGHT_COLORS = MappingProxyType({
+        "error": "#FF0000",
+        # Syntax highlighting colors
+        "keyword": "#0033b3",
+        "function": "#7a3e9d",
+        "string": "#327334",
+        "number": "#ff8c00",
+        "boolean": "#9900cc",
+        "null": "#9900cc",
+        "comment": "#7c7c7c",
+        "docComment": "#585858",
+        "symbol": "#555555",
+        "operator": "#555555",
+        "editorBg": "#F5F5F5",
+        "lineNumber": "#999999",
+        "selection": "#E3F2FD"
+    })
+
+    _DARK_COLORS = MappingProxyType({
+        "error": "#FF5252",
+        # Syntax highlighting colors
+        "keyword": "#569cd6",
+        "function": "#dcdcaa",
+        "string": "#6aaa64",
+        "number": "#ff8c00",
+        "boolean": "#bb86fc",
+        "null": "#bb86fc",
+        "comment": "#7c7c7c",
+        "docComment": "#bcbcbc",
+        "symbol": "#d4d4d4",
+        "operator": "#a9a9a9",
+        "editorBg": "#1E1E1E",
+        "lineNumber": "#858585",
+        "selection": "#264f78"
+    })
+
     # Singleton instance
     _instance = None
 
@@ -38,12 +76,22 @@ class ThemeManager:
 
         self._initialized = True
         self.current_theme = self.AUTO  # Default theme
-        self.settings = QSettings("FTMLStudio", "AppSettings")
+        self.settings = settings_cache.settings
 
         # Define default accent colors for each theme
         self._light_accent_color = "#327334"  # Material Design Green (darker shade)
         self._dark_accent_color = "#67B16A"   # Material Design Green (lighter shade)
 
+        # Palettes built so far, keyed by (theme, accent color)
+        self._palette_cache = {}
+
+        # Result of the last system theme query (None until first asked)
+        self._system_dark = None
+        self._watching_color_scheme = False
+
+        # Color table of the active theme, resolved on first lookup after a theme change
+        self._active_colors = None
+
         # Load saved settings
         self._load_saved_settings()
 
@@ -53,7 +101,7 @@ class ThemeManager:
     def _load_saved_settings(self):
         """Load all saved settings from QSettings"""
         # Load theme setting
-        saved_theme = self.settings.value("theme", self.AUTO)
+        saved_theme = settings_cache.value("theme", self.AUTO)
         if saved_theme in self.THEMES:
             self.current_theme = saved_theme
 
@@ -65,50 +113,16 @@ class ThemeManager:
             self._dark_accent_color = self.settings.value("appearance/darkAccentColor")
 
     def save_theme(self):
-        """Save the current theme to settings"""
-        self.settings.setValue("theme", self.current_theme)
+        """Save the current theme to settings (written out in a batch shortly after)"""
+        settings_cache.set("theme", self.current_theme)
 
     def _initialize_basic_colors(self):
         """Initialize basic color schemes for syntax highlighting"""
         # Light theme minimal syntax colors
-        self.light_colors = {
-            "accent": self._light_accent_color,
-            "error": "#FF0000",
-            # Syntax highlighting colors
-            "keyword": "#0033b3",
-            "function": "#7a3e9d",
-            "string": "#327334",
-            "number": "#ff8c00",
-            "boolean": "#9900cc",
-            "null": "#9900cc",
-            "comment": "#7c7c7c",
-            "docComment": "#585858",
-            "symbol": "#555555",
-            "operator": "#555555",
-            "editorBg": "#F5F5F5",
-            "lineNumber": "#999999",
-            "selection": "#E3F2FD"
-        }
+        self.light_colors = {"accent": self._light_accent_color, **self._LIGHT_COLORS}
 
         # Dark theme minimal syntax colors
-        self.dark_colors = {
-            "accent": self._dark_accent_color,
-            "error": "#FF5252",
-            # Syntax highlighting colors
-            "keyword": "#569cd6",
-            "function": "#dcdcaa",
-            "string": "#6aaa64",
-            "number": "#ff8c00",
-            "boolean": "#bb86fc",
-            "null": "#bb86fc",
-            "comment": "#7c7c7c",
-            "docComment": "#bcbcbc",
-            "symbol": "#d4d4d4",
-            "operator": "#a9a9a9",
-            "editorBg": "#1E1E1E",
-            "lineNumber": "#858585",
-            "selection": "#264f78"
-        }
+        self.dark_colors = {"accent": self._dark_accent_color, **self._DARK_COLORS}
 
     @property
     def accent_color(self):
@@ -119,15 +133,10 @@ class ThemeManager:
     @accent_color.setter
     def accent_color(self, color_value):
         """Set the accent color for the current active theme"""
-        active_theme = self.get_active_theme()
-        if active_theme == self.DARK:
-            self._dark_accent_color = color_value
-            self.dark_colors["accent"] = color_value
-            self.settings.setValue("appearance/darkAccentColor", color_value)
+        if self.get_active_theme() == self.DARK:
+            self.dark_accent_color = color_value
         else:
-            self._light_accent_color = color_value
-            self.light_colors["accent"] = color_value
-            self.settings.setValue("appearance/lightAccentColor", color_value)
+            self.light_accent_color = color_value
 
     @property
     def light_accent_color(self):
@@ -137,9 +146,11 @@ class ThemeManager:
     @light_accent_color.setter
     def light_accent_color(self, color_value):
         """Set the light theme accent color"""
+        if color_value == self._light_accent_color:
+            return  # Nothing to write
         self._light_accent_color = color_value
         self.light_colors["accent"] = color_value
-        self.settings.setValue("appearance/lightAccentColor", color_value)
+        settings_cache.set("appearance/lightAccentColor", color_value)
 
     @property
     def dark_accent_color(self):
@@ -149,20 +160,27 @@ class ThemeManager:
     @dark_accent_color.setter
     def dark_accent_color(self, color_value):
         """Set the dark theme accent color"""
+        if color_value == self._dark_accent_color:
+            return  # Nothing to write
         self._dark_accent_color = color_value
         self.dark_colors["accent"] = color_value
-        self.settings.setValue("appearance/darkAccentColor", color_value)
+        settings_cache.set("appearance/darkAccentColor", color_value)
 
     def get_color(self, key):
         """Get a basic color for the current theme"""
-        active_theme = self.get_active_theme()
-        colors = self.dark_colors if active_theme == self.DARK else self.light_colors
-
-        if key in colors:
-            return colors[key]
-        else:
+        color = self.get_syntax_colors().get(key)
+        if color is None:
             logger.warning(f"Color '{key}' not found")
             return "#000000"  # Default black
+        return color
+
+    def get_syntax_colors(self):
+        """Get the whole color table for the current theme (read only)"""
+        # Every highlighter format goes through here, so the theme is only resolved
+        # again after set_theme or a system theme change
+        if self._active_colors is None:
+            self._active_colors = self.dark_colors if self.get_active_theme() == self.DARK else self.light_colors
+        return self._active_colors
 
     def get_syntax_color(self, key):
         """Get a syntax highlighting color for the current theme"""
@@ -170,9 +188,22 @@ class ThemeManager:
 
     def _detect_system_theme(self):
         """
-        Detect if the system is using a dark theme
+        Detect if the system is using a dark theme, querying the system only once
         Returns True for dark theme, False for light theme
         """
+        # Every color lookup in AUTO mode lands here, and the query can read the
+        # registry or spawn a process, so keep the answer until the system changes it
+        if self._system_dark is None:
+            self._system_dark = self._query_system_theme()
+        return self._system_dark
+
+    def invalidate_system_theme(self):
+        """Forget the cached system theme so the next lookup queries the system again"""
+        self._system_dark = None
+        self._active_colors = None
+
+    def _query_system_theme(self):
+        """Ask the operating system (or the application palette) whether it is dark"""
         try:
             # Windows-specific detection
             if platform.system() == "Windows":
@@ -212,7 +243,10 @@ class ThemeManager:
     def set_theme(self, theme):
         """Set the current theme and save the preference"""
         if theme in self.THEMES:
+            if theme == self.current_theme:
+                return  # Nothing to write
             self.current_theme = theme
+            self._active_colors = None
             self.save_theme()
             logger.debug(f"Theme set to {theme}")
         else:
@@ -280,20 +314,43 @@ class ThemeManager:
 
         return palette
 
+    def get_palette(self, theme):
+        """Return the palette for a resolved theme, building it once per accent color"""
+        if theme == self.LIGHT:
+            key = (theme, self._light_accent_color)
+            factory = self.create_light_palette
+        else:  # DARK
+            key = (theme, self._dark_accent_color)
+            factory = self.create_dark_palette
+
+        palette = self._palette_cache.get(key)
+        if palette is None:
+            palette = factory()
+            self._palette_cache[key] = palette
+        return palette
+
     def apply_theme(self, app):
         """Apply the current theme to the application"""
-        # Set application style to Windows 11
-        app.setStyle("windows11")
+        # Set application style to Windows 11 (switching styles re-polishes every widget)
+        if app.style().name().lower() != "windows11":
+            app.setStyle("windows11")
+
+        # Re-query the system theme when the platform reports a color scheme change
+        if not self._watching_color_scheme:
+            style_hints = app.styleHints()
+            if hasattr(style_hints, "colorSchemeChanged"):  # Qt 6.5+
+                style_hints.colorSchemeChanged.connect(lambda _: self.invalidate_system_theme())
+            self._watching_color_scheme = True
 
         # Get active theme (resolving AUTO if needed)
         active_theme = self.get_active_theme()
         logger.debug(f"Applying theme: {self.current_theme} (resolved to {active_theme})")
 
-        # Apply appropriate palette
-        if active_theme == self.LIGHT:
-            app.setPalette(self.create_light_palette())
-        else:  # DARK
-            app.setPalette(self.create_dark_palette())
+        # Apply appropriate palette (setPalette re-polishes every widget, so skip it
+        # when the application already uses this exact palette)
+        palette = self.get_palette(active_theme)
+        if app.palette() != palette:
+            app.setPalette(palette)
 
     def reset_colors(self):
         """Reset accent colors to default values"""
@@ -305,5 +362,5 @@ class ThemeManager:
         self.dark_colors["accent"] = self._dark_accent_color
 
         # Save to settings
-        self.settings.setValue("appearance/lightAccentColor", self._light_accent_color)
-        self.settings.setValue("appearance/darkAccentColor", self._dark_accent_color)
+        settings_cache.set("appearance/lightAccentColor", self._light_accent_color)
+        settings_cache.set("appearance/darkAccentColor", self._dark_accent_color)
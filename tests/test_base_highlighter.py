@@ -0,0 +1,83 @@
+# tests/test_base_highlighter.py
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtGui import QGuiApplication, QTextDocument
+
+from src.ftml_studio.syntax.base_highlighter import BaseHighlighter
+from src.ftml_studio.syntax.json_highlighter import JSONHighlighter
+
+
+@pytest.fixture(scope="module", autouse=True)
+def app():
+    """Text layout needs a GUI application"""
+    return QGuiApplication.instance() or QGuiApplication([])
+
+
+class RuleHighlighter(BaseHighlighter):
+    """Highlighter with a few distinctly colored rules, one of them with its own groups"""
+
+    combine_rules = True
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.match_count = 0
+        self.add_rule(r'"[^"]*"', "string")
+        self.add_rule(r'(\w+)\s*(:)', "key")  # Internal groups shift the later rules' groups
+        self.add_rule(r'\d+', "number")
+        self.finalize_rules()
+        self.rehighlight()
+
+    def initialize_formats(self):
+        self._create_format("string", foreground="#00aa00")
+        self._create_format("key", foreground="#0000aa", bold=True)
+        self._create_format("number", foreground="#aa0000")
+
+    def _match_rules(self, text):
+        self.match_count += 1
+        return super()._match_rules(text)
+
+
+def block_formats(document, block_number=0):
+    """(start, length, foreground name) of each format range Qt applied to a block"""
+    layout = document.findBlockByNumber(block_number).layout()
+    return sorted((r.start, r.length, r.format.foreground().color().name()) for r in layout.formats())
+
+
+def test_combined_rules_map_groups_to_formats():
+    """Each match takes the format of its own rule, even after a rule with inner groups"""
+    document = QTextDocument('name: 42 "7"')
+    RuleHighlighter(document)
+
+    assert block_formats(document) == [
+        (0, 5, "#0000aa"),  # name:
+        (6, 2, "#aa0000"),  # 42
+        (9, 3, "#00aa00"),  # "7" - the string rule wins, the digit is not recolored
+    ]
+
+
+def test_unchanged_blocks_replay_until_formats_change():
+    """A rehighlight replays cached blocks, while update_formats matches them again"""
+    document = QTextDocument("a: 1\nb: 2")
+    highlighter = RuleHighlighter(document)
+    highlighter.match_count = 0
+
+    highlighter.rehighlight()
+    assert highlighter.match_count == 0
+    assert block_formats(document, 1) == [(0, 2, "#0000aa"), (3, 1, "#aa0000")]
+
+    highlighter.update_formats()
+    assert highlighter.match_count == 2
+    assert block_formats(document, 1) == [(0, 2, "#0000aa"), (3, 1, "#aa0000")]
+
+
+def test_json_keys_after_comma():
+    """Keys later on a line are keys, not string values"""
+    highlighter = JSONHighlighter(QTextDocument())
+    ranges = {start: format for start, _, format in highlighter._match_rules('{"a": "x", "b": 2}')}
+
+    assert ranges[1] is highlighter.formats["key"]
+    assert ranges[5] is highlighter.formats["string"]  # Matched with the space before it
+    assert ranges[11] is highlighter.formats["key"]